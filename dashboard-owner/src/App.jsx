@@ -216,6 +216,33 @@ function InitialLoadingScreen() {
   );
 }
 
+const ODOO_URL = 'https://103.187.114.7:1314';
+// Read-only token of the live updates of a company, issued with
+// POST /api/owner_dashboard/live_token. Never put an API key here: the
+// value is part of the public bundle.
+const ODOO_LIVE_TOKEN = import.meta.env.VITE_ODOO_LIVE_TOKEN;
+
+// Merge changed transaction rows into the listed ones, newest first
+const mergeTransactions = (current, changed) => {
+  const key = (trx) => `${trx.type}-${trx.id}`;
+  const changedKeys = new Set(changed.map(key));
+  return [...changed, ...(current || []).filter((trx) => !changedKeys.has(key(trx)))]
+    .sort((a, b) => (a.date < b.date ? 1 : -1))
+    .slice(0, 10);
+};
+
+// Add the counter deltas of a live event to the POS summary
+const applyPosDelta = (posSummary, delta) => {
+  const updated = { ...posSummary };
+  Object.entries(delta || {}).forEach(([period, change]) => {
+    const current = updated[period] || {};
+    const transactions = (current.transactions || 0) + change.transactions;
+    const revenue = (current.revenue || 0) + change.revenue;
+    updated[period] = { transactions, revenue, avg_ticket: transactions ? revenue / transactions : 0 };
+  });
+  return updated;
+};
+
 export default function App() {
   const [data, setData] = useState(mockDataFallback);
   const [loading, setLoading] = useState(true);
@@ -223,21 +250,88 @@ export default function App() {
   const [mobileMenuOpen, setMobileMenuOpen] = useState(false);
 
   useEffect(() => {
-    // Fetch from Odoo custom API endpoint
+    // Fetch from Odoo custom API endpoint, then refresh with only the
+    // sections changed since the token of the previous response
+    let token = null;
     const fetchData = async () => {
       try {
-        const response = await axios.get('https://103.187.114.7:1314/api/owner_dashboard/summary');
+        const response = await axios.get(`${ODOO_URL}/api/owner_dashboard/summary`, {
+          params: token ? { since: token } : {},
+        });
         if (response.data && response.data.status === 'success') {
-          // If the structure diverges, we map it, but the python controller provides it cleanly:
-          setData(response.data.data);
+          const changed = response.data.data;
+          if (token) {
+            setData((current) => ({
+              ...current,
+              ...changed,
+              ...(changed.recent_transactions && {
+                recent_transactions: mergeTransactions(current.recent_transactions, changed.recent_transactions),
+              }),
+            }));
+          } else {
+            // If the structure diverges, we map it, but the python controller provides it cleanly:
+            setData(changed);
+          }
+          token = response.data.token || null;
         }
       } catch (err) {
         console.warn("Failed to fetch from Odoo API, using mock data", err);
+        token = null;
       } finally {
         setLoading(false);
       }
     };
     fetchData();
+    const interval = setInterval(fetchData, 60000);
+    return () => clearInterval(interval);
+  }, []);
+
+  useEffect(() => {
+    // Live POS and transaction updates pushed over the Odoo bus. The bus
+    // replays the notifications after the id subscribed from, so subscribe
+    // from the last one received to apply each POS delta only once.
+    let socket = null;
+    let closed = false;
+    let lastId = null;
+    const connect = async () => {
+      try {
+        const response = await axios.get(`${ODOO_URL}/api/owner_dashboard/live`, {
+          headers: { Authorization: `Bearer ${ODOO_LIVE_TOKEN}` },
+        });
+        if (closed || !response.data || response.data.status !== 'success') return;
+        const { channel, event_type: eventType, last, websocket } = response.data.data;
+        if (lastId === null) lastId = last;
+        socket = new WebSocket(`${ODOO_URL.replace(/^http/, 'ws')}${websocket}`);
+        socket.onopen = () => {
+          socket.send(JSON.stringify({ event_name: 'subscribe', data: { channels: [channel], last: lastId } }));
+        };
+        socket.onmessage = (message) => {
+          JSON.parse(message.data)
+            .filter((notification) => notification.id > lastId)
+            .forEach((notification) => {
+              lastId = notification.id;
+              if (notification.message.type !== eventType) return;
+              const { payload } = notification.message;
+              setData((current) => ({
+                ...current,
+                recent_transactions: mergeTransactions(current.recent_transactions, [payload.transaction]),
+                ...(payload.pos_summary && { pos_summary: applyPosDelta(current.pos_summary, payload.pos_summary) }),
+              }));
+            });
+        };
+        socket.onclose = () => {
+          if (!closed) setTimeout(connect, 5000);
+        };
+      } catch (err) {
+        console.warn("Live updates unavailable", err);
+        if (!closed) setTimeout(connect, 60000);
+      }
+    };
+    connect();
+    return () => {
+      closed = true;
+      if (socket) socket.close();
+    };
   }, []);
 
   const renderContent = () => {
@@ -51,6 +51,16 @@
         - Stock (for inventory)
         - Account (for financial data)
 
+        API keys:
+        - /odoo_connect issues a key per client (``client`` header) once,
+          ``?rotate=1`` replaces it. Only a digest of the key is stored.
+        - A key alone authenticates /send_request as its user, with all the
+          user's access rights and without second factor: give each client
+          its own key, and revoke a leaked one from the API tab of the user.
+        - Never ship a key to a browser: dashboards get the live events with
+          a read-only token of one company, issued by POST
+          /api/owner_dashboard/live_token and refused by /send_request.
+
         Note: Dashboard works with whatever modules are installed.
         Missing modules will show zero/empty data for those sections.
     """,
@@ -58,12 +68,14 @@
     'company': 'Cybrosys Techno Solutions',
     'maintainer': 'Cybrosys Techno Solutions',
     'website': "https://www.cybrosys.com",
-    "depends": ['base', 'web', 'account'],
+    "depends": ['base', 'web', 'bus', 'account'],
     "external_dependencies": {
         "python": ["dateutil"],
     },
     "data": [
         'security/ir.model.access.csv',
+        'data/ir_config_parameter_data.xml',
+        'data/ir_cron_data.xml',
         'views/res_users_views.xml',
         'views/connection_api_views.xml'
     ],
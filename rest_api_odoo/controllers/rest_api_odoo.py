@@ -1,59 +1,223 @@
+import base64
+import concurrent.futures
+import csv
+import io
 import json
 import logging
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
 from dateutil.relativedelta import relativedelta
+import pytz
+from werkzeug.http import http_date, quote_etag
 
-from odoo import http
+from odoo import api, http
 from odoo.http import request
+from odoo.tools import DEFAULT_SERVER_DATE_FORMAT, DEFAULT_SERVER_DATETIME_FORMAT, str2bool
+
+from ..tools.aggregate_context import AggregateContext, make_aggregate_key
+from ..tools.api_key_cache import api_key_cache, hash_api_key
+from ..tools.dashboard_cache import DASHBOARD_SECTIONS, dashboard_cache, get_section_models
+from ..tools.dashboard_range import DashboardRange
+from ..tools.data_version import get_data_version, get_model_versions, make_etag, make_version
+from ..tools.live_events import (
+    INVOICE_MOVE_TYPES, LIVE_EVENT_TYPE, POS_PAID_STATES,
+    format_invoice_transaction, format_pos_transaction, get_live_channel)
+from ..tools.metrics import api_metrics, format_server_timing, measure_queries
+from ..tools.parallel_sections import (
+    SECTION_REQUEST_LIMIT, SectionRun, export_snapshot, get_section_executor, snapshot_request)
+from ..tools.response_encoding import (
+    COMPRESSION_MIN_SIZE, compress, compress_stream, dumps, negotiate_encoding)
 
 _logger = logging.getLogger(__name__)
 
+# Builder method of each owner dashboard section
+DASHBOARD_SECTION_BUILDERS = {
+    'kpi': '_get_kpi_data',
+    'finance': '_get_finance_data',
+    'logistics': '_get_logistics_data',
+    'recent_transactions': '_get_recent_transactions',
+    'sales_trend': '_get_sales_trend',
+    'sales_detail': '_get_sales_detail',
+    'finance_detail': '_get_finance_detail',
+    'logistics_detail': '_get_logistics_detail',
+    'pos_summary': '_get_pos_summary',
+}
+
+# Query parameters accepted by the section builders, passed as keyword
+# arguments and part of the cache key. All the builders also receive the
+# ``dashboard_range`` built from the from, to, company_ids and tz parameters.
+DASHBOARD_SECTION_OPTIONS = {
+    'sales_trend': ('months', 'granularity'),
+    'finance_detail': ('periods', 'by_journal'),
+    'sales_detail': ('top',),
+}
+
+# States of the orders counted as sales
+SALE_ORDER_STATES = ['sale', 'done']
+POS_ORDER_STATES = list(POS_PAID_STATES)
+
+# Transactions changed this long before the watermark of a delta token
+# are sent again, covering the ones committed after the token was issued
+DELTA_TRANSACTION_OVERLAP = timedelta(minutes=1)
+
+# Sources of the transaction feed, ranked in this order among the
+# transactions of a same timestamp: model, table, date column indexed,
+# timestamp of the transactions, and condition of the transactions
+TRANSACTION_FEED_SOURCES = [
+    ('account.move', 'account_move', 'invoice_date', 'invoice_date::timestamp',
+     "move_type IN %(move_types)s AND state = 'posted' AND invoice_date IS NOT NULL"),
+    ('pos.order', 'pos_order', 'date_order', 'date_order', "state IN %(pos_states)s"),
+]
+# Relational fields shown in the transactions of each source
+TRANSACTION_FEED_PREFETCH = {
+    'account.move': 'partner_id.name',
+    'pos.order': 'session_id.config_id.name',
+}
+
+# Default and largest page of /api/owner_dashboard/transactions
+TRANSACTION_PAGE_DEFAULT = 20
+TRANSACTION_PAGE_MAX = 200
+
+# Longest trend and cashflow window, in months
+TREND_MAX_MONTHS = 60
+
+# Largest number of products and categories ranked in the sales detail
+SALES_TOP_MAX = 50
+
+# Largest page served by /api/owner_dashboard/low_stock
+LOW_STOCK_PAGE_MAX = 200
+
+# Default and largest page size of the generic GET on /send_request
+GENERIC_PAGE_DEFAULT = 100
+GENERIC_PAGE_MAX = 1000
+
+# Streamed export formats of the generic GET and records read per batch
+STREAM_FORMATS = ('ndjson', 'csv')
+STREAM_BATCH_SIZE = 2000
+
+# Field types the generic GET can be ordered by with keyset pagination
+KEYSET_ORDER_TYPES = ('integer', 'float', 'monetary', 'char', 'selection', 'date', 'datetime')
+
+# Empty data returned for each section when the dashboard cannot be built
+DASHBOARD_FALLBACK_DATA = {
+    "kpi": {"total_revenue": 0, "total_orders": 0, "active_customers": 0, "cash_balance": 0},
+    "finance": {"accounts_receivable": 0, "accounts_payable": 0, "net_profit": 0, "expenses": 0, "assets": 0, "liabilities": 0, "equity": 0},
+    "logistics": {"pending_deliveries": 0, "low_stock_items": 0, "inventory_value": 0},
+    "recent_transactions": [],
+    "sales_trend": [],
+    "sales_detail": {"pos_revenue": 0, "b2b_revenue": 0, "pos_transactions": 0, "b2b_orders": 0, "top_products": [], "revenue_by_unit": []},
+    "finance_detail": {"cashflow": [], "expense_breakdown": [], "income_statement": {}, "balance_sheet": {}},
+    "logistics_detail": {"inventory_by_category": [], "low_stock_alerts": [], "pending_orders": [], "delivery_status": {}},
+    "pos_summary": {"today": {}, "this_week": {}, "this_month": {}},
+}
+
 
 class RestApi(http.Controller):
     """Controller for REST API requests including Owner Dashboard"""
 
     def auth_api_key(self, api_key):
         """Authenticate API key"""
-        user_id = request.env['res.users'].sudo().search([('api_key', '=', api_key)])
-        if api_key is not None and user_id:
-            return True
-        elif not user_id:
-            return '<html><body><h2>Invalid <i>API Key</i>!</h2></body></html>'
-        else:
+        if api_key is None:
             return '<html><body><h2>No <i>API Key</i> Provided!</h2></body></html>'
+        if not self._get_api_key_user_id(api_key):
+            return '<html><body><h2>Invalid <i>API Key</i>!</h2></body></html>'
+        return True
+
+    def _get_request_api_key(self):
+        """Get the API key of the request, from the ``api-key`` header"""
+        return request.httprequest.headers.get('api-key')
+
+    def _get_request_live_token(self):
+        """Get the live token of the request, from a bearer ``Authorization``
+        header as browsers are limited to the CORS safelisted headers"""
+        authorization = request.httprequest.headers.get('Authorization', '')
+        if authorization.startswith('Bearer '):
+            return authorization[len('Bearer '):].strip()
+        return None
+
+    def _get_api_key_user(self):
+        """Get the user owning the API key of the request, None when the
+        key is missing or invalid"""
+        user_id = self._get_api_key_user_id(self._get_request_api_key())
+        return request.env['res.users'].sudo().browse(user_id) if user_id else None
+
+    def _get_api_key_company(self, company_param=None):
+        """Get the company of the API key user, or the one given by
+        ``company_param`` when the user is allowed in it
+
+        :raise PermissionError: when the key is missing or invalid, or the
+            company is not one of the user's companies
+        :raise ValueError: when ``company_param`` is not an integer
+        """
+        user = self._get_api_key_user()
+        if not user:
+            raise PermissionError("A valid API key is required")
+        if not company_param:
+            return user.company_id
+        try:
+            company_id = int(company_param)
+        except ValueError:
+            raise ValueError("company_id must be an integer")
+        if company_id not in user.company_ids.ids:
+            raise PermissionError("Company %s is not allowed for this API key" % company_id)
+        return user.company_ids.filtered(lambda company: company.id == company_id)
+
+    def _get_api_key_user_id(self, api_key):
+        """Get the id of the user owning an API key, looking it up by its
+        indexed digest and remembering verified keys for a short while"""
+        if not api_key:
+            return None
+        dbname = request.env.cr.dbname
+        key_hash = hash_api_key(api_key)
+        user_id = api_key_cache.get(dbname, key_hash)
+        if user_id is None:
+            user_id = request.env['rest.api.key'].sudo()._get_user_id(key_hash)
+            if not user_id:
+                return None
+            try:
+                ttl = int(request.env['ir.config_parameter'].sudo().get_param(
+                    'rest_api_odoo.api_key_cache_ttl', 60))
+            except ValueError:
+                ttl = 60
+            if ttl:
+                api_key_cache.set(dbname, key_hash, user_id, ttl)
+        return user_id
 
     # ==================== OWNER DASHBOARD HELPER METHODS ====================
 
-    def _get_date_ranges(self):
-        """Get common date ranges for queries"""
-        today = datetime.now().date()
-
-        # Start of periods
-        start_of_today = datetime.combine(today, datetime.min.time())
-        start_of_week = today - timedelta(days=today.weekday())
-        start_of_month = today.replace(day=1)
-        start_of_year = today.replace(month=1, day=1)
-
-        # Last 6 months for trends
-        months = []
-        for i in range(5, -1, -1):
-            month_date = today - relativedelta(months=i)
-            months.append({
-                'name': month_date.strftime('%b'),
-                'start': month_date.replace(day=1),
-                'end': (month_date.replace(day=1) + relativedelta(months=1)) - timedelta(days=1)
-            })
-
-        return {
-            'today': today,
-            'start_of_today': start_of_today,
-            'start_of_week': start_of_week,
-            'start_of_month': start_of_month,
-            'start_of_year': start_of_year,
-            'months': months
-        }
-
-    def _get_kpi_data(self):
+    def _get_dashboard_range(self, date_from=None, date_to=None, company_ids=None, tz=None):
+        """Build the range the dashboard is computed for: the days from
+        ``date_from`` (the start of the year of ``date_to`` by default) to
+        ``date_to`` (today by default) in ``tz`` (the dashboard timezone by
+        default), for the given companies (all by default)"""
+        tz = tz or request.env['owner.dashboard.daily.fact'].sudo()._get_fact_timezone()
+        today = datetime.now(pytz.timezone(tz)).date()
+        date_to = date_to or today
+        return DashboardRange(date_from or date_to.replace(month=1, day=1), date_to, today, tz, company_ids)
+
+    def _get_aggregate_context(self):
+        """Get the aggregate memo of the current request"""
+        aggregate_context = getattr(request, '_dashboard_aggregates', None)
+        if aggregate_context is None:
+            aggregate_context = request._dashboard_aggregates = AggregateContext()
+        return aggregate_context
+
+    def _get_aggregate(self, key, compute):
+        """Get an aggregate shared by several sections, computed once per request"""
+        return self._get_aggregate_context().get(key, compute)
+
+    def _get_range_totals(self, dashboard_range, measures):
+        """Sum the given measures of the daily totals over the days of a range"""
+        totals = self._get_daily_totals(
+            dashboard_range.date_from, dashboard_range.date_to, dashboard_range.tz, dashboard_range.company_ids)
+        return self._sum_daily_totals(totals, dashboard_range.date_from, dashboard_range.date_to, measures)
+
+    def _get_balance_domain(self, dashboard_range):
+        """Move line domain of the balances at the end of a range"""
+        return [('date', '<=', dashboard_range.date_to)] + dashboard_range.get_company_domain()
+
+    def _get_kpi_data(self, dashboard_range=None):
         """Fetch KPI data from sale.order, pos.order, and account"""
         kpi = {
             'total_revenue': 0,
@@ -63,62 +227,38 @@ class RestApi(http.Controller):
         }
 
         try:
-            dates = self._get_date_ranges()
-            year_start = dates['start_of_year'].strftime('%Y-%m-%d')
-
-            # Total Revenue from Sale Orders (confirmed/done)
-            SaleOrder = request.env['sale.order'].sudo()
-            sales = SaleOrder.search([
-                ('state', 'in', ['sale', 'done']),
-                ('date_order', '>=', year_start)
-            ])
-            sale_revenue = sum(sales.mapped('amount_total'))
-            sale_count = len(sales)
+            dashboard_range = dashboard_range or self._get_dashboard_range()
+            start, stop = dashboard_range.get_utc_bounds()
 
-            # Total Revenue from POS Orders
-            pos_revenue = 0
-            pos_count = 0
-            try:
-                PosOrder = request.env['pos.order'].sudo()
-                pos_orders = PosOrder.search([
-                    ('state', 'in', ['paid', 'done', 'invoiced']),
-                    ('date_order', '>=', year_start)
-                ])
-                pos_revenue = sum(pos_orders.mapped('amount_total'))
-                pos_count = len(pos_orders)
-            except Exception:
-                _logger.info("POS module not installed, skipping POS data")
-
-            kpi['total_revenue'] = sale_revenue + pos_revenue
-            kpi['total_orders'] = sale_count + pos_count
+            # Total Revenue and Orders from Sale Orders (confirmed/done) and POS Orders
+            totals = self._get_range_totals(
+                dashboard_range, ['sale_revenue', 'sale_orders', 'pos_revenue', 'pos_tickets'])
+            kpi['total_revenue'] = totals['sale_revenue'] + totals['pos_revenue']
+            kpi['total_orders'] = totals['sale_orders'] + totals['pos_tickets']
 
-            # Active Customers (customers with transactions this year)
+            # Active Customers (customers with orders within the range)
             Partner = request.env['res.partner'].sudo()
-            customers = Partner.search_count([
-                ('customer_rank', '>', 0),
-                '|',
-                ('sale_order_ids.date_order', '>=', year_start),
-                ('pos_order_ids.date_order', '>=', year_start)
-            ])
+            order_domain = [
+                ('date_order', '>=', start),
+                ('date_order', '<', stop)
+            ] + dashboard_range.get_company_domain()
+            order_conditions = [
+                (field_name, 'any', order_domain)
+                for field_name in ('sale_order_ids', 'pos_order_ids') if field_name in Partner._fields
+            ]
+            customers = 0
+            if order_conditions:
+                customers = Partner.search_count(
+                    [('customer_rank', '>', 0)] + ['|'] * (len(order_conditions) - 1) + order_conditions)
             # Fallback if the above doesn't work
             if customers == 0:
                 customers = Partner.search_count([('customer_rank', '>', 0)])
             kpi['active_customers'] = customers
 
-            # Cash & Bank Balance from account.account
+            # Cash & Bank Balance from the posted balances per account type
             try:
-                Account = request.env['account.account'].sudo()
-                # Get cash and bank accounts (typically code starts with 1 for assets, 11 for cash/bank)
-                cash_accounts = Account.search([
-                    ('account_type', 'in', ['asset_cash', 'asset_bank'])
-                ])
-                if cash_accounts:
-                    MoveLine = request.env['account.move.line'].sudo()
-                    lines = MoveLine.search([
-                        ('account_id', 'in', cash_accounts.ids),
-                        ('parent_state', '=', 'posted')
-                    ])
-                    kpi['cash_balance'] = sum(lines.mapped('balance'))
+                balances = self._get_account_type_balances(self._get_balance_domain(dashboard_range))
+                kpi['cash_balance'] = balances['asset_cash'] + balances['asset_bank']
             except Exception as e:
                 _logger.warning("Error fetching cash balance: %s", str(e))
 
@@ -127,7 +267,7 @@ class RestApi(http.Controller):
 
         return kpi
 
-    def _get_finance_data(self):
+    def _get_finance_data(self, dashboard_range=None):
         """Fetch finance summary from account.move and account.account"""
         finance = {
             'accounts_receivable': 0,
@@ -140,90 +280,41 @@ class RestApi(http.Controller):
         }
 
         try:
-            MoveLine = request.env['account.move.line'].sudo()
-            Account = request.env['account.account'].sudo()
-
-            # Accounts Receivable
-            ar_accounts = Account.search([('account_type', '=', 'asset_receivable')])
-            if ar_accounts:
-                ar_lines = MoveLine.search([
-                    ('account_id', 'in', ar_accounts.ids),
-                    ('parent_state', '=', 'posted'),
-                    ('reconciled', '=', False)
-                ])
-                finance['accounts_receivable'] = sum(ar_lines.mapped('balance'))
-
-            # Accounts Payable
-            ap_accounts = Account.search([('account_type', '=', 'liability_payable')])
-            if ap_accounts:
-                ap_lines = MoveLine.search([
-                    ('account_id', 'in', ap_accounts.ids),
-                    ('parent_state', '=', 'posted'),
-                    ('reconciled', '=', False)
-                ])
-                finance['accounts_payable'] = abs(sum(ap_lines.mapped('balance')))
-
-            # Calculate Assets, Liabilities, Equity from account balances
-            # Assets (account_type starts with 'asset')
-            asset_accounts = Account.search([('account_type', 'like', 'asset%')])
-            if asset_accounts:
-                asset_lines = MoveLine.search([
-                    ('account_id', 'in', asset_accounts.ids),
-                    ('parent_state', '=', 'posted')
-                ])
-                finance['assets'] = sum(asset_lines.mapped('balance'))
-
-            # Liabilities (account_type starts with 'liability')
-            liability_accounts = Account.search([('account_type', 'like', 'liability%')])
-            if liability_accounts:
-                liability_lines = MoveLine.search([
-                    ('account_id', 'in', liability_accounts.ids),
-                    ('parent_state', '=', 'posted')
-                ])
-                finance['liabilities'] = abs(sum(liability_lines.mapped('balance')))
-
-            # Equity
-            equity_accounts = Account.search([('account_type', '=', 'equity')])
-            if equity_accounts:
-                equity_lines = MoveLine.search([
-                    ('account_id', 'in', equity_accounts.ids),
-                    ('parent_state', '=', 'posted')
-                ])
-                finance['equity'] = abs(sum(equity_lines.mapped('balance')))
-
-            # Revenue & Expenses for this year
-            dates = self._get_date_ranges()
-            year_start = dates['start_of_year'].strftime('%Y-%m-%d')
-
-            # Revenue
-            income_accounts = Account.search([('account_type', 'in', ['income', 'income_other'])])
-            if income_accounts:
-                income_lines = MoveLine.search([
-                    ('account_id', 'in', income_accounts.ids),
-                    ('parent_state', '=', 'posted'),
-                    ('date', '>=', year_start)
-                ])
-                total_revenue = abs(sum(income_lines.mapped('balance')))
-
-            # Expenses
-            expense_accounts = Account.search([('account_type', 'in', ['expense', 'expense_depreciation', 'expense_direct_cost'])])
-            if expense_accounts:
-                expense_lines = MoveLine.search([
-                    ('account_id', 'in', expense_accounts.ids),
-                    ('parent_state', '=', 'posted'),
-                    ('date', '>=', year_start)
-                ])
-                finance['expenses'] = sum(expense_lines.mapped('balance'))
+            dashboard_range = dashboard_range or self._get_dashboard_range()
+            balance_domain = self._get_balance_domain(dashboard_range)
+
+            # Accounts Receivable and Payable, from the open items
+            open_balances = self._get_account_type_balances([('reconciled', '=', False)] + balance_domain)
+            finance['accounts_receivable'] = open_balances['asset_receivable']
+            finance['accounts_payable'] = abs(open_balances['liability_payable'])
+
+            # Assets, Liabilities and Equity, from the posted balances per account type
+            balances = self._get_account_type_balances(balance_domain)
+            finance['assets'] = sum(
+                balance for account_type, balance in balances.items() if account_type.startswith('asset'))
+            finance['liabilities'] = abs(sum(
+                balance for account_type, balance in balances.items() if account_type.startswith('liability')))
+            finance['equity'] = abs(balances['equity'])
+
+            # Revenue & Expenses of the range, from the daily totals
+            totals = self._get_range_totals(
+                dashboard_range, ['income', 'expense', 'expense_depreciation', 'expense_direct_cost'])
+            total_revenue = abs(totals['income'])
+            finance['expenses'] = (
+                totals['expense'] +
+                totals['expense_depreciation'] +
+                totals['expense_direct_cost']
+            )
 
             # Net Profit = Revenue - Expenses (simplified)
-            finance['net_profit'] = total_revenue - finance['expenses'] if 'total_revenue' in dir() else 0
+            finance['net_profit'] = total_revenue - finance['expenses']
 
         except Exception as e:
             _logger.error("Error in _get_finance_data: %s", str(e))
 
         return finance
 
-    def _get_logistics_data(self):
+    def _get_logistics_data(self, dashboard_range=None):
         """Fetch logistics summary from stock and purchase models"""
         logistics = {
             'pending_deliveries': 0,
@@ -232,38 +323,27 @@ class RestApi(http.Controller):
         }
 
         try:
+            dashboard_range = dashboard_range or self._get_dashboard_range()
+
             # Pending Deliveries (Purchase Orders in progress)
             try:
                 PurchaseOrder = request.env['purchase.order'].sudo()
                 pending_po = PurchaseOrder.search_count([
                     ('state', 'in', ['purchase', 'sent'])
-                ])
+                ] + dashboard_range.get_company_domain())
                 logistics['pending_deliveries'] = pending_po
             except Exception:
                 _logger.info("Purchase module not available")
 
             # Inventory Value from stock.quant
             try:
-                StockQuant = request.env['stock.quant'].sudo()
-                quants = StockQuant.search([
-                    ('location_id.usage', '=', 'internal'),
-                    ('quantity', '>', 0)
-                ])
-                logistics['inventory_value'] = sum(q.quantity * q.product_id.standard_price for q in quants)
+                logistics['inventory_value'] = self._get_inventory_valuation(
+                    top=0, company_ids=dashboard_range.company_ids)['total']
 
                 # Low Stock Items (below reorder point)
                 try:
-                    OrderPoint = request.env['stock.warehouse.orderpoint'].sudo()
-                    orderpoints = OrderPoint.search([])
-                    low_stock_count = 0
-                    for op in orderpoints:
-                        product_qty = sum(StockQuant.search([
-                            ('product_id', '=', op.product_id.id),
-                            ('location_id', '=', op.location_id.id)
-                        ]).mapped('quantity'))
-                        if product_qty < op.product_min_qty:
-                            low_stock_count += 1
-                    logistics['low_stock_items'] = low_stock_count
+                    logistics['low_stock_items'] = self._get_low_stock(
+                        limit=0, company_ids=dashboard_range.company_ids)['total']
                 except Exception:
                     _logger.info("Orderpoint not available")
             except Exception:
@@ -274,103 +354,325 @@ class RestApi(http.Controller):
 
         return logistics
 
-    def _get_recent_transactions(self, limit=10):
-        """Fetch recent transactions from invoices and POS orders"""
-        transactions = []
-
-        try:
-            # Get recent invoices
-            AccountMove = request.env['account.move'].sudo()
-            invoices = AccountMove.search([
-                ('move_type', 'in', ['out_invoice', 'in_invoice', 'out_refund', 'in_refund']),
-                ('state', '=', 'posted')
-            ], order='invoice_date desc', limit=limit)
-
-            for inv in invoices:
-                trx_type = ""
-                amount = inv.amount_total_signed
-
-                if inv.move_type == 'out_invoice':
-                    trx_type = f"Penjualan - {inv.partner_id.name or 'Customer'}"
-                elif inv.move_type == 'in_invoice':
-                    trx_type = f"Pembelian - {inv.partner_id.name or 'Vendor'}"
-                    amount = -abs(amount)
-                elif inv.move_type == 'out_refund':
-                    trx_type = f"Retur Penjualan"
-                    amount = -abs(amount)
-                elif inv.move_type == 'in_refund':
-                    trx_type = f"Retur Pembelian"
-
-                transactions.append({
-                    'id': inv.id,
-                    'type': trx_type[:50],
-                    'amount': amount,
-                    'date': inv.invoice_date.strftime('%Y-%m-%d') if inv.invoice_date else '',
-                    'status': 'Completed' if inv.payment_state == 'paid' else 'Pending'
-                })
+    def _get_inventory_valuation(self, top=5, company_ids=None):
+        """Value the internal stock (quantity x cost) per product category in
+        one query, of the given companies (all when None), then roll the
+        values up the category hierarchy.
+
+        :return: dict with the total value and the ``top`` most valued
+            categories, each with its value and number of distinct products
+        """
+        valuation = {'total': 0, 'categories': []}
+        if 'stock.quant' not in request.env:
+            return valuation
+
+        def compute():
+            cost_field = request.env['ir.model.fields']._get('product.product', 'standard_price')
+            cr = request.env.cr
+            cr.execute(f"""
+                SELECT categ.id, categ.parent_path,
+                       SUM(quant.quantity * COALESCE(prop.value_float, default_prop.value_float, 0)),
+                       COUNT(DISTINCT quant.product_id)
+                  FROM stock_quant quant
+                  JOIN stock_location location
+                    ON location.id = quant.location_id
+                   AND location.usage = 'internal'
+                  JOIN product_product product ON product.id = quant.product_id
+                  JOIN product_template template ON template.id = product.product_tmpl_id
+                  JOIN product_category categ ON categ.id = template.categ_id
+             LEFT JOIN ir_property prop
+                    ON prop.fields_id = %s
+                   AND prop.res_id = 'product.product,' || quant.product_id
+                   AND prop.company_id = quant.company_id
+             -- Cost of the products without their own value: the default
+             -- of the company, else the default of all companies
+             LEFT JOIN LATERAL (
+                    SELECT value_float
+                      FROM ir_property
+                     WHERE fields_id = %s
+                       AND res_id IS NULL
+                       AND (company_id = quant.company_id OR company_id IS NULL)
+                  ORDER BY company_id NULLS LAST
+                     LIMIT 1
+                   ) default_prop ON prop.id IS NULL
+                 WHERE quant.quantity > 0
+                       {company_sql}
+              GROUP BY categ.id, categ.parent_path
+            """, (cost_field.id, cost_field.id) + company_params)
+            return cr.fetchall()
+
+        company_sql, company_params = '', ()
+        if company_ids:
+            company_sql, company_params = 'AND quant.company_id IN %s', (tuple(company_ids),)
+        rows = self._get_aggregate(
+            make_aggregate_key('stock.quant', list(company_ids or []), 'value_by_category'), compute)
+
+        # Each product belongs to a single category, so summing the own
+        # figures of a category and its descendants gives child_of totals
+        rolled_up = defaultdict(lambda: [0.0, 0])
+        for categ_id, parent_path, value, items in rows:
+            valuation['total'] += float(value or 0)
+            for ancestor_id in parent_path.strip('/').split('/'):
+                rolled_up[int(ancestor_id)][0] += float(value or 0)
+                rolled_up[int(ancestor_id)][1] += items
+
+        ranked = sorted(
+            ((categ_id, value, items) for categ_id, (value, items) in rolled_up.items() if value > 0),
+            key=lambda category: category[1],
+            reverse=True
+        )[:top]
+        categories = request.env['product.category'].sudo().browse([categ_id for categ_id, value, items in ranked])
+        for category, (categ_id, value, items) in zip(categories, ranked):
+            valuation['categories'].append({
+                'id': category.id,
+                'name': category.name,
+                'value': value,
+                'items': items
+            })
 
-            # Add POS orders if available
-            try:
-                PosOrder = request.env['pos.order'].sudo()
-                pos_orders = PosOrder.search([
-                    ('state', 'in', ['paid', 'done', 'invoiced'])
-                ], order='date_order desc', limit=5)
-
-                for pos in pos_orders:
-                    transactions.append({
-                        'id': pos.id,
-                        'type': f"POS - {pos.session_id.config_id.name or 'Point of Sale'}",
-                        'amount': pos.amount_total,
-                        'date': pos.date_order.strftime('%Y-%m-%d') if pos.date_order else '',
-                        'status': 'Completed'
-                    })
-            except Exception:
-                pass
+        return valuation
+
+    def _get_low_stock(self, limit=5, offset=0, company_ids=None):
+        """Evaluate the reorder points of the given companies (all when None)
+        against their on-hand quantity and return the total count with a
+        page of the ranked alerts, most depleted first. The page and the
+        count are each read in one query, the page with LIMIT and OFFSET."""
+        if 'stock.warehouse.orderpoint' not in request.env:
+            return {'total': 0, 'items': []}
+
+        company_sql, company_params = '', ()
+        if company_ids:
+            company_sql, company_params = 'AND op.company_id IN %s', (tuple(company_ids),)
+        alerts_sql = f"""
+            WITH stock AS (
+                SELECT quant.product_id, quant.location_id, SUM(quant.quantity) AS qty
+                  FROM stock_quant quant
+                  JOIN stock_warehouse_orderpoint op
+                    ON op.product_id = quant.product_id
+                   AND op.location_id = quant.location_id
+                   AND op.active
+              GROUP BY quant.product_id, quant.location_id
+            )
+            SELECT op.id, COALESCE(stock.qty, 0) AS qty, op.product_min_qty
+              FROM stock_warehouse_orderpoint op
+         LEFT JOIN stock
+                ON stock.product_id = op.product_id
+               AND stock.location_id = op.location_id
+             WHERE op.active
+               AND COALESCE(stock.qty, 0) < op.product_min_qty
+                   {company_sql}
+        """
+
+        def compute_total():
+            cr = request.env.cr
+            cr.execute(f"SELECT COUNT(*) FROM ({alerts_sql}) alerts", company_params)
+            return cr.fetchone()[0]
+
+        def compute_page():
+            cr = request.env.cr
+            cr.execute(f"""
+                SELECT id, qty FROM ({alerts_sql}) alerts
+              ORDER BY qty / NULLIF(product_min_qty, 0), id
+                 LIMIT %s OFFSET %s
+            """, company_params + (limit, offset))
+            return cr.fetchall()
+
+        company_key = list(company_ids or [])
+        total = self._get_aggregate(
+            make_aggregate_key('stock.warehouse.orderpoint', company_key, 'low_stock_count'), compute_total)
+        page = []
+        if limit and offset < total:
+            page = self._get_aggregate(
+                make_aggregate_key('stock.warehouse.orderpoint', company_key, 'low_stock:%s:%s' % (limit, offset)),
+                compute_page)
+
+        OrderPoint = request.env['stock.warehouse.orderpoint'].sudo()
+        orderpoints = OrderPoint.browse([op_id for op_id, qty in page])
+        items = []
+        for op, (op_id, current_qty) in zip(orderpoints, page):
+            items.append({
+                'id': op.id,
+                'name': op.product_id.name[:30],
+                'location': op.location_id.display_name,
+                'current_stock': float(current_qty),
+                'min_stock': op.product_min_qty,
+                'unit': op.product_id.uom_id.name if op.product_id.uom_id else 'Unit',
+                'category': op.product_id.categ_id.name[:20] if op.product_id.categ_id else 'Lainnya'
+            })
 
-            # Sort by date and limit
-            transactions = sorted(transactions, key=lambda x: x['date'], reverse=True)[:limit]
+        return {'total': total, 'items': items}
 
+    def _get_recent_transactions(self, limit=10, since=None, dashboard_range=None):
+        """Fetch recent transactions from invoices and POS orders, only the
+        ones changed since a datetime when ``since`` is given"""
+        transactions = []
+        try:
+            transactions = self._get_transaction_page(limit, since=since, dashboard_range=dashboard_range)['items']
         except Exception as e:
             _logger.error("Error in _get_recent_transactions: %s", str(e))
-
         return transactions
 
-    def _get_sales_trend(self):
-        """Get sales trend for the last 6 months"""
+    def _get_transaction_page(self, limit, before=None, since=None, dashboard_range=None):
+        """Read one page of the transaction feed, merging the posted
+        invoices and the paid POS orders newest first, of the companies and
+        up to the end of ``dashboard_range`` when given.
+
+        The feed is ordered by (timestamp, source, id) descending, the
+        timestamp of an invoice being its invoice date. Each source reads
+        at most ``limit + 1`` rows following the ``before`` position from
+        its date index, so that a page costs the same wherever it is.
+        Returns the formatted transactions and the cursor of the next page,
+        None on the last page.
+        """
+        rows = []
+        for source, feed_source in enumerate(TRANSACTION_FEED_SOURCES):
+            if feed_source[0] in request.env:
+                rows += self._get_transaction_rows(source, limit + 1, before, since, dashboard_range)
+        rows.sort(reverse=True)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_transaction_cursor(rows[-1])
+
+        records = {}
+        for source, feed_source in enumerate(TRANSACTION_FEED_SOURCES):
+            ids = [row[2] for row in rows if row[1] == source]
+            if not ids:
+                continue
+            # Read the relational fields shown of the whole page at once
+            page_records = request.env[feed_source[0]].sudo().browse(ids)
+            page_records.mapped(TRANSACTION_FEED_PREFETCH[feed_source[0]])
+            records.update(((source, record.id), record) for record in page_records)
+
+        items = []
+        for _timestamp, source, record_id in rows:
+            record = records[(source, record_id)]
+            if record._name == 'account.move':
+                items.append(format_invoice_transaction(record))
+            else:
+                items.append(format_pos_transaction(record))
+        return {'items': items, 'next_cursor': next_cursor}
+
+    def _get_transaction_rows(self, source, limit, before=None, since=None, dashboard_range=None):
+        """Read the (timestamp, source, id) keys of the newest transactions
+        of one source of the feed following the ``before`` position"""
+        model_name, table, date_column, timestamp, condition = TRANSACTION_FEED_SOURCES[source]
+        request.env[model_name].flush_model()
+        conditions = [condition]
+        params = {
+            'move_types': INVOICE_MOVE_TYPES,
+            'pos_states': POS_PAID_STATES,
+            'source': source,
+            'limit': limit,
+        }
+        if since:
+            conditions.append("write_date >= %(since)s")
+            params['since'] = since
+        if dashboard_range and dashboard_range.company_ids:
+            conditions.append("company_id IN %(company_ids)s")
+            params['company_ids'] = dashboard_range.company_ids
+        if dashboard_range and dashboard_range.date_to < dashboard_range.today:
+            # Invoice dates are local days, POS order dates UTC datetimes
+            conditions.append(f"{date_column} < %(stop)s")
+            params['stop'] = (dashboard_range.date_to + timedelta(days=1) if model_name == 'account.move'
+                              else dashboard_range.get_utc_bounds()[1])
+        if before:
+            # The bound on the date column lets its index start at the position
+            conditions.append(f"{date_column} <= %(before)s AND "
+                              f"({timestamp}, %(source)s, id) < (%(before)s, %(before_source)s, %(before_id)s)")
+            params.update(before=before[0], before_source=before[1], before_id=before[2])
+        request.env.cr.execute(f"""
+            SELECT id, {timestamp} FROM {table}
+             WHERE {' AND '.join(conditions)}
+          ORDER BY {date_column} DESC, id DESC
+             LIMIT %(limit)s
+        """, params)
+        return [(row_timestamp, source, record_id) for record_id, row_timestamp in request.env.cr.fetchall()]
+
+    def _encode_transaction_cursor(self, row):
+        """Build the opaque cursor pointing after a row of the feed"""
+        timestamp, source, record_id = row
+        payload = json.dumps([timestamp.strftime(DEFAULT_SERVER_DATETIME_FORMAT), source, record_id])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_transaction_cursor(self, cursor):
+        """Decode a cursor built by ``_encode_transaction_cursor``"""
+        try:
+            timestamp, source, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.strptime(timestamp, DEFAULT_SERVER_DATETIME_FORMAT), int(source), int(record_id)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+
+    def _get_daily_totals(self, date_from, date_to, tz=None, company_ids=None):
+        """Get pre-aggregated daily sales, POS and ledger figures, of the
+        given companies (all when None)"""
+        return self._get_aggregate(
+            make_aggregate_key('owner.dashboard.daily.fact', [date_from, date_to, tz, company_ids], 'daily_totals'),
+            lambda: request.env['owner.dashboard.daily.fact'].sudo()._get_daily_totals(
+                date_from, date_to, tz, company_ids))
+
+    def _sum_daily_totals(self, totals, date_from, date_to, measures):
+        """Sum the given measures of the daily totals within a date range"""
+        return {
+            measure: sum(values[measure] for day, values in totals.items() if date_from <= day <= date_to)
+            for measure in measures
+        }
+
+    def _get_period_start(self, day, granularity):
+        """Get the first day of the day/week/month period containing a date"""
+        if granularity == 'week':
+            return day - timedelta(days=day.weekday())
+        if granularity == 'month':
+            return day.replace(day=1)
+        return day
+
+    def _get_trend_periods(self, months, granularity, today):
+        """Get the consecutive periods of a trend covering the last months"""
+        step = {
+            'day': relativedelta(days=1),
+            'week': relativedelta(weeks=1),
+            'month': relativedelta(months=1)
+        }[granularity]
+        label_format = {
+            'day': '%d %b',
+            'week': '%d %b',
+            'month': '%b' if months <= 12 else '%b %Y'
+        }[granularity]
+
+        period_start = self._get_period_start(
+            (today - relativedelta(months=months - 1)).replace(day=1), granularity)
+        periods = []
+        while period_start <= today:
+            periods.append({
+                'name': period_start.strftime(label_format),
+                'start': period_start,
+                'end': period_start + step - timedelta(days=1)
+            })
+            period_start += step
+        return periods
+
+    def _get_sales_trend(self, months=6, granularity='month', dashboard_range=None):
+        """Get sales trend for the last months up to the end of the range,
+        bucketed per day, week or month in the timezone of the range"""
         sales_trend = []
 
         try:
-            dates = self._get_date_ranges()
-
-            for month in dates['months']:
-                month_start = month['start'].strftime('%Y-%m-%d')
-                month_end = month['end'].strftime('%Y-%m-%d')
-
-                # Sales Orders
-                SaleOrder = request.env['sale.order'].sudo()
-                sales = SaleOrder.search([
-                    ('state', 'in', ['sale', 'done']),
-                    ('date_order', '>=', month_start),
-                    ('date_order', '<=', month_end)
-                ])
-                sale_total = sum(sales.mapped('amount_total'))
-
-                # POS Orders
-                pos_total = 0
-                try:
-                    PosOrder = request.env['pos.order'].sudo()
-                    pos_orders = PosOrder.search([
-                        ('state', 'in', ['paid', 'done', 'invoiced']),
-                        ('date_order', '>=', month_start),
-                        ('date_order', '<=', month_end)
-                    ])
-                    pos_total = sum(pos_orders.mapped('amount_total'))
-                except Exception:
-                    pass
+            dashboard_range = dashboard_range or self._get_dashboard_range()
+            periods = self._get_trend_periods(months, granularity, dashboard_range.date_to)
+            totals = self._get_daily_totals(
+                periods[0]['start'], periods[-1]['end'], dashboard_range.tz, dashboard_range.company_ids)
+
+            revenue_by_period = defaultdict(float)
+            for day, values in totals.items():
+                revenue_by_period[self._get_period_start(day, granularity)] += (
+                    values['sale_revenue'] + values['pos_revenue'])
 
+            for period in periods:
                 sales_trend.append({
-                    'name': month['name'],
-                    'revenue': sale_total + pos_total
+                    'name': period['name'],
+                    'start': period['start'].strftime('%Y-%m-%d'),
+                    'revenue': revenue_by_period[period['start']]
                 })
 
         except Exception as e:
@@ -378,11 +680,9 @@ class RestApi(http.Controller):
 
         return sales_trend
 
-    def _get_sales_detail(self):
-        """Get detailed sales data including top products and revenue by category"""
-        dates = self._get_date_ranges()
-        year_start = dates['start_of_year'].strftime('%Y-%m-%d')
-
+    def _get_sales_detail(self, top=5, dashboard_range=None):
+        """Get detailed sales data including top products and revenue by
+        category of sale orders and POS orders within the range"""
         sales_detail = {
             'pos_revenue': 0,
             'b2b_revenue': 0,
@@ -393,82 +693,206 @@ class RestApi(http.Controller):
         }
 
         try:
-            # B2B Revenue from Sale Orders
-            SaleOrder = request.env['sale.order'].sudo()
-            sales = SaleOrder.search([
-                ('state', 'in', ['sale', 'done']),
-                ('date_order', '>=', year_start)
-            ])
-            sales_detail['b2b_revenue'] = sum(sales.mapped('amount_total'))
-            sales_detail['b2b_orders'] = len(sales)
-
-            # POS Revenue
-            try:
-                PosOrder = request.env['pos.order'].sudo()
-                pos_orders = PosOrder.search([
-                    ('state', 'in', ['paid', 'done', 'invoiced']),
-                    ('date_order', '>=', year_start)
-                ])
-                sales_detail['pos_revenue'] = sum(pos_orders.mapped('amount_total'))
-                sales_detail['pos_transactions'] = len(pos_orders)
-            except Exception:
-                pass
-
-            # Top Products from Sale Order Lines
-            SaleOrderLine = request.env['sale.order.line'].sudo()
-            top_lines = SaleOrderLine.read_group(
-                domain=[
-                    ('order_id.state', 'in', ['sale', 'done']),
-                    ('order_id.date_order', '>=', year_start)
-                ],
-                fields=['product_id', 'product_uom_qty:sum', 'price_subtotal:sum'],
-                groupby=['product_id'],
-                orderby='price_subtotal desc',
-                limit=5
-            )
-
-            for line in top_lines:
-                if line['product_id']:
-                    product = request.env['product.product'].sudo().browse(line['product_id'][0])
-                    category_name = product.categ_id.name if product.categ_id else 'Lainnya'
-                    sales_detail['top_products'].append({
-                        'name': line['product_id'][1][:40],
-                        'qty': int(line['product_uom_qty']),
-                        'revenue': line['price_subtotal'],
-                        'category': category_name[:20]
-                    })
-
-            # Revenue by Product Category
-            category_revenue = SaleOrderLine.read_group(
-                domain=[
-                    ('order_id.state', 'in', ['sale', 'done']),
-                    ('order_id.date_order', '>=', year_start)
-                ],
-                fields=['product_id', 'price_subtotal:sum'],
-                groupby=['product_id.categ_id'],
-                orderby='price_subtotal desc',
-                limit=5
-            )
+            dashboard_range = dashboard_range or self._get_dashboard_range()
+
+            # B2B Revenue from Sale Orders and POS Revenue, from the daily totals
+            totals = self._get_range_totals(
+                dashboard_range, ['sale_revenue', 'sale_orders', 'pos_revenue', 'pos_tickets'])
+            sales_detail['b2b_revenue'] = totals['sale_revenue']
+            sales_detail['b2b_orders'] = totals['sale_orders']
+            sales_detail['pos_revenue'] = totals['pos_revenue']
+            sales_detail['pos_transactions'] = totals['pos_tickets']
+
+            # Top Products and Revenue by Product Category
+            ranking = self._get_product_ranking(dashboard_range, top)
+            for product in ranking['products']:
+                sales_detail['top_products'].append({
+                    'name': product['name'][:40],
+                    'qty': int(product['qty']),
+                    'revenue': product['revenue'],
+                    'category': product['category'][:20]
+                })
 
             colors = ['#10b981', '#3b82f6', '#f59e0b', '#8b5cf6', '#ef4444']
-            for idx, cat in enumerate(category_revenue):
-                cat_name = cat.get('product_id.categ_id')
-                if cat_name:
-                    sales_detail['revenue_by_unit'].append({
-                        'name': cat_name[1] if isinstance(cat_name, tuple) else str(cat_name)[:20],
-                        'value': cat['price_subtotal'],
-                        'color': colors[idx % len(colors)]
-                    })
+            for idx, category in enumerate(ranking['categories']):
+                sales_detail['revenue_by_unit'].append({
+                    'name': category['name'][:20],
+                    'value': category['revenue'],
+                    'color': colors[idx % len(colors)]
+                })
 
         except Exception as e:
             _logger.error("Error in _get_sales_detail: %s", str(e))
 
         return sales_detail
 
-    def _get_finance_detail(self):
+    def _get_product_ranking(self, dashboard_range, top):
+        """Rank the products and the product categories by untaxed revenue
+        of the confirmed sale order lines and paid POS order lines within a
+        range, in a single grouped query also reading the product and
+        category names"""
+        ranking = {'products': [], 'categories': []}
+        start, stop = dashboard_range.get_utc_bounds()
+        company_sql = 'AND {alias}.company_id IN %(company_ids)s' if dashboard_range.company_ids else ''
+        params = {
+            'start': start,
+            'stop': stop,
+            'company_ids': dashboard_range.company_ids,
+            'sale_states': tuple(SALE_ORDER_STATES),
+            'pos_states': tuple(POS_ORDER_STATES),
+            'lang': request.env.lang or 'en_US',
+            'top': top,
+        }
+        lines = []
+        if 'sale.order.line' in request.env:
+            request.env['sale.order.line'].flush_model(['product_id', 'product_uom_qty', 'price_subtotal', 'order_id'])
+            request.env['sale.order'].flush_model(['state', 'date_order', 'company_id'])
+            lines.append(f"""
+                SELECT sol.product_id, sol.product_uom_qty AS qty, sol.price_subtotal AS revenue
+                  FROM sale_order_line sol
+                  JOIN sale_order so ON so.id = sol.order_id
+                 WHERE so.state IN %(sale_states)s
+                   AND so.date_order >= %(start)s AND so.date_order < %(stop)s
+                   AND sol.product_id IS NOT NULL
+                       {company_sql.format(alias='so')}
+            """)
+        if 'pos.order.line' in request.env:
+            request.env['pos.order.line'].flush_model(['product_id', 'qty', 'price_subtotal', 'order_id'])
+            request.env['pos.order'].flush_model(['state', 'date_order', 'company_id'])
+            lines.append(f"""
+                SELECT pol.product_id, pol.qty, pol.price_subtotal AS revenue
+                  FROM pos_order_line pol
+                  JOIN pos_order po ON po.id = pol.order_id
+                 WHERE po.state IN %(pos_states)s
+                   AND po.date_order >= %(start)s AND po.date_order < %(stop)s
+                       {company_sql.format(alias='po')}
+            """)
+        if not lines:
+            return ranking
+
+        request.env['product.product'].flush_model(['product_tmpl_id'])
+        request.env['product.template'].flush_model(['name', 'categ_id'])
+        request.env['product.category'].flush_model(['name'])
+        request.env.cr.execute(f"""
+            WITH products AS (
+                SELECT lines.product_id, pt.categ_id,
+                       COALESCE(pt.name->>%(lang)s, pt.name->>'en_US') AS name,
+                       SUM(lines.qty) AS qty, SUM(lines.revenue) AS revenue
+                  FROM ({' UNION ALL '.join(lines)}) lines
+                  JOIN product_product pp ON pp.id = lines.product_id
+                  JOIN product_template pt ON pt.id = pp.product_tmpl_id
+              GROUP BY lines.product_id, pt.categ_id, 3
+            )
+            (SELECT 'product', p.name, pc.name, p.qty, p.revenue
+               FROM products p
+          LEFT JOIN product_category pc ON pc.id = p.categ_id
+           ORDER BY p.revenue DESC
+              LIMIT %(top)s)
+            UNION ALL
+            (SELECT 'category', pc.name, NULL, SUM(p.qty), SUM(p.revenue)
+               FROM products p
+          LEFT JOIN product_category pc ON pc.id = p.categ_id
+           GROUP BY pc.id, pc.name
+           ORDER BY 5 DESC
+              LIMIT %(top)s)
+        """, params)
+        for kind, name, category, qty, revenue in request.env.cr.fetchall():
+            if kind == 'product':
+                ranking['products'].append({
+                    'name': name or '',
+                    'category': category or 'Lainnya',
+                    'qty': float(qty or 0),
+                    'revenue': float(revenue or 0),
+                })
+            else:
+                ranking['categories'].append({
+                    'name': name or 'Lainnya',
+                    'revenue': float(revenue or 0),
+                })
+        return ranking
+
+    def _get_account_ids_by_type(self):
+        """Map each account type to its account ids with a single search"""
+        def compute():
+            account_ids = defaultdict(list)
+            for account in request.env['account.account'].sudo().search_read([], ['account_type']):
+                account_ids[account['account_type']].append(account['id'])
+            return account_ids
+
+        return self._get_aggregate(make_aggregate_key('account.account', [], 'ids_by_type'), compute)
+
+    def _get_cashflow(self, periods, dashboard_range, account_ids, by_journal=False):
+        """Get the monthly cash in (income credit) and cash out (expense
+        debit) of the last periods up to the end of the range, optionally
+        split by journal"""
+        months = self._get_trend_periods(periods, 'month', dashboard_range.date_to)
+        cashflow = []
+
+        if not by_journal:
+            totals = self._get_daily_totals(
+                months[0]['start'], months[-1]['end'], dashboard_range.tz, dashboard_range.company_ids)
+            for month in months:
+                month_totals = self._sum_daily_totals(
+                    totals, month['start'], month['end'], ['cash_in', 'cash_out'])
+                cashflow.append({
+                    'name': month['name'],
+                    'start': month['start'].strftime('%Y-%m-%d'),
+                    'in': abs(month_totals['cash_in']),
+                    'out': abs(month_totals['cash_out'])
+                })
+            return cashflow
+
+        income_ids = tuple(account_ids['income'] + account_ids['income_other'])
+        expense_ids = tuple(
+            account_id
+            for account_type, type_ids in account_ids.items() if account_type.startswith('expense')
+            for account_id in type_ids
+        )
+        company_sql, company_params = '', ()
+        if dashboard_range.company_ids:
+            company_sql, company_params = 'AND company_id IN %s', (dashboard_range.company_ids,)
+        cr = request.env.cr
+        cr.execute(f"""
+            SELECT date_trunc('month', date)::date, journal_id,
+                   SUM(CASE WHEN account_id IN %s THEN credit ELSE 0 END),
+                   SUM(CASE WHEN account_id IN %s THEN debit ELSE 0 END)
+              FROM account_move_line
+             WHERE parent_state = 'posted'
+               AND date >= %s AND date <= %s
+               AND account_id IN %s
+                   {company_sql}
+          GROUP BY 1, 2
+        """, (income_ids or (0,), expense_ids or (0,), months[0]['start'], months[-1]['end'],
+              (income_ids + expense_ids) or (0,)) + company_params)
+
+        by_month = defaultdict(dict)
+        for month_start, journal_id, cash_in, cash_out in cr.fetchall():
+            by_month[month_start][journal_id] = (abs(float(cash_in)), abs(float(cash_out)))
+        journal_ids = {journal_id for journals in by_month.values() for journal_id in journals}
+        journal_names = {
+            journal.id: journal.name
+            for journal in request.env['account.journal'].sudo().browse(journal_ids)
+        }
+
+        for month in months:
+            journals = by_month.get(month['start'], {})
+            cashflow.append({
+                'name': month['name'],
+                'start': month['start'].strftime('%Y-%m-%d'),
+                'in': sum(cash_in for cash_in, cash_out in journals.values()),
+                'out': sum(cash_out for cash_in, cash_out in journals.values()),
+                'journals': [{
+                    'id': journal_id,
+                    'name': journal_names[journal_id],
+                    'in': cash_in,
+                    'out': cash_out
+                } for journal_id, (cash_in, cash_out) in sorted(journals.items())]
+            })
+        return cashflow
+
+    def _get_finance_detail(self, periods=6, by_journal=False, dashboard_range=None):
         """Get detailed finance data including cashflow, expenses, income statement, balance sheet"""
-        dates = self._get_date_ranges()
-        year_start = dates['start_of_year'].strftime('%Y-%m-%d')
+        dashboard_range = dashboard_range or self._get_dashboard_range()
 
         finance_detail = {
             'cashflow': [],
@@ -483,56 +907,30 @@ class RestApi(http.Controller):
                 'tax': 0,
                 'net_profit': 0
             },
-            'balance_sheet': self._get_balance_sheet()
+            'balance_sheet': self._get_balance_sheet(dashboard_range)
         }
 
         try:
-            Account = request.env['account.account'].sudo()
             MoveLine = request.env['account.move.line'].sudo()
+            account_ids = self._get_account_ids_by_type()
 
-            # Cashflow per month (last 6 months)
-            for month in dates['months']:
-                month_start = month['start'].strftime('%Y-%m-%d')
-                month_end = month['end'].strftime('%Y-%m-%d')
-
-                # Cash In (revenue/income accounts)
-                income_accounts = Account.search([('account_type', 'in', ['income', 'income_other'])])
-                cash_in = 0
-                if income_accounts:
-                    in_lines = MoveLine.search([
-                        ('account_id', 'in', income_accounts.ids),
-                        ('parent_state', '=', 'posted'),
-                        ('date', '>=', month_start),
-                        ('date', '<=', month_end)
-                    ])
-                    cash_in = abs(sum(in_lines.mapped('credit')))
-
-                # Cash Out (expense accounts)
-                expense_accounts = Account.search([('account_type', 'like', 'expense%')])
-                cash_out = 0
-                if expense_accounts:
-                    out_lines = MoveLine.search([
-                        ('account_id', 'in', expense_accounts.ids),
-                        ('parent_state', '=', 'posted'),
-                        ('date', '>=', month_start),
-                        ('date', '<=', month_end)
-                    ])
-                    cash_out = abs(sum(out_lines.mapped('debit')))
-
-                finance_detail['cashflow'].append({
-                    'name': month['name'],
-                    'in': cash_in,
-                    'out': cash_out
-                })
+            # Cashflow per month (last 6 months by default)
+            finance_detail['cashflow'] = self._get_cashflow(
+                periods, dashboard_range, account_ids, by_journal=by_journal)
 
             # Expense Breakdown by category (using analytic or account groups)
-            expense_accounts = Account.search([('account_type', 'like', 'expense%')])
+            expense_ids = [
+                account_id
+                for account_type, type_ids in account_ids.items() if account_type.startswith('expense')
+                for account_id in type_ids
+            ]
             expense_by_account = MoveLine.read_group(
                 domain=[
-                    ('account_id', 'in', expense_accounts.ids),
+                    ('account_id', 'in', expense_ids),
                     ('parent_state', '=', 'posted'),
-                    ('date', '>=', year_start)
-                ],
+                    ('date', '>=', dashboard_range.date_from),
+                    ('date', '<=', dashboard_range.date_to)
+                ] + dashboard_range.get_company_domain(),
                 fields=['account_id', 'debit:sum'],
                 groupby=['account_id'],
                 orderby='debit desc',
@@ -548,26 +946,15 @@ class RestApi(http.Controller):
                         'color': colors[idx % len(colors)]
                     })
 
-            # Income Statement
+            # Income Statement, from the daily totals of the range
+            totals = self._get_range_totals(
+                dashboard_range, ['income', 'expense', 'expense_depreciation', 'expense_direct_cost'])
+
             # Revenue
-            income_accounts = Account.search([('account_type', 'in', ['income', 'income_other'])])
-            if income_accounts:
-                revenue_lines = MoveLine.search([
-                    ('account_id', 'in', income_accounts.ids),
-                    ('parent_state', '=', 'posted'),
-                    ('date', '>=', year_start)
-                ])
-                finance_detail['income_statement']['revenue'] = abs(sum(revenue_lines.mapped('balance')))
+            finance_detail['income_statement']['revenue'] = abs(totals['income'])
 
             # COGS
-            cogs_accounts = Account.search([('account_type', '=', 'expense_direct_cost')])
-            if cogs_accounts:
-                cogs_lines = MoveLine.search([
-                    ('account_id', 'in', cogs_accounts.ids),
-                    ('parent_state', '=', 'posted'),
-                    ('date', '>=', year_start)
-                ])
-                finance_detail['income_statement']['cogs'] = abs(sum(cogs_lines.mapped('balance')))
+            finance_detail['income_statement']['cogs'] = abs(totals['expense_direct_cost'])
 
             # Gross Profit
             finance_detail['income_statement']['gross_profit'] = (
@@ -576,24 +963,10 @@ class RestApi(http.Controller):
             )
 
             # Operating Expenses
-            op_expense_accounts = Account.search([('account_type', '=', 'expense')])
-            if op_expense_accounts:
-                op_lines = MoveLine.search([
-                    ('account_id', 'in', op_expense_accounts.ids),
-                    ('parent_state', '=', 'posted'),
-                    ('date', '>=', year_start)
-                ])
-                finance_detail['income_statement']['operating_expenses'] = abs(sum(op_lines.mapped('balance')))
+            finance_detail['income_statement']['operating_expenses'] = abs(totals['expense'])
 
             # Depreciation
-            depreciation_accounts = Account.search([('account_type', '=', 'expense_depreciation')])
-            if depreciation_accounts:
-                dep_lines = MoveLine.search([
-                    ('account_id', 'in', depreciation_accounts.ids),
-                    ('parent_state', '=', 'posted'),
-                    ('date', '>=', year_start)
-                ])
-                finance_detail['income_statement']['depreciation'] = abs(sum(dep_lines.mapped('balance')))
+            finance_detail['income_statement']['depreciation'] = abs(totals['expense_depreciation'])
 
             # Net Profit Before Tax
             finance_detail['income_statement']['net_profit_before_tax'] = (
@@ -617,8 +990,34 @@ class RestApi(http.Controller):
 
         return finance_detail
 
-    def _get_balance_sheet(self):
-        """Get balance sheet data from account.account"""
+    def _get_account_type_balances(self, domain=None):
+        """Sum posted move line balances per account type in one grouped
+        query, memoised per request. The result must not be modified."""
+        domain = [('parent_state', '=', 'posted')] + (domain or [])
+
+        def compute():
+            groups = request.env['account.move.line'].sudo().read_group(
+                domain=domain,
+                fields=['account_id', 'balance:sum'],
+                groupby=['account_id'],
+                lazy=False
+            )
+            account_types = {
+                account_id: account_type
+                for account_type, account_ids in self._get_account_ids_by_type().items()
+                for account_id in account_ids
+            }
+
+            balances = defaultdict(float)
+            for group in groups:
+                if group['account_id']:
+                    balances[account_types[group['account_id'][0]]] += group['balance']
+            return balances
+
+        return self._get_aggregate(make_aggregate_key('account.move.line', domain, 'balance:sum'), compute)
+
+    def _get_balance_sheet(self, dashboard_range=None):
+        """Get balance sheet data from account.account at the end of the range"""
         balance_sheet = {
             'current_assets': {
                 'cash_and_bank': 0,
@@ -656,18 +1055,11 @@ class RestApi(http.Controller):
         }
 
         try:
-            Account = request.env['account.account'].sudo()
-            MoveLine = request.env['account.move.line'].sudo()
+            balances = self._get_account_type_balances(
+                self._get_balance_domain(dashboard_range or self._get_dashboard_range()))
 
             def get_balance(account_types):
-                accounts = Account.search([('account_type', 'in', account_types)])
-                if not accounts:
-                    return 0
-                lines = MoveLine.search([
-                    ('account_id', 'in', accounts.ids),
-                    ('parent_state', '=', 'posted')
-                ])
-                return sum(lines.mapped('balance'))
+                return sum(balances.get(account_type, 0) for account_type in account_types)
 
             # Current Assets
             balance_sheet['current_assets']['cash_and_bank'] = get_balance(['asset_cash'])
@@ -727,7 +1119,7 @@ class RestApi(http.Controller):
 
         return balance_sheet
 
-    def _get_logistics_detail(self):
+    def _get_logistics_detail(self, dashboard_range=None):
         """Get detailed logistics data"""
         logistics_detail = {
             'inventory_by_category': [],
@@ -742,64 +1134,29 @@ class RestApi(http.Controller):
         }
 
         try:
+            dashboard_range = dashboard_range or self._get_dashboard_range()
+            company_domain = dashboard_range.get_company_domain()
+
             # Inventory by Category
             try:
-                StockQuant = request.env['stock.quant'].sudo()
-                ProductCategory = request.env['product.category'].sudo()
-
-                categories = ProductCategory.search([], limit=10)
                 colors = ['#10b981', '#3b82f6', '#f59e0b', '#8b5cf6', '#ef4444', '#06b6d4', '#ec4899', '#84cc16']
-
-                for idx, cat in enumerate(categories):
-                    quants = StockQuant.search([
-                        ('product_id.categ_id', 'child_of', cat.id),
-                        ('location_id.usage', '=', 'internal'),
-                        ('quantity', '>', 0)
-                    ])
-                    if quants:
-                        value = sum(q.quantity * q.product_id.standard_price for q in quants)
-                        item_count = len(set(quants.mapped('product_id.id')))
-                        if value > 0:
-                            logistics_detail['inventory_by_category'].append({
-                                'name': cat.name[:20],
-                                'value': value,
-                                'items': item_count,
-                                'color': colors[idx % len(colors)]
-                            })
-
-                # Sort by value
-                logistics_detail['inventory_by_category'] = sorted(
-                    logistics_detail['inventory_by_category'],
-                    key=lambda x: x['value'],
-                    reverse=True
-                )[:5]
+                categories = self._get_inventory_valuation(
+                    top=5, company_ids=dashboard_range.company_ids)['categories']
+                for idx, category in enumerate(categories):
+                    logistics_detail['inventory_by_category'].append({
+                        'name': category['name'][:20],
+                        'value': category['value'],
+                        'items': category['items'],
+                        'color': colors[idx % len(colors)]
+                    })
 
             except Exception as e:
                 _logger.info("Stock module issue: %s", str(e))
 
             # Low Stock Alerts
             try:
-                OrderPoint = request.env['stock.warehouse.orderpoint'].sudo()
-                StockQuant = request.env['stock.quant'].sudo()
-
-                orderpoints = OrderPoint.search([], limit=20)
-                for op in orderpoints:
-                    quants = StockQuant.search([
-                        ('product_id', '=', op.product_id.id),
-                        ('location_id', '=', op.location_id.id)
-                    ])
-                    current_qty = sum(quants.mapped('quantity'))
-
-                    if current_qty < op.product_min_qty:
-                        logistics_detail['low_stock_alerts'].append({
-                            'name': op.product_id.name[:30],
-                            'current_stock': current_qty,
-                            'min_stock': op.product_min_qty,
-                            'unit': op.product_id.uom_id.name if op.product_id.uom_id else 'Unit',
-                            'category': op.product_id.categ_id.name[:20] if op.product_id.categ_id else 'Lainnya'
-                        })
-
-                logistics_detail['low_stock_alerts'] = logistics_detail['low_stock_alerts'][:5]
+                logistics_detail['low_stock_alerts'] = self._get_low_stock(
+                    limit=5, company_ids=dashboard_range.company_ids)['items']
 
             except Exception as e:
                 _logger.info("Orderpoint issue: %s", str(e))
@@ -809,7 +1166,7 @@ class RestApi(http.Controller):
                 PurchaseOrder = request.env['purchase.order'].sudo()
                 pending_pos = PurchaseOrder.search([
                     ('state', 'in', ['draft', 'sent', 'to approve', 'purchase'])
-                ], order='date_order desc', limit=5)
+                ] + company_domain, order='date_order desc', limit=5)
 
                 for po in pending_pos:
                     status_map = {
@@ -842,13 +1199,12 @@ class RestApi(http.Controller):
             # Delivery Status from stock.picking
             try:
                 StockPicking = request.env['stock.picking'].sudo()
-                dates = self._get_date_ranges()
-                week_start = dates['start_of_week'].strftime('%Y-%m-%d')
+                week_start, week_stop = dashboard_range.get_utc_bounds(dashboard_range.week_start)
 
                 # Incoming pickings (from purchases)
                 incoming_type = request.env['stock.picking.type'].sudo().search([
                     ('code', '=', 'incoming')
-                ], limit=1)
+                ] + company_domain, limit=1)
 
                 if incoming_type:
                     logistics_detail['delivery_status']['in_transit'] = StockPicking.search_count([
@@ -869,7 +1225,8 @@ class RestApi(http.Controller):
                     logistics_detail['delivery_status']['completed_this_week'] = StockPicking.search_count([
                         ('picking_type_id', '=', incoming_type.id),
                         ('state', '=', 'done'),
-                        ('date_done', '>=', week_start)
+                        ('date_done', '>=', week_start),
+                        ('date_done', '<', week_stop)
                     ])
 
             except Exception as e:
@@ -880,87 +1237,302 @@ class RestApi(http.Controller):
 
         return logistics_detail
 
-    def _get_pos_summary(self):
-        """Get POS summary for today, this week, this month"""
-        dates = self._get_date_ranges()
-
+    def _get_pos_summary(self, dashboard_range=None):
+        """Get POS summary for today, this week, this month from the
+        running POS counters. For a range ending before today, or cut in
+        another timezone than the counters, the summary covers the last
+        day of the range, its week and its month from the daily totals."""
         pos_summary = {
             'today': {'transactions': 0, 'revenue': 0, 'avg_ticket': 0},
             'this_week': {'transactions': 0, 'revenue': 0, 'avg_ticket': 0},
             'this_month': {'transactions': 0, 'revenue': 0, 'avg_ticket': 0}
         }
 
-        try:
-            PosOrder = request.env['pos.order'].sudo()
-
-            # Today
-            today_orders = PosOrder.search([
-                ('state', 'in', ['paid', 'done', 'invoiced']),
-                ('date_order', '>=', dates['start_of_today'].strftime('%Y-%m-%d %H:%M:%S'))
-            ])
-            pos_summary['today']['transactions'] = len(today_orders)
-            pos_summary['today']['revenue'] = sum(today_orders.mapped('amount_total'))
-            if pos_summary['today']['transactions'] > 0:
-                pos_summary['today']['avg_ticket'] = pos_summary['today']['revenue'] / pos_summary['today']['transactions']
-
-            # This Week
-            week_orders = PosOrder.search([
-                ('state', 'in', ['paid', 'done', 'invoiced']),
-                ('date_order', '>=', dates['start_of_week'].strftime('%Y-%m-%d'))
-            ])
-            pos_summary['this_week']['transactions'] = len(week_orders)
-            pos_summary['this_week']['revenue'] = sum(week_orders.mapped('amount_total'))
-            if pos_summary['this_week']['transactions'] > 0:
-                pos_summary['this_week']['avg_ticket'] = pos_summary['this_week']['revenue'] / pos_summary['this_week']['transactions']
-
-            # This Month
-            month_orders = PosOrder.search([
-                ('state', 'in', ['paid', 'done', 'invoiced']),
-                ('date_order', '>=', dates['start_of_month'].strftime('%Y-%m-%d'))
-            ])
-            pos_summary['this_month']['transactions'] = len(month_orders)
-            pos_summary['this_month']['revenue'] = sum(month_orders.mapped('amount_total'))
-            if pos_summary['this_month']['transactions'] > 0:
-                pos_summary['this_month']['avg_ticket'] = pos_summary['this_month']['revenue'] / pos_summary['this_month']['transactions']
+        if 'pos.order' not in request.env:
+            return pos_summary
 
+        try:
+            dashboard_range = dashboard_range or self._get_dashboard_range()
+            fact_tz = request.env['owner.dashboard.daily.fact'].sudo()._get_fact_timezone()
+            if dashboard_range.is_current and dashboard_range.tz == fact_tz:
+                return request.env['owner.dashboard.pos.counter'].sudo()._get_summary(dashboard_range.company_ids)
+
+            periods = {
+                'today': dashboard_range.date_to,
+                'this_week': dashboard_range.week_start,
+                'this_month': dashboard_range.month_start
+            }
+            totals = self._get_daily_totals(
+                min(periods.values()), dashboard_range.date_to, dashboard_range.tz, dashboard_range.company_ids)
+            for period, period_start in periods.items():
+                period_totals = self._sum_daily_totals(
+                    totals, period_start, dashboard_range.date_to, ['pos_tickets', 'pos_revenue'])
+                pos_summary[period]['transactions'] = period_totals['pos_tickets']
+                pos_summary[period]['revenue'] = period_totals['pos_revenue']
+                if pos_summary[period]['transactions'] > 0:
+                    pos_summary[period]['avg_ticket'] = pos_summary[period]['revenue'] / pos_summary[period]['transactions']
         except Exception as e:
             _logger.info("POS module not available or error: %s", str(e))
 
         return pos_summary
 
-    # ==================== MAIN DASHBOARD ENDPOINT ====================
+    # ==================== DASHBOARD CACHE ====================
 
-    @http.route(['/api/owner_dashboard/summary'], type='http', auth='none', cors='*', methods=['GET'], csrf=False)
-    def fetch_dashboard_summary(self, **kw):
-        """Main endpoint for Owner Dashboard - fetches all data from Odoo models"""
+    def _get_dashboard_cache_ttl(self):
+        """Get the dashboard cache lifetime in seconds (0 disables caching)"""
+        try:
+            return int(request.env['ir.config_parameter'].sudo().get_param(
+                'rest_api_odoo.dashboard_cache_ttl', 300))
+        except ValueError:
+            return 300
+
+    def _get_dashboard_section(self, section, ttl, options=None, data_version=None):
+        """Build a dashboard section, serving it from the cache when possible.
+
+        The cache is per worker process and only sees the writes of its own
+        process, so the cache key holds ``data_version``, the version of the
+        data of the section (read when not given): an entry built before a
+        write made in another process is not served.
+        """
+        dbname = request.env.cr.dbname
+        section_options = self._get_section_options(section, options)
+        cache_key = self._get_dashboard_cache_key(section, section_options)
+        if ttl:
+            if data_version is None:
+                data_version = self._get_section_data_versions([section])[section]
+            cache_key = '%s@%s' % (cache_key, data_version)
+            data = dashboard_cache.get(dbname, cache_key)
+            if data is not None:
+                return data
+
+        data = getattr(self, DASHBOARD_SECTION_BUILDERS[section])(**section_options)
+        section_run = getattr(request, 'section_run', None)
+        if ttl and not (section_run and section_run.closed):
+            dashboard_cache.set(dbname, cache_key, data, ttl, {section})
+        return data
+
+    def _get_section_data_versions(self, sections):
+        """Version of the data of each dashboard section: the versions of
+        its models, read in a single query"""
+        model_versions = get_model_versions(request.env, get_section_models(sections))
+        return {
+            section: make_version(
+                [model_versions.get(model_name) for model_name in sorted(get_section_models([section]))])
+            for section in sections
+        }
 
+    def _get_section_options(self, section, options):
+        """Keep the request options a dashboard section depends on, the
+        dashboard range included"""
+        return {
+            key: value for key, value in (options or {}).items()
+            if key == 'dashboard_range' or key in DASHBOARD_SECTION_OPTIONS.get(section, ())
+        }
+
+    def _build_dashboard_sections(self, sections, ttl, options=None):
+        """Build the given dashboard sections, one after another or, when
+        ``rest_api_odoo.dashboard_parallel`` is set, concurrently.
+
+        In parallel mode each section runs in a worker of the shared pool,
+        in its own read-only transaction importing the snapshot of the
+        request transaction, so all sections see the same data. At most
+        ``SECTION_REQUEST_LIMIT`` sections of the request are queued or
+        running at once. A section not done within
+        ``rest_api_odoo.dashboard_section_timeout`` seconds is replaced by
+        its fallback data: the sections not started are skipped and the
+        queries of the running ones are cancelled.
+
+        :return: tuple (data by section, sections holding fallback data,
+            ``Server-Timing`` metrics of the sections)
+        """
+        get_param = request.env['ir.config_parameter'].sudo().get_param
+        data_versions = self._get_section_data_versions(sections) if ttl else {}
+        if len(sections) < 2 or not str2bool(get_param('rest_api_odoo.dashboard_parallel', 'False')):
+            data, timings = {}, []
+            for section in sections:
+                data[section], stats = self._measure_dashboard_section(
+                    section, ttl, options, data_versions.get(section))
+                timings.append(format_server_timing(section, stats))
+            return data, [], timings
         try:
-            # Collect all dashboard data
-            kpi_data = self._get_kpi_data()
-            finance_data = self._get_finance_data()
-            logistics_data = self._get_logistics_data()
-            recent_transactions = self._get_recent_transactions()
-            sales_trend = self._get_sales_trend()
-            sales_detail = self._get_sales_detail()
-            finance_detail = self._get_finance_detail()
-            logistics_detail = self._get_logistics_detail()
-            pos_summary = self._get_pos_summary()
+            timeout = float(get_param('rest_api_odoo.dashboard_section_timeout', 10))
+        except ValueError:
+            timeout = 10.0
+
+        # Created up front so that the workers share the aggregates
+        self._get_aggregate_context()
+        parent = request._get_current_object()
+        section_run = SectionRun(export_snapshot(request.env.cr))
+
+        def build_section(section):
+            with snapshot_request(parent, section_run):
+                return self._measure_dashboard_section(section, ttl, options, data_versions.get(section))
+
+        executor = get_section_executor()
+        pending = list(sections)
+        running = {}
+        deadline = time.monotonic() + timeout
+        results = {}
+        try:
+            while pending or running:
+                while pending and len(running) < SECTION_REQUEST_LIMIT:
+                    section = pending.pop(0)
+                    running[executor.submit(build_section, section)] = section
+                done, _not_done = concurrent.futures.wait(
+                    running, timeout=max(deadline - time.monotonic(), 0),
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    results[running.pop(future)] = future
+        finally:
+            section_run.close()
+            for future in running:
+                future.cancel()
+
+        data, partial_sections, timings = {}, [], []
+        for section in sections:
+            future = results.get(section)
+            if future is None:
+                _logger.warning("Dashboard section %s timed out after %ss", section, timeout)
+                data[section] = DASHBOARD_FALLBACK_DATA[section]
+                partial_sections.append(section)
+                timings.append(format_server_timing(section, description='timeout'))
+                continue
+            try:
+                data[section], stats = future.result()
+                timings.append(format_server_timing(section, stats))
+            except Exception as e:
+                _logger.error("Error building dashboard section %s: %s", section, str(e))
+                data[section] = DASHBOARD_FALLBACK_DATA[section]
+                partial_sections.append(section)
+                timings.append(format_server_timing(section, description='error'))
+        return data, partial_sections, timings
+
+    def _measure_dashboard_section(self, section, ttl, options=None, data_version=None):
+        """Build a dashboard section, measuring its wall time and the SQL
+        queries it runs into the section metrics
+
+        :return: tuple (section data, stats)
+        """
+        with measure_queries() as stats:
+            data = self._get_dashboard_section(section, ttl, options, data_version)
+        api_metrics.observe('owner_dashboard_section', (section,), stats)
+        return data, stats
+
+    def _get_dashboard_cache_key(self, name, options):
+        """Build a cache key from a name and the request options"""
+        if not options:
+            return name
+        return '%s?%s' % (name, '&'.join('%s=%s' % item for item in sorted(options.items())))
+
+    def _parse_dashboard_options(self, params):
+        """Validate the optional query parameters of the dashboard endpoints"""
+        options = {}
+        if params.get('months'):
+            try:
+                options['months'] = int(params['months'])
+            except ValueError:
+                raise ValueError("months must be an integer")
+            if not 1 <= options['months'] <= TREND_MAX_MONTHS:
+                raise ValueError("months must be between 1 and %s" % TREND_MAX_MONTHS)
+        if params.get('granularity'):
+            if params['granularity'] not in ('day', 'week', 'month'):
+                raise ValueError("granularity must be one of day, week, month")
+            options['granularity'] = params['granularity']
+        if params.get('periods'):
+            try:
+                options['periods'] = int(params['periods'])
+            except ValueError:
+                raise ValueError("periods must be an integer")
+            if not 1 <= options['periods'] <= TREND_MAX_MONTHS:
+                raise ValueError("periods must be between 1 and %s" % TREND_MAX_MONTHS)
+        if params.get('by_journal'):
+            options['by_journal'] = params['by_journal'].lower() in ('1', 'true', 'yes')
+        if params.get('top'):
+            try:
+                options['top'] = int(params['top'])
+            except ValueError:
+                raise ValueError("top must be an integer")
+            if not 1 <= options['top'] <= SALES_TOP_MAX:
+                raise ValueError("top must be between 1 and %s" % SALES_TOP_MAX)
+        options['dashboard_range'] = self._parse_dashboard_range(params)
+        return options
+
+    def _parse_dashboard_range(self, params):
+        """Validate the ``from``, ``to``, ``company_ids`` and ``tz`` query
+        parameters and build the dashboard range from them"""
+        dates = {}
+        for param in ('from', 'to'):
+            if params.get(param):
+                try:
+                    dates[param] = datetime.strptime(params[param], DEFAULT_SERVER_DATE_FORMAT).date()
+                except ValueError:
+                    raise ValueError("%s must be a date (YYYY-MM-DD)" % param)
+        company_ids = None
+        if params.get('company_ids'):
+            try:
+                company_ids = [int(company_id) for company_id in params['company_ids'].split(',')]
+            except ValueError:
+                raise ValueError("company_ids must be a comma separated list of integers")
+            unknown = set(company_ids).difference(request.env['res.company'].sudo().browse(company_ids).exists().ids)
+            if unknown:
+                raise ValueError("Unknown company id(s): %s" % ', '.join(map(str, sorted(unknown))))
+        if params.get('tz') and params['tz'] not in pytz.all_timezones_set:
+            raise ValueError("Unknown timezone: %s" % params['tz'])
+
+        dashboard_range = self._get_dashboard_range(dates.get('from'), dates.get('to'), company_ids, params.get('tz'))
+        if dashboard_range.date_from > dashboard_range.date_to:
+            raise ValueError("from must not be after to")
+        return dashboard_range
+
+    def _parse_dashboard_sections(self, sections_param):
+        """Parse a comma separated list of sections, keeping dashboard order"""
+        if not sections_param:
+            return DASHBOARD_SECTIONS
+        requested = {section.strip() for section in sections_param.split(',') if section.strip()}
+        unknown = requested.difference(DASHBOARD_SECTIONS)
+        if unknown:
+            raise ValueError("Unknown dashboard section(s): %s" % ', '.join(sorted(unknown)))
+        return tuple(section for section in DASHBOARD_SECTIONS if section in requested)
+
+    def _make_dashboard_response(self, sections, options=None):
+        """Build the JSON response of the given dashboard sections, reusing
+        the cached payload when one is available"""
+        dbname = request.env.cr.dbname
+        ttl = self._get_dashboard_cache_ttl()
+        cache_key = self._get_dashboard_cache_key(
+            'summary' if sections == DASHBOARD_SECTIONS else 'summary:%s' % ','.join(sections),
+            options)
+        version, last_modified = get_data_version(request.env, get_section_models(sections))
+        etag = make_etag(dbname, cache_key, version)
+        headers = [('Content-Type', 'application/json')] + self._get_validator_headers(etag, last_modified)
+        if request.httprequest.if_none_match.contains_weak(etag):
+            return request.make_response('', headers=headers, status=304)
+
+        if ttl:
+            # Only serve a payload built from the current data version
+            cached_response = dashboard_cache.get(dbname, cache_key)
+            if cached_response is not None and cached_response[0] == etag:
+                return self._make_encoded_response(
+                    cached_response[1], headers + [('Server-Timing', format_server_timing('cache', description='hit'))])
 
+        try:
+            # Collect the requested dashboard data
+            with measure_queries() as stats:
+                data, partial_sections, timings = self._build_dashboard_sections(sections, ttl, options)
+            timings.append(format_server_timing('total', stats, description='all sections'))
+            headers.append(('Server-Timing', ', '.join(timings)))
             dashboard_data = {
                 "status": "success",
-                "data": {
-                    "kpi": kpi_data,
-                    "finance": finance_data,
-                    "logistics": logistics_data,
-                    "recent_transactions": recent_transactions,
-                    "sales_trend": sales_trend,
-                    "sales_detail": sales_detail,
-                    "finance_detail": finance_detail,
-                    "logistics_detail": logistics_detail,
-                    "pos_summary": pos_summary
-                },
+                "data": data,
                 "generated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
+            if partial_sections:
+                dashboard_data['partial_sections'] = partial_sections
+            else:
+                dashboard_data['token'] = self._encode_delta_token(
+                    self._get_section_versions(sections, options), request.env.cr.now())
 
             _logger.info("Dashboard data generated successfully")
 
@@ -971,35 +1543,309 @@ class RestApi(http.Controller):
                 "status": "error",
                 "message": str(e),
                 "data": {
-                    "kpi": {"total_revenue": 0, "total_orders": 0, "active_customers": 0, "cash_balance": 0},
-                    "finance": {"accounts_receivable": 0, "accounts_payable": 0, "net_profit": 0, "expenses": 0, "assets": 0, "liabilities": 0, "equity": 0},
-                    "logistics": {"pending_deliveries": 0, "low_stock_items": 0, "inventory_value": 0},
-                    "recent_transactions": [],
-                    "sales_trend": [],
-                    "sales_detail": {"pos_revenue": 0, "b2b_revenue": 0, "pos_transactions": 0, "b2b_orders": 0, "top_products": [], "revenue_by_unit": []},
-                    "finance_detail": {"cashflow": [], "expense_breakdown": [], "income_statement": {}, "balance_sheet": {}},
-                    "logistics_detail": {"inventory_by_category": [], "low_stock_alerts": [], "pending_orders": [], "delivery_status": {}},
-                    "pos_summary": {"today": {}, "this_week": {}, "this_month": {}}
+                    section: DASHBOARD_FALLBACK_DATA[section]
+                    for section in sections
                 }
             }
 
+        if dashboard_data['status'] != 'success':
+            return self._make_json_response(dashboard_data)
+        if dashboard_data.get('partial_sections'):
+            return self._make_json_response(dashboard_data, headers[-1:])
+        response_body = dumps(dashboard_data)
+        if ttl:
+            dashboard_cache.set(dbname, cache_key, (etag, response_body), ttl, sections)
+
+        return self._make_encoded_response(response_body, headers)
+
+    def _make_dashboard_delta_response(self, sections, options, since):
+        """Build the JSON response of the sections whose inputs changed
+        since a token returned by a previous summary response.
+
+        ``data`` holds the changed sections only, and its
+        ``recent_transactions`` the transactions changed since the token,
+        to be merged into the ones the client has. The response carries the
+        token to use for the next refresh.
+        """
+        try:
+            since_versions, watermark = self._decode_delta_token(since)
+        except ValueError as e:
+            return self._make_dashboard_error(str(e))
+
+        section_versions = self._get_section_versions(sections, options)
+        changed_sections = [
+            section for section in sections
+            if since_versions.get(section) != section_versions[section]
+        ]
+        try:
+            with measure_queries() as stats:
+                data, partial_sections, timings = self._build_dashboard_sections(
+                    [section for section in changed_sections if section != 'recent_transactions'],
+                    self._get_dashboard_cache_ttl(), options)
+                if 'recent_transactions' in changed_sections:
+                    data['recent_transactions'] = self._get_recent_transactions(
+                        since=watermark - DELTA_TRANSACTION_OVERLAP, dashboard_range=options.get('dashboard_range'))
+        except Exception as e:
+            _logger.error("Critical error generating dashboard delta: %s", str(e))
+            return self._make_dashboard_error(str(e), status=500)
+        timings.append(format_server_timing('total', stats, description='changed sections'))
+
+        # Sections served with fallback data stay changed for the next refresh
+        for section in partial_sections:
+            del section_versions[section]
+        dashboard_data = {
+            "status": "success",
+            "data": data,
+            "unchanged_sections": [section for section in sections if section not in changed_sections],
+            "token": self._encode_delta_token(section_versions, request.env.cr.now()),
+            "generated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+        if partial_sections:
+            dashboard_data['partial_sections'] = partial_sections
+        return self._make_json_response(dashboard_data, [('Server-Timing', ', '.join(timings))])
+
+    def _get_section_versions(self, sections, options=None):
+        """Version marker of the inputs of each dashboard section: the data
+        versions of its models, its options and the current day in the
+        dashboard timezone. Unlike the ETag, it only changes with these
+        inputs."""
+        data_versions = self._get_section_data_versions(sections)
+        dashboard_range = (options or {}).get('dashboard_range')
+        if dashboard_range:
+            today = dashboard_range.today
+        else:
+            today = request.env['owner.dashboard.daily.fact'].sudo()._get_local_today()
+        return {
+            section: make_version(
+                section, sorted(self._get_section_options(section, options).items()), today,
+                data_versions[section])[:16]
+            for section in sections
+        }
+
+    def _encode_delta_token(self, section_versions, watermark):
+        """Build the opaque token of a dashboard response, remembering the
+        section versions and the time the data was read"""
+        payload = json.dumps({
+            'versions': section_versions,
+            'watermark': watermark.strftime(DEFAULT_SERVER_DATETIME_FORMAT),
+        })
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_delta_token(self, token):
+        """Decode a token built by ``_encode_delta_token``"""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            return dict(payload['versions']), datetime.strptime(payload['watermark'], DEFAULT_SERVER_DATETIME_FORMAT)
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Invalid since token")
+
+    def _get_validator_headers(self, etag, last_modified):
+        """HTTP headers letting clients revalidate a response with
+        If-None-Match instead of downloading it again. The tags are weak as
+        the body may be sent with different content codings."""
+        headers = [('ETag', quote_etag(etag, weak=True)), ('Cache-Control', 'no-cache')]
+        if last_modified:
+            headers.append(('Last-Modified', http_date(last_modified.replace(tzinfo=timezone.utc))))
+        return headers
+
+    def _make_dashboard_error(self, message, status=400):
+        """Build a JSON error response for the dashboard endpoints"""
+        return self._make_json_response({"status": "error", "message": message}, status=status)
+
+    # ==================== RESPONSE ENCODING ====================
+
+    def _make_json_response(self, payload, headers=None, status=200):
+        """Serialise a payload into an encoded JSON response"""
+        return self._make_encoded_response(
+            dumps(payload), [('Content-Type', 'application/json')] + (headers or []), status)
+
+    def _make_encoded_response(self, body, headers, status=200):
+        """Build a response compressed with the best content coding accepted
+        by the client. Small bodies are sent as is; streamed bodies are
+        compressed chunk by chunk."""
+        headers = list(headers) + [('Vary', 'Accept-Encoding')]
+        encoding = negotiate_encoding(request.httprequest.accept_encodings)
+        if encoding:
+            if isinstance(body, str):
+                body = body.encode()
+            if not isinstance(body, bytes):
+                body = compress_stream(body, encoding)
+                headers.append(('Content-Encoding', encoding))
+            elif len(body) >= COMPRESSION_MIN_SIZE:
+                body = compress(body, encoding)
+                headers.append(('Content-Encoding', encoding))
+        return request.make_response(body, headers=headers, status=status)
+
+    # ==================== MAIN DASHBOARD ENDPOINT ====================
+
+    @http.route(['/api/owner_dashboard/summary'], type='http', auth='none', cors='*', methods=['GET'], csrf=False)
+    def fetch_dashboard_summary(self, **kw):
+        """Main endpoint for Owner Dashboard - fetches all data from Odoo models.
+        The optional ``sections`` parameter (e.g. ``?sections=kpi,pos_summary``)
+        restricts the computation to the listed sections. ``from`` and ``to``
+        (YYYY-MM-DD, the year to date by default), ``company_ids`` and ``tz``
+        set the range of all the sections, ``months`` and ``granularity``
+        (day/week/month) shape the sales trend, ``periods`` and
+        ``by_journal`` the cashflow, and ``top`` the sales detail rankings.
+        With ``since`` set to the ``token`` of a previous response, only the
+        sections changed since then are returned."""
+        try:
+            sections = self._parse_dashboard_sections(kw.get('sections'))
+            options = self._parse_dashboard_options(kw)
+        except ValueError as e:
+            return self._make_dashboard_error(str(e))
+        if kw.get('since'):
+            return self._make_dashboard_delta_response(sections, options, kw['since'])
+        return self._make_dashboard_response(sections, options)
+
+    @http.route(['/api/owner_dashboard/<string:section>'], type='http', auth='none', cors='*', methods=['GET'], csrf=False)
+    def fetch_dashboard_section(self, section, **kw):
+        """Fetch a single Owner Dashboard section, e.g. /api/owner_dashboard/kpi,
+        taking the options and the ``since`` token of the summary endpoint"""
+        if section not in DASHBOARD_SECTION_BUILDERS:
+            return self._make_dashboard_error("Unknown dashboard section: %s" % section, status=404)
+        try:
+            options = self._parse_dashboard_options(kw)
+        except ValueError as e:
+            return self._make_dashboard_error(str(e))
+        if kw.get('since'):
+            return self._make_dashboard_delta_response((section,), options, kw['since'])
+        return self._make_dashboard_response((section,), options)
+
+    @http.route(['/api/owner_dashboard/low_stock'], type='http', auth='none', cors='*', methods=['GET'], csrf=False)
+    def fetch_low_stock(self, **kw):
+        """Paginated list of all products below their reorder point, most
+        depleted first (``?limit=50&offset=0``)"""
+        try:
+            limit = min(max(int(kw.get('limit', 50)), 1), LOW_STOCK_PAGE_MAX)
+            offset = max(int(kw.get('offset', 0)), 0)
+        except ValueError:
+            return self._make_dashboard_error("limit and offset must be integers")
+
+        try:
+            low_stock = self._get_low_stock(limit=limit, offset=offset)
+        except Exception as e:
+            _logger.error("Error in fetch_low_stock: %s", str(e))
+            return self._make_dashboard_error(str(e), status=500)
+
+        return self._make_json_response({
+            "status": "success",
+            "data": {
+                "total": low_stock['total'],
+                "limit": limit,
+                "offset": offset,
+                "items": low_stock['items']
+            }
+        })
+
+    @http.route(['/api/owner_dashboard/transactions'], type='http', auth='none', cors='*', methods=['GET'], csrf=False)
+    def fetch_transactions(self, **kw):
+        """Paginated feed of the posted invoices and paid POS orders, newest
+        first (``?limit=20``), the next page being read by passing the
+        ``next_cursor`` of a page as ``?before=``. The feed can be restricted
+        to ``company_ids`` and to the transactions up to ``to``."""
+        try:
+            limit = min(max(int(kw.get('limit', TRANSACTION_PAGE_DEFAULT)), 1), TRANSACTION_PAGE_MAX)
+        except ValueError:
+            return self._make_dashboard_error("limit must be an integer")
+        try:
+            before = self._decode_transaction_cursor(kw['before']) if kw.get('before') else None
+            dashboard_range = self._parse_dashboard_range(kw)
+        except ValueError as e:
+            return self._make_dashboard_error(str(e))
+
+        try:
+            page = self._get_transaction_page(limit, before=before, dashboard_range=dashboard_range)
+        except Exception as e:
+            _logger.error("Error in fetch_transactions: %s", str(e))
+            return self._make_dashboard_error(str(e), status=500)
+
+        return self._make_json_response({
+            "status": "success",
+            "data": {
+                "limit": limit,
+                "items": page['items'],
+                "next_cursor": page['next_cursor']
+            }
+        })
+
+    @http.route(['/api/owner_dashboard/live_token'], type='http', auth='none', methods=['POST'], csrf=False)
+    def issue_live_token(self, **kw):
+        """Issue a read-only token of the live events of a company, to give
+        to a dashboard front end (``client`` names it). The company is the
+        one of the API key user, or ``company_id`` when it is one of the
+        user's companies. Call it from a server or a terminal: the API key
+        must not reach browsers, while the token only opens the live
+        channel and is refused by the REST api. It is shown once."""
+        try:
+            company = self._get_api_key_company(kw.get('company_id'))
+        except PermissionError as e:
+            return self._make_dashboard_error(str(e), status=403)
+        except ValueError as e:
+            return self._make_dashboard_error(str(e))
+        token = request.env['owner.dashboard.live.token']._issue(
+            self._get_api_key_user(), company, kw.get('client') or 'dashboard')
+        return self._make_json_response({
+            "status": "success",
+            "data": {"company_id": company.id, "token": token}
+        })
+
+    @http.route(['/api/owner_dashboard/live'], type='http', auth='none', cors='*', methods=['GET'], csrf=False)
+    def fetch_live_channel(self, **kw):
+        """Bus channel publishing the live events of a company: subscribe
+        to it on the ``/websocket`` endpoint to receive a ``transaction`` row
+        for each posted invoice or paid POS order, and the ``pos_summary``
+        counter deltas of the POS orders. The company is the one of the
+        live token sent as bearer token (see ``/live_token``).
+        Subscribe from ``last``, the id of the latest bus notification, and
+        from the id of the last notification received when reconnecting, as
+        the bus replays the notifications after the id subscribed from and
+        the deltas would otherwise be applied twice."""
+        company = request.env['owner.dashboard.live.token']._get_company(self._get_request_live_token())
+        if not company:
+            return self._make_dashboard_error("A valid live token is required", status=403)
+        return self._make_json_response({
+            "status": "success",
+            "data": {
+                "channel": get_live_channel(request.env, company.id),
+                "event_type": LIVE_EVENT_TYPE,
+                "last": request.env['bus.bus'].sudo()._bus_last_id(),
+                "websocket": "/websocket"
+            }
+        })
+
+    @http.route(['/api/owner_dashboard/metrics'], type='http', auth='none', methods=['GET'], csrf=False)
+    def fetch_metrics(self, **kw):
+        """Cumulative timing, SQL query and row histograms of the dashboard
+        sections and of /send_request per model and method, in the
+        Prometheus text format. The figures cover the requests served by
+        the current worker process since it started. The API key is
+        required, unless ``rest_api_odoo.metrics_public`` is set for a
+        scraper on an internal network."""
+        metrics_public = request.env['ir.config_parameter'].sudo().get_param('rest_api_odoo.metrics_public', 'False')
+        if not str2bool(metrics_public, False) and not self._get_api_key_user():
+            return self._make_dashboard_error("A valid API key is required", status=403)
         return request.make_response(
-            json.dumps(dashboard_data, default=str),
-            headers=[('Content-Type', 'application/json')]
+            api_metrics.render(),
+            headers=[('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')]
         )
 
     # ==================== OTHER EXISTING ENDPOINTS ====================
 
-    def generate_response(self, method, model, rec_id):
+    def _get_allowed_methods(self, model_name):
+        """Get the methods the REST api allows on a model, None when the
+        model is not exposed. Served from the cached permission map."""
+        return request.env['connection.api'].sudo()._get_model_permissions().get(model_name)
+
+    def generate_response(self, method, model_name, rec_id):
         """Generate response based on request type and parameters"""
-        option = request.env['connection.api'].search([('model_id', '=', model)], limit=1)
-        model_name = option.model_id.model
+        allowed_methods = self._get_allowed_methods(model_name)
 
-        if not option:
+        if allowed_methods is None:
             return '<html><body><h2>No Record Created for the model</h2></body></html>'
 
         if method == 'GET':
-            if not option.is_get:
+            if method not in allowed_methods:
                 return '<html><body><h2>Method Not Allowed</h2></body></html>'
 
             fields_param = request.params.get('fields', '')
@@ -1008,59 +1854,333 @@ class RestApi(http.Controller):
 
             fields = [field.strip() for field in fields_param.split(',')]
 
-            try:
+            export_format = request.params.get('format', 'json')
+            if export_format in STREAM_FORMATS:
+                # Errors cannot be reported once the stream has started
+                unknown_fields = set(fields).difference(request.env[model_name]._fields)
+                if unknown_fields:
+                    return f'<html><body><h2>Error processing request: Invalid fields {", ".join(sorted(unknown_fields))}</h2></body></html>'
                 domain = [('id', '=', rec_id)] if rec_id != 0 else []
-                records = request.env[str(model_name)].search_read(domain=domain, fields=fields)
-
-                for record in records:
-                    for key, value in record.items():
-                        if isinstance(value, datetime):
-                            record[key] = value.isoformat()
+                return self._make_stream_response(model_name, fields, domain, export_format)
 
-                return request.make_response(json.dumps({'records': records}))
+            try:
+                Model = request.env[model_name]
+                version, last_modified = get_data_version(request.env, [model_name])
+                etag = make_etag(request.env.cr.dbname, request.env.uid, model_name, rec_id,
+                                 sorted(request.params.items()), version)
+                headers = self._get_validator_headers(etag, last_modified)
+                if request.httprequest.if_none_match.contains_weak(etag):
+                    return request.make_response('', headers=headers, status=304)
+
+                if rec_id != 0:
+                    records = Model.search_read(domain=[('id', '=', rec_id)], fields=fields)
+                    next_cursor = None
+                else:
+                    records, next_cursor = self._search_read_page(Model, fields)
+
+                return self._make_json_response({'records': records, 'next_cursor': next_cursor}, headers)
             except Exception as e:
                 return f'<html><body><h2>Error processing request: {str(e)}</h2></body></html>'
 
+        if method in ('POST', 'PUT', 'DELETE'):
+            if method not in allowed_methods:
+                return '<html><body><h2>Method Not Allowed</h2></body></html>'
+            try:
+                payload = json.loads(request.httprequest.get_data() or '{}')
+            except ValueError:
+                return '<html><body><h2>Invalid JSON body</h2></body></html>'
+
+            Model = request.env[model_name]
+            if method == 'POST':
+                # The body is {"values": ...} or directly the list of values
+                values = (payload.get('values') or []) if isinstance(payload, dict) else payload
+                return self._bulk_create(Model, [values] if isinstance(values, dict) else values)
+
+            if not isinstance(payload, dict):
+                return self._make_bulk_response({}, [{'index': None, 'item': None, 'error': "The body must be an object"}])
+            ids = payload.get('ids') or ([rec_id] if rec_id else [])
+            if not isinstance(ids, list) or not ids or not all(isinstance(record_id, int) for record_id in ids):
+                return '<html><body><h2>No record ids given</h2></body></html>'
+            if method == 'PUT':
+                values = payload.get('values') or {}
+                if not isinstance(values, dict):
+                    return self._make_bulk_response({}, [{'index': None, 'item': None, 'error': "values must be an object"}])
+                return self._bulk_write(Model, ids, values)
+            return self._bulk_unlink(Model, ids)
+
+    # ==================== BULK WRITE OPERATIONS ====================
+
+    def _run_batch(self, batch_operation, item_operation, items):
+        """Run a batch operation in a savepoint. When it fails, replay it
+        item by item to find which items fail, then roll all of them back.
+
+        :return: list of per-item errors, empty when the batch succeeded
+        """
+        cr = request.env.cr
+        try:
+            with cr.savepoint():
+                batch_operation()
+            return []
+        except Exception as batch_error:
+            errors = []
+            savepoint = cr.savepoint()
+            for index, item in enumerate(items):
+                try:
+                    with cr.savepoint():
+                        item_operation(item)
+                except Exception as e:
+                    errors.append({'index': index, 'item': item, 'error': str(e)})
+            savepoint.close(rollback=True)
+            # The items may only fail together, e.g. on a constraint
+            return errors or [{'index': None, 'item': None, 'error': str(batch_error)}]
+
+    def _make_bulk_response(self, result, errors):
+        """Build the JSON response of a bulk operation"""
+        if errors:
+            return self._make_json_response({'status': 'error', 'errors': errors}, status=400)
+        return self._make_json_response(dict(result, status='success'))
+
+    def _get_missing_record_errors(self, ids, records):
+        """Report the requested ids which do not match an existing record"""
+        existing_ids = set(records.ids)
+        return [
+            {'index': index, 'item': record_id, 'error': "Record does not exist"}
+            for index, record_id in enumerate(ids) if record_id not in existing_ids
+        ]
+
+    def _bulk_create(self, Model, vals_list):
+        """Create all records with a single ``create()`` call"""
+        if not isinstance(vals_list, list) or not vals_list or not all(isinstance(vals, dict) for vals in vals_list):
+            return self._make_bulk_response({}, [{'index': None, 'item': None, 'error': "values must be an object or a list of objects"}])
+        created = Model.browse()
+
+        def create_all():
+            nonlocal created
+            created = Model.create(vals_list)
+
+        errors = self._run_batch(create_all, Model.create, vals_list)
+        return self._make_bulk_response({'ids': created.ids}, errors)
+
+    def _bulk_write(self, Model, ids, values):
+        """Write the same values on all records with a single ``write()``"""
+        records = Model.browse(ids).exists()
+        errors = self._get_missing_record_errors(ids, records)
+        if not values:
+            errors.append({'index': None, 'item': None, 'error': "No values to write"})
+        if not errors:
+            errors = self._run_batch(
+                lambda: records.write(values),
+                lambda record_id: Model.browse(record_id).write(values),
+                ids)
+        return self._make_bulk_response({'ids': ids}, errors)
+
+    def _bulk_unlink(self, Model, ids):
+        """Delete all records with a single ``unlink()``"""
+        records = Model.browse(ids).exists()
+        errors = self._get_missing_record_errors(ids, records)
+        if not errors:
+            errors = self._run_batch(
+                records.unlink,
+                lambda record_id: Model.browse(record_id).unlink(),
+                ids)
+        return self._make_bulk_response({'ids': ids}, errors)
+
+    def _make_stream_response(self, model_name, fields, domain, export_format):
+        """Stream all matching records as NDJSON or CSV.
+
+        The records are read in batches of ``STREAM_BATCH_SIZE`` walking the
+        ids, in a dedicated cursor kept open while the response is being
+        sent, so the memory used does not depend on the number of records.
+        All batches see the same database snapshot.
+        """
+        registry = request.env.registry
+        uid = request.env.uid
+        context = dict(request.env.context)
+
+        def generate():
+            with registry.cursor() as cr:
+                Model = api.Environment(cr, uid, context)[model_name]
+                if export_format == 'csv':
+                    yield self._format_csv_rows([['id'] + [field for field in fields if field != 'id']])
+                last_id = 0
+                while True:
+                    records = Model.search_read(
+                        domain=domain + [('id', '>', last_id)], fields=fields,
+                        order='id', limit=STREAM_BATCH_SIZE)
+                    if not records:
+                        break
+                    last_id = records[-1]['id']
+                    if export_format == 'csv':
+                        yield self._format_csv_rows([
+                            [self._format_csv_value(record['id'])] +
+                            [self._format_csv_value(record[field]) for field in fields if field != 'id']
+                            for record in records
+                        ])
+                    else:
+                        yield ''.join(dumps(record) + '\n' for record in records)
+                    Model.env.invalidate_all()
+
+        content_type = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+        return self._make_encoded_response(generate(), [
+            ('Content-Type', '%s; charset=utf-8' % content_type),
+            ('Content-Disposition', 'attachment; filename="%s.%s"' % (model_name, export_format)),
+        ])
+
+    def _format_csv_value(self, value):
+        """Flatten a read value into a CSV cell: ids for relational fields,
+        empty for unset values"""
+        if value is False or value is None:
+            return ''
+        if isinstance(value, tuple):
+            return value[0]
+        if isinstance(value, list):
+            return ','.join(str(item) for item in value)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    def _format_csv_rows(self, rows):
+        """Render rows as a CSV text chunk"""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+
+    def _search_read_page(self, Model, fields):
+        """Read one page of records with keyset pagination.
+
+        The page is ordered by the ``order`` parameter (``field [asc|desc]``,
+        ``id asc`` by default) then by id, and starts after the record
+        designated by the opaque ``after`` cursor. Returns the records and
+        the cursor of the next page, None on the last page.
+        """
+        params = request.params
+        limit = min(max(int(params.get('limit') or GENERIC_PAGE_DEFAULT), 1), GENERIC_PAGE_MAX)
+        sort_field, direction = self._parse_keyset_order(Model, params.get('order'))
+        order = '%s %s NULLS LAST, id %s' % (sort_field, direction, direction)
+
+        domain = []
+        if params.get('after'):
+            domain = self._get_keyset_domain(
+                sort_field, direction, self._decode_cursor(params['after'], order))
+
+        read_fields = fields if sort_field in fields else fields + [sort_field]
+        records = Model.search_read(domain=domain, fields=read_fields, order=order, limit=limit + 1)
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = records[-1]
+            next_cursor = self._encode_cursor(order, last[sort_field], last['id'])
+        if sort_field not in fields:
+            for record in records:
+                record.pop(sort_field)
+        return records, next_cursor
+
+    def _parse_keyset_order(self, Model, order_param):
+        """Validate the ``order`` parameter, which must name a single stored
+        scalar field, and return the field name and direction"""
+        if not order_param:
+            return 'id', 'asc'
+        parts = order_param.split()
+        field = Model._fields.get(parts[0])
+        direction = parts[1].lower() if len(parts) > 1 else 'asc'
+        if (len(parts) > 2 or direction not in ('asc', 'desc') or not field or not field.store
+                or field.type not in KEYSET_ORDER_TYPES or getattr(field, 'translate', False)):
+            raise ValueError("Invalid order: %s" % order_param)
+        return field.name, direction
+
+    def _encode_cursor(self, order, value, record_id):
+        """Build the opaque cursor pointing after a record"""
+        if isinstance(value, datetime):
+            value = value.strftime(DEFAULT_SERVER_DATETIME_FORMAT)
+        elif isinstance(value, date):
+            value = value.strftime(DEFAULT_SERVER_DATE_FORMAT)
+        payload = json.dumps({'order': order, 'value': value, 'id': record_id})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def _decode_cursor(self, cursor, order):
+        """Decode a cursor built by ``_encode_cursor`` for the same order"""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except ValueError:
+            raise ValueError("Invalid cursor")
+        if payload.get('order') != order:
+            raise ValueError("The cursor does not match the requested order")
+        return payload['value'], payload['id']
+
+    def _get_keyset_domain(self, sort_field, direction, position):
+        """Domain of the records following ``position`` (sort value, id) in
+        the ``sort_field direction NULLS LAST, id direction`` order"""
+        value, record_id = position
+        operator = '>' if direction == 'asc' else '<'
+        if sort_field == 'id':
+            return [('id', operator, record_id)]
+        if value is None or value is False:
+            return [(sort_field, '=', False), ('id', operator, record_id)]
+        return [
+            '|', '|',
+            (sort_field, operator, value),
+            '&', (sort_field, '=', value), ('id', operator, record_id),
+            (sort_field, '=', False),
+        ]
+
     @http.route(['/send_request'], type='http', auth='none', cors='*',
                 methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'], csrf=False)
     def fetch_data(self, **kw):
         http_method = request.httprequest.method
         api_key = request.httprequest.headers.get('api-key')
-        auth_api = self.auth_api_key(api_key)
+        user_id = self._get_api_key_user_id(api_key)
+        if not user_id:
+            return self.auth_api_key(api_key)
         model = kw.get('model')
-        username = request.httprequest.headers.get('login')
-        password = request.httprequest.headers.get('password')
 
-        try:
-            request.session.authenticate(request.session.db, username, password)
-        except Exception:
-            return '<html><body><h2>Authentication failed</h2></body></html>'
+        # The API key identifies the user, no password verification needed
+        request.update_env(user=user_id)
 
-        model_id = request.env['ir.model'].search([('model', '=', model)])
-        if not model_id:
+        if model not in request.env:
             return '<html><body><h3>Invalid model</h3></body></html>'
 
-        if auth_api:
-            rec_id = int(kw.get('Id', 0))
-            return self.generate_response(http_method, model_id.id, rec_id)
-        return auth_api
+        rec_id = int(kw.get('Id', 0))
+        with measure_queries() as stats:
+            response = self.generate_response(http_method, model, rec_id)
+        api_metrics.observe('rest_api_request', (model, http_method), stats)
+        if not isinstance(response, str):
+            response.headers['Server-Timing'] = format_server_timing('request', stats)
+        return response
 
     @http.route(['/odoo_connect'], type='http', auth='none', csrf=False, methods=['GET'])
     def odoo_connect(self, **kw):
-        """Initialize API transaction by generating api-key"""
+        """Initialize API transaction by generating the api-key of a client
+        of the user, named by the ``client`` header (``default`` when
+        missing). The key is only shown when it is issued: call again with
+        ``?rotate=1`` to replace it by a new one.
+
+        The key alone then authenticates ``/send_request`` as the user, with
+        all the user's access rights and without second factor: issue one
+        key per client, so that a leaked key is revoked (from the user form)
+        without affecting the other clients."""
         username = request.httprequest.headers.get('login')
         password = request.httprequest.headers.get('password')
         db = request.httprequest.headers.get('db')
+        client = request.httprequest.headers.get('client')
 
         try:
             request.session.update(http.get_default_session(), db=db)
             auth = request.session.authenticate(request.session.db, username, password)
             user = request.env['res.users'].browse(auth)
-            api_key = request.env.user.generate_api(username)
-            return request.make_response(json.dumps({
+            api_key = request.env.user.generate_api(
+                username, rotate=str2bool(kw.get('rotate', ''), False), client=client)
+            if not api_key:
+                return self._make_json_response({
+                    "Status": "key already issued",
+                    "User": user.name,
+                    "message": "An API key was already issued to this client and is only shown "
+                               "once, use ?rotate=1 to replace it by a new one"
+                }, status=409)
+            return self._make_json_response({
                 "Status": "auth successful",
                 "User": user.name,
                 "api-key": api_key
-            }))
+            })
         except Exception:
             return '<html><body><h2>Wrong login credentials</h2></body></html>'
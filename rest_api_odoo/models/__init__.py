@@ -19,5 +19,11 @@
 #    If not, see <http://www.gnu.org/licenses/>.
 #
 #############################################################################
+from . import base
 from . import connection_api
+from . import owner_dashboard_daily_fact
+from . import owner_dashboard_fact_watermark
+from . import owner_dashboard_live_token
+from . import owner_dashboard_pos_counter
 from . import res_users
+from . import rest_api_key
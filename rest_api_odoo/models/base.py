@@ -0,0 +1,158 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+from odoo import api, models
+
+from ..tools.dashboard_cache import (
+    DASHBOARD_SECTIONS, WATCHED_MODELS, dashboard_cache, get_section_models)
+from ..tools.data_version import UNLINK_COUNTER_TABLE
+from .owner_dashboard_daily_fact import FACT_SOURCE_DATE_FIELDS
+from ..tools.live_events import (
+    INVOICE_MOVE_TYPES, LIVE_EVENT_STATES, LIVE_EVENT_TYPE,
+    format_invoice_transaction, format_pos_transaction, get_live_channel,
+    get_pos_summary_delta)
+
+
+class Base(models.AbstractModel):
+    """Invalidate the owner dashboard cache when watched models change,
+    count the deletions of the models the dashboard and the HTTP validators
+    of the REST api depend on, publish the live dashboard events of newly
+    posted invoices and paid POS orders, and keep the running POS counters
+    up to date. Remember the days the transactions feeding the daily
+    facts leave behind when moved or deleted."""
+    _inherit = 'base'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        if self._name in WATCHED_MODELS:
+            records._invalidate_owner_dashboard()
+        if self._name in LIVE_EVENT_STATES:
+            records._publish_owner_dashboard_events()
+        if self._name == 'pos.order':
+            states = LIVE_EVENT_STATES[self._name]
+            self.env['owner.dashboard.pos.counter'].sudo()._add_orders(
+                records.filtered(lambda record: record.state in states), 1)
+        return records
+
+    def write(self, vals):
+        if self._name in FACT_SOURCE_DATE_FIELDS:
+            self._mark_owner_dashboard_fact_days(vals)
+        if self._name in LIVE_EVENT_STATES and 'state' in vals:
+            # Records already in a published state before the write
+            states = LIVE_EVENT_STATES[self._name]
+            published = self.filtered(lambda record: record.state in states)
+        res = super().write(vals)
+        if self._name in WATCHED_MODELS:
+            self._invalidate_owner_dashboard(vals)
+        if self._name in LIVE_EVENT_STATES and 'state' in vals:
+            (self - published)._publish_owner_dashboard_events()
+            if self._name == 'pos.order':
+                counters = self.env['owner.dashboard.pos.counter'].sudo()
+                counters._add_orders((self - published).filtered(
+                    lambda record: record.state in states), 1)
+                counters._add_orders(published.filtered(
+                    lambda record: record.state not in states), -1)
+        return res
+
+    def unlink(self):
+        if self._name in FACT_SOURCE_DATE_FIELDS:
+            self._mark_owner_dashboard_fact_days()
+        if self._name in WATCHED_MODELS:
+            self._invalidate_owner_dashboard()
+        if self and self.env.registry.ready and self._is_owner_dashboard_versioned():
+            self._count_unlink()
+        return super().unlink()
+
+    def _mark_owner_dashboard_fact_days(self, fnames=None):
+        """Record the current days of the records for the refresh of the
+        daily facts, when their date is written (or they are deleted)"""
+        if not self or not self.env.registry.ready:
+            return
+        if fnames is not None and FACT_SOURCE_DATE_FIELDS[self._name] not in fnames:
+            return
+        self.env['owner.dashboard.daily.fact']._mark_changed_days(self)
+
+    def _is_owner_dashboard_versioned(self):
+        """Whether the data versions of the dashboard or the validators of
+        the REST api depend on this model"""
+        return (self._name in get_section_models(DASHBOARD_SECTIONS)
+                or self._name in self.env['connection.api'].sudo()._get_model_permissions())
+
+    def _count_unlink(self):
+        """Increment the deletion counter of this model just before the
+        current transaction is committed, so that the counter changes
+        together with the deletion and its row is only locked briefly"""
+        precommit = self.env.cr.precommit
+        model_names = precommit.data.get('rest_api_odoo.unlinked_models')
+        if model_names is None:
+            model_names = precommit.data['rest_api_odoo.unlinked_models'] = set()
+            cr = self.env.cr
+
+            @precommit.add
+            def count_unlinks():
+                cr.execute(f"""
+                    INSERT INTO {UNLINK_COUNTER_TABLE} (model, counter)
+                    SELECT model, 1 FROM unnest(%s) AS model ORDER BY model
+                    ON CONFLICT (model) DO UPDATE SET counter = {UNLINK_COUNTER_TABLE}.counter + 1
+                """, [sorted(model_names)])
+        model_names.add(self._name)
+
+    def _publish_owner_dashboard_events(self):
+        """Send a live event on the bus channel of their company for each
+        record which has just entered a published state, carrying the new
+        recent transaction row and, for POS orders, the counter deltas of
+        the POS summary. The bus delivers the events once the transaction
+        is committed, to all the dashboards listening at once."""
+        states = LIVE_EVENT_STATES[self._name]
+        notifications = []
+        for record in self:
+            if record.state not in states:
+                continue
+            if self._name == 'account.move':
+                if record.move_type not in INVOICE_MOVE_TYPES:
+                    continue
+                event = {'transaction': format_invoice_transaction(record)}
+            else:
+                event = {
+                    'transaction': format_pos_transaction(record),
+                    'pos_summary': get_pos_summary_delta(record),
+                }
+            notifications.append((get_live_channel(self.env, record.company_id.id), LIVE_EVENT_TYPE, event))
+        if notifications:
+            self.env['bus.bus'].sudo()._sendmany(notifications)
+
+    def _invalidate_owner_dashboard(self, fnames=None):
+        """Drop the cached dashboard sections depending on this model once
+        the current transaction is committed"""
+        watched = WATCHED_MODELS[self._name]
+        if fnames is not None and not watched['fields'].intersection(fnames):
+            return
+        postcommit = self.env.cr.postcommit
+        sections = postcommit.data.get('rest_api_odoo.dashboard_sections')
+        if sections is None:
+            sections = postcommit.data['rest_api_odoo.dashboard_sections'] = set()
+            dbname = self.env.cr.dbname
+
+            @postcommit.add
+            def invalidate_dashboard_cache():
+                dashboard_cache.invalidate(dbname, sections)
+        sections.update(watched['sections'])
@@ -19,7 +19,60 @@
 #    If not, see <http://www.gnu.org/licenses/>.
 #
 #############################################################################
-from odoo import fields, models
+import logging
+import threading
+
+import psycopg2
+
+from odoo import api, fields, models, tools
+from odoo.tools import sql
+
+_logger = logging.getLogger(__name__)
+
+# Fields the cached model permissions are read from
+PERMISSION_FIELDS = {'model_id', 'is_get', 'is_post', 'is_put', 'is_delete'}
+
+
+def _is_index_valid(cr, index_name):
+    """Whether an index is usable, None when it does not exist. An index is
+    left invalid by a concurrent build which failed or was interrupted."""
+    cr.execute("""
+        SELECT idx.indisvalid
+          FROM pg_index idx
+          JOIN pg_class cls ON cls.oid = idx.indexrelid
+         WHERE cls.relname = %s
+    """, [index_name])
+    row = cr.fetchone()
+    return row[0] if row else None
+
+
+def _create_write_date_indexes(registry, tables):
+    """Build the missing or invalid write date indexes of ``tables`` with
+    CREATE INDEX CONCURRENTLY, which cannot run inside a transaction"""
+    with registry.cursor() as cr:
+        cr._cnx.autocommit = True
+        try:
+            for table in tables:
+                index_name = sql.make_index_name(table, 'write_date')
+                # Only one build of an index at a time, an index being built
+                # by another thread being invalid until it is done
+                cr.execute("SELECT pg_try_advisory_lock(hashtext(%s))", [index_name])
+                if not cr.fetchone()[0]:
+                    continue
+                try:
+                    valid = _is_index_valid(cr, index_name)
+                    if valid:
+                        continue
+                    if valid is False:
+                        cr.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+                    cr.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{index_name}" '
+                               f'ON "{table}" (write_date)')
+                except psycopg2.Error as e:
+                    _logger.warning("Could not index the write date of %s: %s", table, e)
+                finally:
+                    cr.execute("SELECT pg_advisory_unlock(hashtext(%s))", [index_name])
+        finally:
+            cr._cnx.autocommit = False
 
 
 class ConnectionApi(models.Model):
@@ -44,3 +97,82 @@ class ConnectionApi(models.Model):
     is_delete = fields.Boolean(string='DELETE',
                                help="Select this to enable DELETE method "
                                     "while sending requests.")
+
+    def init(self):
+        self.search([])._index_write_date()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._index_write_date(concurrently=True)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'model_id' in vals:
+            self._index_write_date(concurrently=True)
+        if PERMISSION_FIELDS.intersection(vals):
+            self.env.registry.clear_cache()
+        return res
+
+    def _index_write_date(self, concurrently=False):
+        """Index the write date of the exposed models, from which the
+        validators (ETag) of their GET responses are derived. An index left
+        invalid by an interrupted concurrent build is built again.
+
+        With ``concurrently``, the indexes are built with CREATE INDEX
+        CONCURRENTLY by a background thread started once the current
+        transaction is committed, so that saving an api record neither
+        waits for the build nor blocks the writes on the table meanwhile.
+        """
+        tables = []
+        for model_name in set(self.mapped('model_id.model')):
+            if model_name not in self.env:
+                continue
+            model = self.env[model_name]
+            if model._auto and not model._abstract and model._log_access:
+                tables.append(model._table)
+        if not concurrently:
+            for table in tables:
+                index_name = sql.make_index_name(table, 'write_date')
+                if _is_index_valid(self.env.cr, index_name) is False:
+                    self.env.cr.execute(f'DROP INDEX "{index_name}"')
+                sql.create_index(self.env.cr, index_name, table, ['write_date'])
+            return
+        if not tables:
+            return
+        registry = self.env.registry
+
+        @self.env.cr.postcommit.add
+        def start_indexing():
+            threading.Thread(
+                target=_create_write_date_indexes, args=(registry, tables),
+                name='rest_api_odoo.index_write_date', daemon=True,
+            ).start()
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+    @api.model
+    @tools.ormcache()
+    def _get_model_permissions(self):
+        """Map each model exposed to the REST api to the frozenset of its
+        allowed methods. Cached per registry, and cleared whenever api
+        records are created, deleted or their model or methods change."""
+        permissions = {}
+        for option in self.sudo().search([]):
+            model_name = option.model_id.model
+            if model_name in permissions:
+                continue
+            permissions[model_name] = frozenset(
+                method for method, allowed in (
+                    ('GET', option.is_get),
+                    ('POST', option.is_post),
+                    ('PUT', option.is_put),
+                    ('DELETE', option.is_delete),
+                ) if allowed
+            )
+        return permissions
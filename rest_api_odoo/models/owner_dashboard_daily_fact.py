@@ -0,0 +1,411 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+import pytz
+
+from odoo import api, fields, models
+from odoo.tools import sql
+
+from ..tools.data_version import UNLINK_COUNTER_TABLE
+
+# Measures stored on each daily fact row
+FACT_MEASURES = [
+    'sale_revenue', 'sale_orders', 'pos_revenue', 'pos_tickets',
+    'cash_in', 'cash_out', 'income', 'expense', 'expense_depreciation',
+    'expense_direct_cost',
+]
+
+# Date field of the transaction models feeding the fact table, the days
+# of the old values being refreshed when it changes or records are deleted
+FACT_SOURCE_DATE_FIELDS = {
+    'sale.order': 'date_order',
+    'pos.order': 'date_order',
+    'account.move': 'date',
+    'account.move.line': 'date',
+}
+
+# Table of the days left behind by the transactions moved or deleted since
+# the last refresh
+CHANGED_DAY_TABLE = 'owner_dashboard_fact_changed_day'
+
+# Largest number of days refreshed at once
+REFRESH_SLICE_DAYS = 31
+
+# Overlap applied to the watermark so that transactions committed while
+# the previous run was in progress are picked up by the next one
+WATERMARK_OVERLAP = timedelta(minutes=10)
+
+
+class OwnerDashboardDailyFact(models.Model):
+    """Pre-aggregated daily sales, POS and ledger figures per company, used
+    by the owner dashboard instead of rescanning the transaction tables"""
+    _name = 'owner.dashboard.daily.fact'
+    _description = 'Owner Dashboard Daily Fact'
+    _order = 'date desc, company_id'
+
+    date = fields.Date(string="Date", required=True, index=True)
+    company_id = fields.Many2one('res.company', string="Company",
+                                 required=True, index=True,
+                                 ondelete='cascade')
+    sale_revenue = fields.Float(string="Sales Revenue",
+                                help="Total of confirmed sale orders.")
+    sale_orders = fields.Integer(string="Sale Orders",
+                                 help="Number of confirmed sale orders.")
+    pos_revenue = fields.Float(string="POS Revenue",
+                               help="Total of paid POS orders.")
+    pos_tickets = fields.Integer(string="POS Tickets",
+                                 help="Number of paid POS orders.")
+    cash_in = fields.Float(string="Cash In",
+                           help="Credit posted on income accounts.")
+    cash_out = fields.Float(string="Cash Out",
+                            help="Debit posted on expense accounts.")
+    income = fields.Float(string="Income",
+                          help="Balance posted on income accounts.")
+    expense = fields.Float(string="Operating Expenses",
+                           help="Balance posted on expense accounts.")
+    expense_depreciation = fields.Float(
+        string="Depreciation",
+        help="Balance posted on depreciation accounts.")
+    expense_direct_cost = fields.Float(
+        string="Cost of Revenue",
+        help="Balance posted on direct cost accounts.")
+
+    _sql_constraints = [
+        ('date_company_uniq', 'unique(date, company_id)',
+         "Only one fact row is allowed per day and company."),
+    ]
+
+    def init(self):
+        """Set up the change tracking used by the incremental refresh and
+        the HTTP validators: write date indexes on the source tables and
+        the deletion counters"""
+        for table in ('account_move', 'account_move_line', 'sale_order',
+                      'pos_order', 'stock_quant', 'stock_picking',
+                      'stock_warehouse_orderpoint', 'purchase_order'):
+            if sql.table_exists(self.env.cr, table):
+                sql.create_index(self.env.cr, sql.make_index_name(table, 'write_date'),
+                                 table, ['write_date'])
+        self.env.cr.execute(f"""
+            CREATE TABLE IF NOT EXISTS {UNLINK_COUNTER_TABLE} (
+                model varchar PRIMARY KEY,
+                counter bigint NOT NULL DEFAULT 0
+            )
+        """)
+        self.env.cr.execute(f"""
+            CREATE TABLE IF NOT EXISTS {CHANGED_DAY_TABLE} (
+                day date PRIMARY KEY,
+                marked_at timestamp NOT NULL
+            )
+        """)
+        self.env.cr.execute("DROP SEQUENCE IF EXISTS rest_api_odoo_unlink_seq")
+
+    @api.model
+    def _get_fact_timezone(self):
+        """Timezone in which the days of the fact table are cut"""
+        tz = self.env['ir.config_parameter'].sudo().get_param(
+            'rest_api_odoo.dashboard_tz') or 'UTC'
+        return tz if tz in pytz.all_timezones_set else 'UTC'
+
+    @api.model
+    def _get_utc_bounds(self, date_from, date_to, tz):
+        """Naive UTC datetimes bounding the local days [date_from, date_to]"""
+        local_tz = pytz.timezone(tz)
+        start = local_tz.localize(datetime.combine(date_from, time.min))
+        stop = local_tz.localize(datetime.combine(date_to + timedelta(days=1), time.min))
+        return (start.astimezone(pytz.utc).replace(tzinfo=None),
+                stop.astimezone(pytz.utc).replace(tzinfo=None))
+
+    @api.model
+    def _flush_sources(self):
+        """Flush the pending updates of the models read by raw SQL"""
+        for model in list(FACT_SOURCE_DATE_FIELDS) + ['account.account']:
+            if model in self.env:
+                self.env[model].flush_model()
+
+    @api.model
+    def _compute_facts(self, date_from, date_to, tz=None, company_ids=None):
+        """Aggregate the transaction tables into daily figures, cutting the
+        days in ``tz`` (the fact table timezone by default), of the given
+        companies (all when None)
+
+        :return: dict mapping (company_id, date) to a dict of measures
+        """
+        self._flush_sources()
+        tz = tz or self._get_fact_timezone()
+        start, stop = self._get_utc_bounds(date_from, date_to, tz)
+        facts = defaultdict(lambda: dict.fromkeys(FACT_MEASURES, 0))
+        cr = self.env.cr
+        company_sql = line_company_sql = ''
+        company_params = ()
+        if company_ids:
+            company_sql = 'AND company_id IN %s'
+            line_company_sql = 'AND aml.company_id IN %s'
+            company_params = (tuple(company_ids),)
+
+        sources = []
+        if 'sale.order' in self.env:
+            sources.append(('sale_order', ('sale', 'done'), 'sale_revenue', 'sale_orders'))
+        if 'pos.order' in self.env:
+            sources.append(('pos_order', ('paid', 'done', 'invoiced'), 'pos_revenue', 'pos_tickets'))
+        for table, states, revenue_key, count_key in sources:
+            cr.execute(f"""
+                SELECT company_id,
+                       (date_order AT TIME ZONE 'UTC' AT TIME ZONE %s)::date,
+                       SUM(amount_total), COUNT(*)
+                  FROM {table}
+                 WHERE state IN %s AND date_order >= %s AND date_order < %s
+                       {company_sql}
+              GROUP BY 1, 2
+            """, (tz, states, start, stop) + company_params)
+            for company_id, day, revenue, count in cr.fetchall():
+                facts[(company_id, day)][revenue_key] = float(revenue or 0)
+                facts[(company_id, day)][count_key] = count
+
+        cr.execute(f"""
+            SELECT aml.company_id, aml.date,
+                   SUM(CASE WHEN acc.account_type IN ('income', 'income_other')
+                            THEN aml.credit ELSE 0 END),
+                   SUM(CASE WHEN acc.account_type LIKE 'expense%%'
+                            THEN aml.debit ELSE 0 END),
+                   SUM(CASE WHEN acc.account_type IN ('income', 'income_other')
+                            THEN -aml.balance ELSE 0 END),
+                   SUM(CASE WHEN acc.account_type = 'expense'
+                            THEN aml.balance ELSE 0 END),
+                   SUM(CASE WHEN acc.account_type = 'expense_depreciation'
+                            THEN aml.balance ELSE 0 END),
+                   SUM(CASE WHEN acc.account_type = 'expense_direct_cost'
+                            THEN aml.balance ELSE 0 END)
+              FROM account_move_line aml
+              JOIN account_account acc ON acc.id = aml.account_id
+             WHERE aml.parent_state = 'posted'
+               AND aml.date >= %s AND aml.date <= %s
+               AND (acc.account_type IN ('income', 'income_other')
+                    OR acc.account_type LIKE 'expense%%')
+                   {line_company_sql}
+          GROUP BY 1, 2
+        """, (date_from, date_to) + company_params)
+        for row in cr.fetchall():
+            values = facts[(row[0], row[1])]
+            (values['cash_in'], values['cash_out'], values['income'],
+             values['expense'], values['expense_depreciation'],
+             values['expense_direct_cost']) = (float(amount or 0) for amount in row[2:])
+        return facts
+
+    @api.model
+    def _refresh_facts(self, date_from, date_to):
+        """Recompute and replace the fact rows of the days [date_from, date_to]"""
+        self.search([('date', '>=', date_from), ('date', '<=', date_to)]).unlink()
+        facts = self._compute_facts(date_from, date_to)
+        self.create([
+            dict(values, company_id=company_id, date=day)
+            for (company_id, day), values in facts.items()
+        ])
+
+    @api.model
+    def _refresh_days(self, days):
+        """Refresh the fact rows of the given days, by runs of consecutive
+        days of at most ``REFRESH_SLICE_DAYS`` days, flushing and emptying
+        the cache after each run to keep the memory bounded"""
+        runs = []
+        for day in sorted(days):
+            if runs and day == runs[-1][1] + timedelta(days=1) \
+                    and (day - runs[-1][0]).days < REFRESH_SLICE_DAYS:
+                runs[-1][1] = day
+            else:
+                runs.append([day, day])
+        for date_from, date_to in runs:
+            self._refresh_facts(date_from, date_to)
+            self.env.flush_all()
+            self.env.invalidate_all()
+
+    @api.model
+    def _get_first_transaction_date(self):
+        """Date of the oldest transaction feeding the fact table"""
+        self._flush_sources()
+        cr = self.env.cr
+        tz = self._get_fact_timezone()
+        dates = []
+        for model, table in (('sale.order', 'sale_order'), ('pos.order', 'pos_order')):
+            if model in self.env:
+                cr.execute(f"SELECT MIN(date_order AT TIME ZONE 'UTC' AT TIME ZONE %s)::date FROM {table}",
+                           (tz,))
+                dates.append(cr.fetchone()[0])
+        cr.execute("SELECT MIN(date) FROM account_move_line WHERE parent_state = 'posted'")
+        dates.append(cr.fetchone()[0])
+        dates = [day for day in dates if day]
+        return min(dates) if dates else None
+
+    @api.model
+    def _get_changed_days(self, since):
+        """Days touched by a transaction written after ``since``, or left
+        behind by a transaction moved to another day or deleted
+
+        :return: set of dates
+        """
+        self._flush_sources()
+        cr = self.env.cr
+        tz = self._get_fact_timezone()
+        days = set()
+        for model, table in (('sale.order', 'sale_order'), ('pos.order', 'pos_order')):
+            if model in self.env:
+                cr.execute(f"""
+                    SELECT DISTINCT (date_order AT TIME ZONE 'UTC' AT TIME ZONE %s)::date
+                      FROM {table}
+                     WHERE write_date > %s
+                """, (tz, since))
+                days.update(day for day, in cr.fetchall())
+        cr.execute(f"""
+            SELECT date FROM account_move_line WHERE write_date > %s
+             UNION
+            SELECT date FROM account_move WHERE write_date > %s
+             UNION
+            SELECT day FROM {CHANGED_DAY_TABLE}
+        """, (since, since))
+        days.update(day for day, in cr.fetchall())
+        days.discard(None)
+        return days
+
+    @api.model
+    def _mark_changed_days(self, records):
+        """Remember the days of ``records`` before their date changes or
+        they are deleted, for the next refresh to recompute them. The days
+        are recorded just before the transaction is committed, to only lock
+        their rows briefly."""
+        date_field = FACT_SOURCE_DATE_FIELDS[records._name]
+        tz = pytz.timezone(self._get_fact_timezone())
+        days = set()
+        for value in records.sudo().mapped(date_field):
+            if isinstance(value, datetime):
+                value = value.replace(tzinfo=pytz.utc).astimezone(tz).date()
+            if value:
+                days.add(value)
+        if not days:
+            return
+        precommit = self.env.cr.precommit
+        changed_days = precommit.data.get('rest_api_odoo.fact_changed_days')
+        if changed_days is None:
+            changed_days = precommit.data['rest_api_odoo.fact_changed_days'] = set()
+            cr = self.env.cr
+
+            @precommit.add
+            def mark_changed_days():
+                cr.execute(f"""
+                    INSERT INTO {CHANGED_DAY_TABLE} (day, marked_at)
+                    SELECT day, clock_timestamp() AT TIME ZONE 'UTC'
+                      FROM unnest(%s::date[]) AS day ORDER BY day
+                    ON CONFLICT (day) DO UPDATE SET marked_at = EXCLUDED.marked_at
+                """, [sorted(changed_days)])
+        changed_days.update(days)
+
+    @api.model
+    def _clear_changed_days(self):
+        """Forget the changed days read by the current transaction. Rows
+        committed since its snapshot are not visible to the deletion, and
+        rows marked again since conflict with it, so no day is lost."""
+        self.env.cr.execute(f"DELETE FROM {CHANGED_DAY_TABLE}")
+
+    @api.model
+    def _get_local_today(self):
+        """Current date in the fact table timezone"""
+        tz = pytz.timezone(self._get_fact_timezone())
+        return fields.Datetime.now().replace(tzinfo=pytz.utc).astimezone(tz).date()
+
+    @api.model
+    def _set_watermark(self, value):
+        self.env['owner.dashboard.fact.watermark'].sudo()._set_value(value)
+
+    @api.model
+    def _get_watermark(self):
+        return self.env['owner.dashboard.fact.watermark'].sudo()._get_value()
+
+    @api.model
+    def _rebuild_facts(self):
+        """Full backfill: rebuild the whole fact table month by month"""
+        run_start = self.env.cr.now()
+        self.search([]).unlink()
+        self._clear_changed_days()
+        first_date = self._get_first_transaction_date()
+        today = self._get_local_today()
+        if first_date:
+            date_from = first_date
+            while date_from <= today:
+                date_to = min(date_from + timedelta(days=REFRESH_SLICE_DAYS - 1), today)
+                self._refresh_facts(date_from, date_to)
+                self.env.flush_all()
+                self.env.invalidate_all()
+                date_from = date_to + timedelta(days=1)
+        self._set_watermark(run_start)
+        return True
+
+    @api.model
+    def _cron_update_facts(self):
+        """Incrementally refresh the days touched since the last run"""
+        watermark = self._get_watermark()
+        if not watermark:
+            return self._rebuild_facts()
+        run_start = self.env.cr.now()
+        self._refresh_days(self._get_changed_days(watermark - WATERMARK_OVERLAP))
+        self._clear_changed_days()
+        self._set_watermark(run_start)
+        return True
+
+    @api.model
+    def _get_coverage_end(self):
+        """Last day fully covered by the fact table, None if never built"""
+        watermark = self._get_watermark()
+        if not watermark:
+            return None
+        tz = pytz.timezone(self._get_fact_timezone())
+        return watermark.replace(tzinfo=pytz.utc).astimezone(tz).date() - timedelta(days=1)
+
+    @api.model
+    def _get_daily_totals(self, date_from, date_to, tz=None, company_ids=None):
+        """Daily figures of the given companies (all when None) for the
+        days [date_from, date_to]
+
+        Days covered by the fact table are read from it, the remaining
+        recent days are aggregated on the fly from the transaction tables.
+        When ``tz`` differs from the fact table timezone the stored days do
+        not match, and the whole range is aggregated on the fly.
+
+        :return: dict mapping each date with activity to a dict of measures
+        """
+        totals = defaultdict(lambda: dict.fromkeys(FACT_MEASURES, 0))
+        fact_tz = self._get_fact_timezone()
+        coverage_end = self._get_coverage_end() if tz in (None, fact_tz) else None
+        live_from = date_from
+        if coverage_end and date_from <= coverage_end:
+            domain = [('date', '>=', date_from), ('date', '<=', min(date_to, coverage_end))]
+            if company_ids:
+                domain.append(('company_id', 'in', list(company_ids)))
+            stored = self.search_read(domain, ['date'] + FACT_MEASURES)
+            for fact in stored:
+                for measure in FACT_MEASURES:
+                    totals[fact['date']][measure] += fact[measure]
+            live_from = coverage_end + timedelta(days=1)
+        if live_from <= date_to:
+            for (company_id, day), values in self._compute_facts(live_from, date_to, tz, company_ids).items():
+                for measure in FACT_MEASURES:
+                    totals[day][measure] += values[measure]
+        return totals
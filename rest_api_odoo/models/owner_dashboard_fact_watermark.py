@@ -0,0 +1,62 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+from odoo import api, fields, models
+
+# Configuration parameter holding the watermark in previous versions
+LEGACY_WATERMARK_PARAM = 'rest_api_odoo.daily_fact_watermark'
+
+
+class OwnerDashboardFactWatermark(models.Model):
+    """Time of the last refresh of the daily facts, in a single row. Kept
+    out of the configuration parameters, whose every change clears the
+    caches of all the worker processes."""
+    _name = 'owner.dashboard.fact.watermark'
+    _description = 'Owner Dashboard Fact Watermark'
+
+    value = fields.Datetime(string="Refreshed Until", required=True,
+                            help="Transactions written before this time "
+                                 "are aggregated in the daily facts.")
+
+    def init(self):
+        """Move the watermark stored by previous versions to its row"""
+        cr = self.env.cr
+        cr.execute("SELECT value FROM ir_config_parameter WHERE key = %s", [LEGACY_WATERMARK_PARAM])
+        row = cr.fetchone()
+        if row:
+            cr.execute(f"""
+                INSERT INTO {self._table} (value, create_date, write_date)
+                SELECT %s, NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC'
+                 WHERE NOT EXISTS (SELECT 1 FROM {self._table})
+            """, [row[0]])
+            cr.execute("DELETE FROM ir_config_parameter WHERE key = %s", [LEGACY_WATERMARK_PARAM])
+
+    @api.model
+    def _get_value(self):
+        return self.search([], limit=1).value or None
+
+    @api.model
+    def _set_value(self, value):
+        watermark = self.search([], limit=1)
+        if watermark:
+            watermark.value = value
+        else:
+            self.create({'value': value})
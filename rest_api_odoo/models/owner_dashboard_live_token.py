@@ -0,0 +1,78 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import uuid
+
+from odoo import api, fields, models
+
+from ..tools.api_key_cache import hash_api_key
+
+
+class OwnerDashboardLiveToken(models.Model):
+    """Read-only token of a dashboard front end, only granting the live
+    event channel of one company. Unlike the api keys it can be shipped to
+    browsers: the REST api does not accept it. Only its digest is stored."""
+    _name = 'owner.dashboard.live.token'
+    _description = 'Owner Dashboard Live Token'
+    _order = 'company_id, name'
+
+    name = fields.Char(string="Client", required=True,
+                       help="Dashboard front end using the token.")
+    company_id = fields.Many2one('res.company', string="Company",
+                                 required=True, index=True,
+                                 ondelete='cascade')
+    user_id = fields.Many2one('res.users', string="Issued By",
+                              index=True, ondelete='cascade')
+    token_hash = fields.Char(string="Token Digest", required=True,
+                             readonly=True, index=True, copy=False)
+
+    _sql_constraints = [
+        ('token_hash_uniq', 'unique(token_hash)',
+         "A live token digest must be unique."),
+    ]
+
+    @api.model
+    def _issue(self, user, company, client):
+        """Issue a new token of the live channel of ``company``
+
+        :return: the token, only shown this once
+        """
+        token = uuid.uuid4().hex
+        self.sudo().create({
+            'name': client,
+            'company_id': company.id,
+            'user_id': user.id,
+            'token_hash': hash_api_key(token),
+        })
+        return token
+
+    @api.model
+    def _get_company(self, token):
+        """Company of the live channel of a token, None when invalid"""
+        if not token:
+            return None
+        live_token = self.sudo().search([('token_hash', '=', hash_api_key(token))], limit=1)
+        return live_token.company_id or None
+
+    def action_revoke(self):
+        """Revoke the tokens: the dashboards using them stop receiving the
+        live events after their next reconnection"""
+        self.unlink()
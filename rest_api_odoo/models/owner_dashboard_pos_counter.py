@@ -0,0 +1,301 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+import pytz
+
+from odoo import api, fields, models
+from odoo.tools import float_is_zero
+
+from ..tools.live_events import POS_PAID_STATES
+
+_logger = logging.getLogger(__name__)
+
+# Running counters of each period, as (period start field, tickets, revenue)
+COUNTER_PERIODS = [
+    ('day', 'day_tickets', 'day_revenue'),
+    ('week_start', 'week_tickets', 'week_revenue'),
+    ('month_start', 'month_tickets', 'month_revenue'),
+]
+
+
+class OwnerDashboardPosCounter(models.Model):
+    """Running POS ticket counts and revenue of the current day, ISO week
+    and month per company and POS configuration, maintained as the orders
+    get paid so that the POS summary is read without scanning the orders"""
+    _name = 'owner.dashboard.pos.counter'
+    _description = 'Owner Dashboard POS Counter'
+    _order = 'company_id, config_id'
+
+    company_id = fields.Many2one('res.company', string="Company",
+                                 required=True, index=True,
+                                 ondelete='cascade')
+    config_id = fields.Integer(string="POS Configuration", required=True,
+                               help="Id of the POS configuration, the Point "
+                                    "of Sale application being optional.")
+    day = fields.Date(string="Day", required=True)
+    day_tickets = fields.Integer(string="Tickets of the Day")
+    day_revenue = fields.Float(string="Revenue of the Day")
+    week_start = fields.Date(string="Week Start", required=True)
+    week_tickets = fields.Integer(string="Tickets of the Week")
+    week_revenue = fields.Float(string="Revenue of the Week")
+    month_start = fields.Date(string="Month Start", required=True)
+    month_tickets = fields.Integer(string="Tickets of the Month")
+    month_revenue = fields.Float(string="Revenue of the Month")
+
+    _sql_constraints = [
+        ('company_config_uniq', 'unique(company_id, config_id)',
+         "Only one counter row is allowed per company and POS configuration."),
+    ]
+
+    def init(self):
+        """Seed the counters from the POS orders on install and upgrade"""
+        self._cron_reconcile_counters()
+
+    @api.model
+    def _get_periods(self):
+        """Current day, week start and month start in the dashboard timezone"""
+        today = self.env['owner.dashboard.daily.fact']._get_local_today()
+        return {
+            'day': today,
+            'week_start': today - timedelta(days=today.weekday()),
+            'month_start': today.replace(day=1),
+        }
+
+    @api.model
+    def _get_local_date(self, value):
+        """Day of the dashboard timezone of a UTC datetime"""
+        tz = pytz.timezone(self.env['owner.dashboard.daily.fact']._get_fact_timezone())
+        return pytz.utc.localize(value).astimezone(tz).date()
+
+    @api.model
+    def _get_empty_counters(self):
+        """Counter values per (company id, config id), zero by default"""
+        return defaultdict(lambda: dict.fromkeys(
+            [field for period in COUNTER_PERIODS for field in period[1:]], 0))
+
+    @api.model
+    def _compute_counters(self, periods, keys=None):
+        """Count and total the paid POS orders of the current periods from
+        the order table
+
+        :param keys: restrict to these (company id, config id) pairs
+        :return: dict mapping (company id, config id) to counter values
+        """
+        Fact = self.env['owner.dashboard.daily.fact']
+        tz = Fact._get_fact_timezone()
+        start, stop = Fact._get_utc_bounds(
+            min(periods['week_start'], periods['month_start']), periods['day'], tz)
+        self.env['pos.order'].flush_model(['state', 'amount_total', 'date_order', 'company_id', 'session_id'])
+        self.env['pos.session'].flush_model(['config_id'])
+        keys_sql, keys_params = '', ()
+        if keys is not None:
+            if not keys:
+                return self._get_empty_counters()
+            keys_sql = 'AND (po.company_id, ps.config_id) IN %s'
+            keys_params = (tuple(keys),)
+        cr = self.env.cr
+        cr.execute(f"""
+            SELECT po.company_id, ps.config_id,
+                   (po.date_order AT TIME ZONE 'UTC' AT TIME ZONE %s)::date,
+                   COUNT(*), SUM(po.amount_total)
+              FROM pos_order po
+              JOIN pos_session ps ON ps.id = po.session_id
+             WHERE po.state IN %s AND po.date_order >= %s AND po.date_order < %s
+                   {keys_sql}
+          GROUP BY 1, 2, 3
+        """, (tz, POS_PAID_STATES, start, stop) + keys_params)
+        counters = self._get_empty_counters()
+        for company_id, config_id, day, tickets, revenue in cr.fetchall():
+            for period_field, tickets_field, revenue_field in COUNTER_PERIODS:
+                if day >= periods[period_field]:
+                    counters[(company_id, config_id)][tickets_field] += tickets
+                    counters[(company_id, config_id)][revenue_field] += float(revenue or 0)
+        return counters
+
+    @api.model
+    def _add_orders(self, orders, sign):
+        """Add (sign 1) or remove (sign -1) orders entering or leaving the
+        paid states to the counters, within the current transaction. The
+        counters of a period which is over are reset on the fly."""
+        if not orders:
+            return
+        periods = self._get_periods()
+        deltas = defaultdict(lambda: defaultdict(float))
+        for order in orders:
+            day = self._get_local_date(order.date_order)
+            key = (order.company_id.id, order.session_id.config_id.id)
+            for period_field, tickets_field, revenue_field in COUNTER_PERIODS:
+                if periods[period_field] <= day <= periods['day']:
+                    deltas[key][tickets_field] += sign
+                    deltas[key][revenue_field] += sign * order.amount_total
+
+        cr = self.env.cr
+        missing = {}
+        for (company_id, config_id), delta in deltas.items():
+            assignments, params = self._get_delta_assignments(periods, delta)
+            cr.execute(f"""
+                UPDATE owner_dashboard_pos_counter
+                   SET {', '.join(assignments)}
+                 WHERE company_id = %s AND config_id = %s
+            """, params + [company_id, config_id])
+            if not cr.rowcount:
+                missing[(company_id, config_id)] = delta
+        if missing:
+            # New counters start from the orders, these ones included. When
+            # a concurrent transaction inserted the row first, its orders
+            # are not visible here and the delta is added to its row.
+            counters = self._compute_counters(periods, set(missing))
+            for key, delta in missing.items():
+                assignments, params = self._get_delta_assignments(periods, delta)
+                self._insert_counters(periods, counters, [key], ', '.join(assignments), params)
+        self.invalidate_model()
+
+    @api.model
+    def _get_delta_assignments(self, periods, delta, table='owner_dashboard_pos_counter'):
+        """SET clauses adding ``delta`` to the counters of the current
+        periods, the ones of a period which is over restarting from zero"""
+        assignments, params = [], []
+        for period_field, tickets_field, revenue_field in COUNTER_PERIODS:
+            for field in (tickets_field, revenue_field):
+                assignments.append(
+                    f'{field} = CASE WHEN {table}.{period_field} = %s THEN {table}.{field} ELSE 0 END + %s')
+                params += [periods[period_field], delta[field]]
+            assignments.append(f'{period_field} = %s')
+            params.append(periods[period_field])
+        return assignments, params
+
+    @api.model
+    def _insert_counters(self, periods, counters, keys, conflict_sql=None, conflict_params=()):
+        """Insert the counters of the given (company id, config id) pairs,
+        in a single statement per row so that rows created concurrently do
+        not fail on the unique constraint: the existing row is overwritten,
+        or updated with ``conflict_sql`` when given"""
+        fields = ['company_id', 'config_id'] + [
+            field for period in COUNTER_PERIODS for field in period]
+        conflict_sql = conflict_sql or ', '.join(
+            f'{field} = EXCLUDED.{field}' for field in fields[2:])
+        cr = self.env.cr
+        for company_id, config_id in keys:
+            values = dict(counters[(company_id, config_id)], **periods)
+            cr.execute(f"""
+                INSERT INTO owner_dashboard_pos_counter
+                       (create_uid, create_date, write_uid, write_date, {', '.join(fields)})
+                VALUES (%s, NOW() AT TIME ZONE 'UTC', %s, NOW() AT TIME ZONE 'UTC',
+                        {', '.join(['%s'] * len(fields))})
+           ON CONFLICT (company_id, config_id) DO UPDATE SET {conflict_sql}
+            """, [self.env.uid, self.env.uid, company_id, config_id]
+                + [values[field] for field in fields[2:]] + list(conflict_params))
+        self.invalidate_model()
+
+    @api.model
+    def _cron_roll_over_counters(self):
+        """Reset the counters of the periods which are over"""
+        periods = self._get_periods()
+        cr = self.env.cr
+        for period_field, tickets_field, revenue_field in COUNTER_PERIODS:
+            cr.execute(f"""
+                UPDATE owner_dashboard_pos_counter
+                   SET {period_field} = %s, {tickets_field} = 0, {revenue_field} = 0
+                 WHERE {period_field} < %s
+            """, (periods[period_field], periods[period_field]))
+        self.invalidate_model()
+        return True
+
+    @api.model
+    def _cron_reconcile_counters(self):
+        """Check the counters against the POS orders, and correct them"""
+        if 'pos.order' not in self.env:
+            return True
+        self._cron_roll_over_counters()
+        periods = self._get_periods()
+        expected = self._compute_counters(periods)
+        actual = {(counter.company_id.id, counter.config_id): counter for counter in self.search([])}
+        wrong = set()
+        # Every configuration gets its row, possibly zero
+        for key in set(expected) | set(actual) | self._get_config_keys():
+            values = expected[key]
+            counter = actual.get(key)
+            if counter is None or any(
+                not float_is_zero(counter[field] - value, precision_digits=2)
+                for field, value in values.items()
+            ):
+                wrong.add(key)
+        if wrong:
+            _logger.warning("Correcting the owner dashboard POS counters of (company, config) %s",
+                            sorted(wrong))
+            self._insert_counters(periods, expected, wrong)
+        return True
+
+    @api.model
+    def _get_config_keys(self, company_ids=None):
+        """(company id, config id) pairs of the POS configurations"""
+        if 'pos.config' not in self.env:
+            return set()
+        domain = [('company_id', 'in', company_ids)] if company_ids else []
+        configs = self.env['pos.config'].with_context(active_test=False).sudo().search(domain)
+        return {(config.company_id.id, config.id) for config in configs}
+
+    @api.model
+    def _get_summary(self, company_ids=None):
+        """Tickets, revenue and average ticket of the current day, week and
+        month, summed over the counters of the given companies (all when
+        None) in a single aggregate row"""
+        periods = self._get_periods()
+        selects, params = [], []
+        for period_field, tickets_field, revenue_field in COUNTER_PERIODS:
+            for field in (tickets_field, revenue_field):
+                # Counters of a period which is over are not rolled over yet
+                selects.append(f'COALESCE(SUM({field}) FILTER (WHERE {period_field} = %s), 0)')
+                params.append(periods[period_field])
+        domain_sql, domain_params = '', []
+        if company_ids:
+            domain_sql = 'WHERE company_id IN %s'
+            domain_params = [tuple(company_ids)]
+        self.flush_model()
+        cr = self.env.cr
+        cr.execute(f"""
+            SELECT {', '.join(selects)} FROM owner_dashboard_pos_counter {domain_sql}
+        """, params + domain_params)
+        totals = list(cr.fetchone())
+        # Configurations created since the counters were seeded and without
+        # paid order yet have no row: count them from the orders
+        cr.execute(f"""
+            SELECT company_id, config_id FROM owner_dashboard_pos_counter {domain_sql}
+        """, domain_params)
+        missing = self._get_config_keys(company_ids) - set(cr.fetchall())
+        if missing:
+            fields = [field for period in COUNTER_PERIODS for field in period[1:]]
+            for values in self._compute_counters(periods, missing).values():
+                for index, field in enumerate(fields):
+                    totals[index] += values[field]
+        summary = {}
+        for index, period in enumerate(('today', 'this_week', 'this_month')):
+            tickets, revenue = totals[2 * index], float(totals[2 * index + 1])
+            summary[period] = {
+                'transactions': tickets,
+                'revenue': revenue,
+                'avg_ticket': revenue / tickets if tickets else 0,
+            }
+        return summary
@@ -19,26 +19,45 @@
 #    If not, see <http://www.gnu.org/licenses/>.
 #
 #############################################################################
-import uuid
-from odoo import fields, models
+from odoo import api, fields, models
 
 
 class ResUsers(models.Model):
     """This class is used to inherit users and add api key generation"""
     _inherit = 'res.users'
 
-    api_key = fields.Char(string="API Key", readonly=True,
-                          help="Api key for connecting with the "
-                               "Database.The key will be "
-                               "generated when authenticating "
-                               "rest api.")
+    api_key_ids = fields.One2many('rest.api.key', 'user_id',
+                                  string="API Keys",
+                                  groups='base.group_system',
+                                  help="Keys of the clients of the REST "
+                                       "api connecting as this user.")
+    live_token_ids = fields.One2many('owner.dashboard.live.token', 'user_id',
+                                     string="Dashboard Live Tokens",
+                                     groups='base.group_system',
+                                     help="Read-only tokens of the live "
+                                          "dashboard events issued with the "
+                                          "api keys of this user.")
+    has_api_key = fields.Boolean(string="API Key",
+                                 compute='_compute_has_api_key',
+                                 help="Whether an api key has been "
+                                      "generated for this user.")
 
-    def generate_api(self, username):
-        """This function is used to generate api-key for each user"""
-        users = self.env['res.users'].sudo().search([('login', '=', username)])
-        if not users.api_key:
-            users.api_key = str(uuid.uuid4())
-            key = users.api_key
-        else:
-            key = users.api_key
+    @api.depends('api_key_ids')
+    def _compute_has_api_key(self):
+        for user in self:
+            user.has_api_key = bool(user.sudo().api_key_ids)
+
+    def generate_api(self, username, rotate=False, client=None):
+        """This function is used to generate the api-key of a client of a
+        user. Only the digest of the key is stored, so the key is returned
+        once: None is returned when the client already has a key, unless
+        ``rotate`` is set, which issues a new key and revokes the previous
+        one."""
+        key = None
+        for user in self.env['res.users'].sudo().search([('login', '=', username)]):
+            key = self.env['rest.api.key']._issue(user, client, rotate)
         return key
+
+    def action_revoke_api_key(self):
+        """Revoke all the api keys of the users"""
+        self.sudo().api_key_ids.unlink()
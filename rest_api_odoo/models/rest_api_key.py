@@ -0,0 +1,116 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import uuid
+
+from odoo import api, fields, models
+from odoo.tools import sql
+
+from ..tools.api_key_cache import api_key_cache, hash_api_key
+
+# Client name of the keys issued without one, and of the migrated keys
+DEFAULT_API_CLIENT = 'default'
+
+
+class RestApiKey(models.Model):
+    """API key of a client of the REST api. A key authenticates as its user
+    alone, so each client gets its own key, revoked without affecting the
+    other clients of the user. Only the digest of the key is stored: the
+    key is shown once, when it is issued."""
+    _name = 'rest.api.key'
+    _description = 'REST API Key'
+    _order = 'user_id, name'
+
+    name = fields.Char(string="Client", required=True,
+                       help="Application or device using the key.")
+    user_id = fields.Many2one('res.users', string="User", required=True,
+                              index=True, ondelete='cascade')
+    key_hash = fields.Char(string="Key Digest", required=True, readonly=True,
+                           index=True, copy=False,
+                           help="SHA-256 digest of the key.")
+
+    _sql_constraints = [
+        ('user_client_uniq', 'unique(user_id, name)',
+         "A user has only one api key per client."),
+        ('key_hash_uniq', 'unique(key_hash)',
+         "An api key digest must be unique."),
+    ]
+
+    def init(self):
+        """Move the single api key digest per user of previous versions to a
+        key of the default client"""
+        cr = self.env.cr
+        if sql.column_exists(cr, 'res_users', 'api_key'):
+            cr.execute("UPDATE res_users SET api_key = NULL WHERE api_key = ''")
+            cr.execute(f"""
+                INSERT INTO {self._table} (name, user_id, key_hash, create_date, write_date)
+                SELECT %s, id, encode(sha256(convert_to(api_key, 'UTF8')), 'hex'),
+                       NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC'
+                  FROM res_users WHERE api_key IS NOT NULL
+                    ON CONFLICT DO NOTHING
+            """, [DEFAULT_API_CLIENT])
+            cr.execute("ALTER TABLE res_users DROP COLUMN api_key")
+        if sql.column_exists(cr, 'res_users', 'api_key_hash'):
+            cr.execute(f"""
+                INSERT INTO {self._table} (name, user_id, key_hash, create_date, write_date)
+                SELECT %s, id, api_key_hash, NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC'
+                  FROM res_users WHERE api_key_hash IS NOT NULL
+                    ON CONFLICT DO NOTHING
+            """, [DEFAULT_API_CLIENT])
+            cr.execute("ALTER TABLE res_users DROP COLUMN api_key_hash")
+        if sql.column_exists(cr, 'res_users', 'api_key_salt'):
+            cr.execute("ALTER TABLE res_users DROP COLUMN api_key_salt")
+
+    @api.model
+    def _issue(self, user, client=None, rotate=False):
+        """Issue a new random key for a client of ``user``
+
+        :return: the key, or None when the client already has one and
+            ``rotate`` is not set: the key cannot be shown again
+        """
+        client = client or DEFAULT_API_CLIENT
+        existing = self.sudo().search([('user_id', '=', user.id), ('name', '=', client)])
+        if existing and not rotate:
+            return None
+        existing.unlink()
+        key = str(uuid.uuid4())
+        self.sudo().create({'name': client, 'user_id': user.id, 'key_hash': hash_api_key(key)})
+        return key
+
+    @api.model
+    def _get_user_id(self, key_hash):
+        """Id of the active user owning the key of a digest, None if none"""
+        api_key = self.sudo().search([('key_hash', '=', key_hash), ('user_id.active', '=', True)], limit=1)
+        return api_key.user_id.id or None
+
+    def unlink(self):
+        """Forget the revoked keys once the transaction is committed"""
+        key_hashes = self.sudo().mapped('key_hash')
+        res = super().unlink()
+        if key_hashes:
+            dbname = self.env.cr.dbname
+            self.env.cr.postcommit.add(
+                lambda: api_key_cache.invalidate(dbname, key_hashes))
+        return res
+
+    def action_revoke(self):
+        """Revoke the keys: the clients using them can no longer connect"""
+        self.unlink()
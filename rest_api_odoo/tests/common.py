@@ -0,0 +1,269 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import logging
+
+from odoo import Command, fields
+
+_logger = logging.getLogger(__name__)
+
+# Share of the requested number of rows given to each kind of document,
+# their lines, quants and orderpoints making up for the rest
+VOLUME_RATIOS = {
+    'invoices': 0.10,
+    'pos_orders': 0.20,
+    'sale_orders': 0.05,
+    'purchase_orders': 0.02,
+    'products': 0.01,
+}
+
+# Generated documents are spread over this many days up to today
+DATE_SPREAD_DAYS = 730
+
+
+class DashboardDataGenerator:
+    """Seeded generator of owner dashboard data at a configurable volume.
+
+    A template of each document (invoice, vendor bill, POS order, sale
+    order, purchase order, stocked product with its quant and orderpoint)
+    is created through the ORM, then copied in bulk in SQL with its lines.
+    The copies get their dates spread over the last two years and their
+    amounts scaled by a factor derived from the seed and the copy number,
+    so that a given seed always produces the same data. Documents of
+    modules which are not installed are skipped.
+    """
+
+    def __init__(self, env, seed=0):
+        self.env = env
+        self.seed = seed
+
+    def generate(self, rows):
+        """Generate about ``rows`` rows over all tables
+
+        :return: dict with the number of rows inserted per table
+        """
+        counts = {}
+        volumes = {kind: max(int(rows * ratio), 1) for kind, ratio in VOLUME_RATIOS.items()}
+        self.env.flush_all()
+        if 'stock.quant' in self.env:
+            self._generate_products(volumes['products'], counts)
+        self._generate_invoices(volumes['invoices'], counts)
+        if 'pos.order' in self.env:
+            self._generate_orders('pos.order', 'lines', volumes['pos_orders'], counts)
+        if 'sale.order' in self.env:
+            self._generate_orders('sale.order', 'order_line', volumes['sale_orders'], counts)
+        if 'purchase.order' in self.env:
+            self._generate_orders('purchase.order', 'order_line', volumes['purchase_orders'], counts)
+        self.env.invalidate_all()
+        _logger.info("Generated owner dashboard data: %s", counts)
+        return counts
+
+    # ==================== TEMPLATES ====================
+
+    def _get_partner(self):
+        return self.env['res.partner'].create({'name': 'Benchmark Customer', 'customer_rank': 1})
+
+    def _get_product(self):
+        return self.env['product.product'].create({
+            'name': 'Benchmark Product',
+            'list_price': 100.0,
+            'standard_price': 60.0,
+        })
+
+    def _create_template(self, model_name):
+        """Create the template document copied for ``model_name``"""
+        partner = self._get_partner()
+        product = self._get_product()
+        if model_name == 'pos.order':
+            config = self.env['pos.config'].create({'name': 'Benchmark POS'})
+            session = self.env['pos.session'].create({'config_id': config.id, 'user_id': self.env.uid})
+            order = self.env['pos.order'].create({
+                'session_id': session.id,
+                'partner_id': partner.id,
+                'lines': [Command.create({
+                    'product_id': product.id,
+                    'full_product_name': product.name,
+                    'qty': 2,
+                    'price_unit': 50.0,
+                    'price_subtotal': 100.0,
+                    'price_subtotal_incl': 100.0,
+                })],
+                'amount_total': 100.0,
+                'amount_tax': 0.0,
+                'amount_paid': 100.0,
+                'amount_return': 0.0,
+            })
+            order.write({'state': 'paid'})
+            return order
+        if model_name == 'sale.order':
+            order = self.env['sale.order'].create({
+                'partner_id': partner.id,
+                'order_line': [Command.create({
+                    'product_id': product.id,
+                    'product_uom_qty': 3,
+                    'price_unit': 100.0,
+                })],
+            })
+            order.action_confirm()
+            return order
+        order = self.env['purchase.order'].create({
+            'partner_id': partner.id,
+            'order_line': [Command.create({
+                'product_id': product.id,
+                'product_qty': 5,
+                'price_unit': 40.0,
+            })],
+        })
+        order.button_confirm()
+        return order
+
+    # ==================== GENERATION ====================
+
+    def _generate_invoices(self, count, counts):
+        """Copy a posted customer invoice and a posted vendor bill"""
+        partner = self._get_partner()
+        product = self._get_product()
+        for move_type, invoice_count in (('out_invoice', count - count // 3), ('in_invoice', count // 3)):
+            if not invoice_count:
+                continue
+            invoice = self.env['account.move'].create({
+                'move_type': move_type,
+                'partner_id': partner.id,
+                'invoice_date': fields.Date.context_today(self.env.user),
+                'invoice_line_ids': [Command.create({
+                    'product_id': product.id,
+                    'quantity': 2,
+                    'price_unit': 150.0,
+                    'tax_ids': [Command.clear()],
+                })],
+            })
+            invoice.action_post()
+            self.env.flush_all()
+            move_ids = self._clone_rows('account_move', 't.id = %s', [invoice.id], [0] * invoice_count,
+                                        scaled=('amount_',), dated=('date', 'invoice_date', 'invoice_date_due'),
+                                        unique=('name',), counts=counts)
+            self._clone_rows('account_move_line', 't.move_id = %s', [invoice.id], move_ids,
+                             overrides={'move_id': 'p.parent_id'},
+                             scaled=('debit', 'credit', 'balance', 'amount_', 'price_', 'tax_base_amount'),
+                             dated=('date', 'date_maturity', 'invoice_date'),
+                             unique=('move_name',), counts=counts)
+
+    def _generate_orders(self, model_name, line_field, count, counts):
+        """Copy a confirmed (or paid) order of ``model_name`` with its lines"""
+        try:
+            with self.env.cr.savepoint():
+                order = self._create_template(model_name)
+                self.env.flush_all()
+        except Exception as e:
+            _logger.warning("Cannot create a %s template, skipping: %s", model_name, e)
+            return
+        Model = self.env[model_name]
+        Line = self.env[Model._fields[line_field].comodel_name]
+        inverse_name = Model._fields[line_field].inverse_name
+        order_ids = self._clone_rows(Model._table, 't.id = %s', [order.id], [0] * count,
+                                     scaled=('amount_',), dated=('date_order', 'date_planned', 'date_approve'),
+                                     unique=('name', 'pos_reference'), counts=counts)
+        self._clone_rows(Line._table, 't."%s" = %%s' % inverse_name, [order.id], order_ids,
+                         overrides={inverse_name: 'p.parent_id'}, scaled=('price_',), counts=counts)
+
+    def _generate_products(self, count, counts):
+        """Copy a storable product with its cost, an internal quant and a
+        reorder point, the quantities scattering around the minimum"""
+        warehouse = self.env['stock.warehouse'].search([('company_id', '=', self.env.company.id)], limit=1)
+        product = self.env['product.product'].create({
+            'name': 'Benchmark Stocked Product',
+            'type': 'product',
+            'standard_price': 25.0,
+        })
+        self.env['stock.quant']._update_available_quantity(product, warehouse.lot_stock_id, 5)
+        self.env['stock.warehouse.orderpoint'].create({
+            'product_id': product.id,
+            'location_id': warehouse.lot_stock_id.id,
+            'product_min_qty': 20,
+            'product_max_qty': 50,
+        })
+        self.env.flush_all()
+        template_ids = self._clone_rows('product_template', 't.id = %s', [product.product_tmpl_id.id], [0] * count,
+                                        counts=counts)
+        product_ids = self._clone_rows('product_product', 't.product_tmpl_id = %s', [product.product_tmpl_id.id],
+                                       template_ids, overrides={'product_tmpl_id': 'p.parent_id'}, counts=counts)
+        self._clone_rows('ir_property', 't.res_id = %s', ['product.product,%s' % product.id], product_ids,
+                         overrides={'res_id': "'product.product,' || p.parent_id"}, scaled=('value_float',),
+                         counts=counts)
+        for table in ('stock_quant', 'stock_warehouse_orderpoint'):
+            self._clone_rows(table, 't.product_id = %s', [product.id], product_ids,
+                             overrides={'product_id': 'p.parent_id'}, scaled=('quantity',), counts=counts)
+
+    def _clone_rows(self, table, where, params, parent_ids, overrides=None,
+                    scaled=(), dated=(), unique=(), counts=None):
+        """Insert one copy of the rows of ``table`` matching ``where`` per
+        item of ``parent_ids``, in a single statement.
+
+        :param parent_ids: ids available as ``p.parent_id`` to the
+            ``overrides`` expressions of the copies, which are numbered
+            ``p.n`` from 1
+        :param scaled: prefixes of the numeric columns multiplied by the
+            scale factor of the copy
+        :param dated: date columns moved back by the date offset of the copy
+        :param unique: text columns suffixed by the copy number
+        :return: ids of the inserted rows, in the order of ``parent_ids``
+        """
+        if not parent_ids:
+            return []
+        overrides = overrides or {}
+        cr = self.env.cr
+        cr.execute("""
+            SELECT column_name, data_type
+              FROM information_schema.columns
+             WHERE table_name = %s AND column_name != 'id'
+        """, [table])
+        # Deterministic pseudo random offset and factor of each copy
+        offset = '((p.n * 7919 + %d) %%%% %d)' % (self.seed, DATE_SPREAD_DAYS)
+        factor = '(1 + ((p.n * 104729 + %d) %%%% 1000) / 100.0)' % self.seed
+        columns, expressions = [], []
+        for column, data_type in cr.fetchall():
+            expression = 't."%s"' % column
+            if column in overrides:
+                expression = overrides[column]
+            elif column in dated and data_type == 'date':
+                expression = '%s - %s::int' % (expression, offset)
+            elif column in dated and data_type.startswith('timestamp'):
+                expression = "%s - %s * interval '1 day'" % (expression, offset)
+            elif data_type in ('numeric', 'double precision') and any(column.startswith(prefix) for prefix in scaled):
+                expression = '%s * %s' % (expression, factor)
+            elif column in unique and data_type in ('character varying', 'text'):
+                expression = "%s || '/' || p.n" % expression
+            columns.append('"%s"' % column)
+            expressions.append(expression)
+        cr.execute("""
+            INSERT INTO "{table}" ({columns})
+            SELECT {expressions}
+              FROM "{table}" t
+             CROSS JOIN unnest(%s::int[]) WITH ORDINALITY AS p(parent_id, n)
+             WHERE {where}
+          ORDER BY p.n, t.id
+         RETURNING id
+        """.format(table=table, columns=', '.join(columns), expressions=', '.join(expressions), where=where),
+            [list(parent_ids)] + list(params))
+        ids = sorted(row[0] for row in cr.fetchall())
+        if counts is not None:
+            counts[table] = counts.get(table, 0) + len(ids)
+        return ids
@@ -0,0 +1,171 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from odoo import http
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.tests import tagged
+
+from ..controllers.rest_api_odoo import RestApi
+from ..tools.dashboard_cache import DASHBOARD_SECTIONS
+from ..tools.metrics import measure_queries
+from ..tools.parallel_sections import SectionRequest
+from .common import DashboardDataGenerator
+
+_logger = logging.getLogger(__name__)
+
+# Dashboard helpers measured on their own, with their arguments
+BENCHMARK_HELPERS = [
+    ('_get_kpi_data', {}),
+    ('_get_finance_data', {}),
+    ('_get_logistics_data', {}),
+    ('_get_recent_transactions', {}),
+    ('_get_sales_trend', {}),
+    ('_get_sales_detail', {}),
+    ('_get_finance_detail', {}),
+    ('_get_logistics_detail', {}),
+    ('_get_pos_summary', {}),
+    ('_get_balance_sheet', {}),
+    ('_get_account_type_balances', {}),
+    ('_get_inventory_valuation', {}),
+    ('_get_low_stock', {'limit': 50}),
+]
+
+# Historic window of the summary measured against the default year to
+# date, as (days before today of its end, length in days)
+HISTORIC_RANGE = (365, 90)
+
+
+@tagged('-standard', '-at_install', 'post_install', 'rest_api_odoo_benchmark')
+class TestDashboardBenchmark(AccountTestInvoicingCommon):
+    """Latency, SQL queries and peak memory of the owner dashboard helpers
+    and of the full summary on generated data of increasing volume.
+
+    Not part of the standard tests, run it with e.g.::
+
+        REST_API_BENCHMARK_SCALES=10000,100000,1000000 odoo-bin -d bench \\
+            -i rest_api_odoo --test-tags rest_api_odoo_benchmark --stop-after-init
+
+    Environment variables:
+
+    * ``REST_API_BENCHMARK_SCALES``: comma separated row volumes (10000)
+    * ``REST_API_BENCHMARK_REPEAT``: timed runs per helper, the median is
+      kept (3)
+    * ``REST_API_BENCHMARK_SEED``: seed of the data generator (0)
+    * ``REST_API_BENCHMARK_OUTPUT``: JSON result file (a timestamped file
+      in the temporary directory)
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.scales = [int(scale) for scale in os.environ.get('REST_API_BENCHMARK_SCALES', '10000').split(',')]
+        cls.repeat = int(os.environ.get('REST_API_BENCHMARK_REPEAT', 3))
+        cls.seed = int(os.environ.get('REST_API_BENCHMARK_SEED', 0))
+        cls.output = os.environ.get('REST_API_BENCHMARK_OUTPUT') or os.path.join(
+            tempfile.gettempdir(), 'rest_api_odoo_benchmark_%s.json' % time.strftime('%Y%m%d_%H%M%S'))
+
+    def _run(self, function):
+        """Call a dashboard helper on a fresh request bound to the test
+        environment, so that no aggregate is reused between runs"""
+        http._request_stack.push(SectionRequest(None, self.env))
+        try:
+            return function()
+        finally:
+            http._request_stack.pop()
+            self.env.invalidate_all()
+
+    def _measure(self, function):
+        """Median latency, SQL queries and rows, and peak Python memory of
+        a helper"""
+        runs = []
+        for _index in range(self.repeat):
+            with measure_queries() as stats:
+                self._run(function)
+            runs.append(stats)
+        tracemalloc.start()
+        try:
+            self._run(function)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return {
+            'latency_ms': round(statistics.median(run.duration for run in runs) * 1000, 2),
+            'sql_queries': runs[-1].queries,
+            'sql_rows': runs[-1].rows,
+            'sql_time_ms': round(runs[-1].sql_time * 1000, 2),
+            'peak_memory_kb': round(peak_memory / 1024, 1),
+        }
+
+    def _benchmark_scale(self, scale):
+        """Generate the data of one scale and measure every helper"""
+        generate_start = time.perf_counter()
+        counts = DashboardDataGenerator(self.env, seed=self.seed).generate(scale)
+        generate_time = time.perf_counter() - generate_start
+        self.env['owner.dashboard.daily.fact']._rebuild_facts()
+
+        controller = RestApi()
+        helpers = {
+            name: self._measure(lambda name=name, kwargs=kwargs: getattr(controller, name)(**kwargs))
+            for name, kwargs in BENCHMARK_HELPERS
+        }
+        summary = self._measure(lambda: controller._build_dashboard_sections(DASHBOARD_SECTIONS, 0))
+        date_to = date.today() - timedelta(days=HISTORIC_RANGE[0])
+        historic_summary = self._measure(lambda: controller._build_dashboard_sections(
+            DASHBOARD_SECTIONS, 0, {'dashboard_range': controller._get_dashboard_range(
+                date_to - timedelta(days=HISTORIC_RANGE[1]), date_to)}))
+        return {
+            'scale': scale,
+            'rows': counts,
+            'generation_s': round(generate_time, 2),
+            'helpers': helpers,
+            'summary': summary,
+            'historic_summary': historic_summary,
+        }
+
+    def test_dashboard_benchmark(self):
+        results = {
+            'seed': self.seed,
+            'repeat': self.repeat,
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'scales': [],
+        }
+        for scale in self.scales:
+            # Each scale starts from the same data, not on top of the previous one
+            with self.env.cr.savepoint(flush=False) as savepoint:
+                result = self._benchmark_scale(scale)
+                savepoint.close(rollback=True)
+            self.env.invalidate_all()
+            results['scales'].append(result)
+            _logger.info("Owner dashboard benchmark at %s rows: summary %s", scale, result['summary'])
+            self.assertTrue(all(result['helpers'].values()))
+
+        with open(self.output, 'w') as output_file:
+            json.dump(results, output_file, indent=2)
+        _logger.info("Owner dashboard benchmark results written to %s", self.output)
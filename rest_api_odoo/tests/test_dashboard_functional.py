@@ -0,0 +1,284 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import json
+from collections import defaultdict
+from datetime import timedelta
+
+from odoo import Command, fields
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.tests import HttpCase, tagged
+
+from ..models.owner_dashboard_daily_fact import FACT_MEASURES
+from ..models.owner_dashboard_pos_counter import COUNTER_PERIODS
+from ..tools.api_key_cache import hash_api_key
+
+
+@tagged('post_install', '-at_install')
+class TestDashboardFunctional(AccountTestInvoicingCommon, HttpCase):
+    """The precomputed figures match the transactions they summarise, and
+    the REST api pages, bulk operations and validators behave as documented"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.company = cls.company_data['company']
+        cls.api_user = cls.env['res.users'].create({
+            'name': 'REST api user',
+            'login': 'rest_api_user',
+            'company_id': cls.company.id,
+            'company_ids': [Command.set(cls.company.ids)],
+            'groups_id': [Command.set([cls.env.ref('base.group_user').id,
+                                       cls.env.ref('base.group_partner_manager').id])],
+        })
+        cls.api_key = cls.env['res.users'].generate_api('rest_api_user')
+        cls.env['connection.api'].create({
+            'model_id': cls.env['ir.model']._get_id('res.partner'),
+            'is_get': True,
+            'is_post': True,
+            'is_put': True,
+            'is_delete': True,
+        })
+
+    def _send_request(self, method, params, body=None, headers=None):
+        query = '&'.join('%s=%s' % item for item in dict(params, model='res.partner').items())
+        return self.opener.request(
+            method, '%s/send_request?%s' % (self.base_url(), query),
+            data=json.dumps(body) if body is not None else None,
+            headers=dict(headers or {}, **{'api-key': self.api_key}),
+            timeout=30)
+
+    # ==================== DAILY FACTS ====================
+
+    def _get_live_totals(self, date_from, date_to):
+        """Daily figures aggregated on the fly from the transactions"""
+        totals = defaultdict(lambda: dict.fromkeys(FACT_MEASURES, 0))
+        for (_company_id, day), values in self.env['owner.dashboard.daily.fact']._compute_facts(
+                date_from, date_to).items():
+            for measure in FACT_MEASURES:
+                totals[day][measure] += values[measure]
+        return self._round_totals(totals)
+
+    def _round_totals(self, totals):
+        return {
+            day: {measure: round(value, 2) for measure, value in values.items()}
+            for day, values in totals.items() if any(values.values())
+        }
+
+    def test_daily_facts_match_live_query(self):
+        Fact = self.env['owner.dashboard.daily.fact']
+        today = Fact._get_local_today()
+        date_from = today - timedelta(days=60)
+        for days, amount in ((45, 100.0), (10, 250.0), (10, 30.0), (0, 75.0)):
+            self.init_invoice('out_invoice', invoice_date=today - timedelta(days=days),
+                              amounts=[amount], post=True)
+        self.init_invoice('in_invoice', invoice_date=today - timedelta(days=10), amounts=[40.0], post=True)
+        Fact._rebuild_facts()
+        self.assertTrue(Fact.search_count([]))
+        self.assertEqual(self._round_totals(Fact._get_daily_totals(date_from, today)),
+                         self._get_live_totals(date_from, today))
+
+        # The incremental refresh takes the new and cancelled documents in
+        self.init_invoice('out_invoice', invoice_date=today - timedelta(days=20), amounts=[60.0], post=True)
+        cancelled = self.env['account.move'].search([
+            ('move_type', '=', 'out_invoice'), ('invoice_date', '=', today - timedelta(days=45)),
+        ])
+        cancelled.button_draft()
+        Fact._cron_update_facts()
+        self.assertEqual(self._round_totals(Fact._get_daily_totals(date_from, today)),
+                         self._get_live_totals(date_from, today))
+
+        # The day an invoice is moved away from is refreshed as well
+        moved = self.env['account.move'].search([
+            ('move_type', '=', 'out_invoice'), ('invoice_date', '=', today - timedelta(days=20)),
+        ])
+        moved.button_draft()
+        moved.write({'invoice_date': today - timedelta(days=5), 'date': today - timedelta(days=5)})
+        moved.action_post()
+        self.env.cr.precommit.run()
+        Fact._cron_update_facts()
+        self.assertEqual(self._round_totals(Fact._get_daily_totals(date_from, today)),
+                         self._get_live_totals(date_from, today))
+
+    # ==================== REST API ====================
+
+    def test_keyset_pagination_has_no_gaps(self):
+        Partner = self.env['res.partner']
+        # Ties and empty values on the sort field
+        Partner.create([{'name': 'Keyset %s' % index, 'ref': 'K%s' % (index % 3) if index % 4 else False}
+                        for index in range(20)])
+        expected = Partner.with_user(self.api_user).search([]).ids
+        for order in ('ref asc', 'ref desc', 'id desc'):
+            seen, cursor = [], None
+            while True:
+                params = {'fields': 'id,ref', 'order': order, 'limit': 7}
+                if cursor:
+                    params['after'] = cursor
+                response = self._send_request('GET', params)
+                self.assertEqual(response.status_code, 200)
+                page = response.json()
+                seen += [record['id'] for record in page['records']]
+                cursor = page['next_cursor']
+                if not cursor:
+                    break
+            self.assertEqual(len(seen), len(set(seen)), "Duplicated records with order %s" % order)
+            self.assertEqual(sorted(seen), sorted(expected), "Skipped records with order %s" % order)
+
+    def test_bulk_operations(self):
+        Partner = self.env['res.partner']
+        response = self._send_request('POST', {}, [{'name': 'Bulk %s' % index} for index in range(3)])
+        self.assertEqual(response.status_code, 200)
+        ids = response.json()['ids']
+        self.assertEqual(Partner.browse(ids).mapped('name'), ['Bulk 0', 'Bulk 1', 'Bulk 2'])
+
+        response = self._send_request('PUT', {}, {'ids': ids, 'values': {'ref': 'BULK'}})
+        self.assertEqual(response.status_code, 200)
+        Partner.invalidate_model()
+        self.assertEqual(Partner.browse(ids).mapped('ref'), ['BULK'] * 3)
+
+        response = self._send_request('DELETE', {}, {'ids': ids})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Partner.browse(ids).exists())
+
+        # A failing item rolls the whole batch back and is reported
+        count = Partner.search_count([])
+        response = self._send_request('POST', {}, {'values': [{'name': 'Valid'}, {'no_such_field': 1}]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['index'] for error in response.json()['errors']], [1])
+        self.assertEqual(Partner.search_count([]), count)
+
+        response = self._send_request('DELETE', {}, {'ids': [max(ids) + 1000]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._send_request('PUT', {}, [1, 2]).status_code, 400)
+
+    def test_api_key_shown_once_until_rotated(self):
+        Users = self.env['res.users']
+        self.assertIsNone(Users.generate_api('rest_api_user'))
+        rotated = Users.generate_api('rest_api_user', rotate=True)
+        self.assertNotEqual(rotated, self.api_key)
+        self.assertEqual(self.api_user.sudo().api_key_ids.key_hash, hash_api_key(rotated))
+
+        # Each client has its own key, revoked alone
+        other = Users.generate_api('rest_api_user', client='reporting')
+        self.assertEqual(len(self.api_user.sudo().api_key_ids), 2)
+        self.api_user.sudo().api_key_ids.filtered(lambda key: key.name == 'reporting').action_revoke()
+        self.assertEqual(self.api_user.sudo().api_key_ids.key_hash, hash_api_key(rotated))
+        self.assertNotEqual(other, rotated)
+
+    def test_metrics_require_api_key(self):
+        response = self.url_open('/api/owner_dashboard/metrics')
+        self.assertEqual(response.status_code, 403)
+        response = self.url_open('/api/owner_dashboard/metrics', headers={'api-key': self.api_key})
+        self.assertEqual(response.status_code, 200)
+        self.env['ir.config_parameter'].sudo().set_param('rest_api_odoo.metrics_public', 'True')
+        self.assertEqual(self.url_open('/api/owner_dashboard/metrics').status_code, 200)
+
+    def test_etag_revalidation(self):
+        partner = self.env['res.partner'].create({'name': 'Validated'})
+        # Older data than the write below, which happens in the same transaction
+        self.env.flush_all()
+        self.env.cr.execute("UPDATE res_partner SET write_date = write_date - interval '1 hour'")
+        self.env['res.partner'].invalidate_model(['write_date'])
+        params = {'fields': 'id,name', 'Id': partner.id}
+
+        response = self._send_request('GET', params)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+        response = self._send_request('GET', params, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        partner.name = 'Changed'
+        self.env.flush_all()
+        response = self._send_request('GET', params, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.json()['records'][0]['name'], 'Changed')
+
+    # ==================== POS COUNTERS ====================
+
+    def _create_pos_session(self, name):
+        journal = self.env['account.journal'].create({'name': name, 'type': 'cash', 'code': name[:5]})
+        payment_method = self.env['pos.payment.method'].create({'name': name, 'journal_id': journal.id})
+        config = self.env['pos.config'].create({
+            'name': name,
+            'payment_method_ids': [Command.set(payment_method.ids)],
+        })
+        config.open_ui()
+        return config.current_session_id
+
+    def _create_pos_order(self, session, amount, date_order=None):
+        order = self.env['pos.order'].create({
+            'session_id': session.id,
+            'date_order': date_order or fields.Datetime.now(),
+            'amount_tax': 0.0,
+            'amount_total': amount,
+            'amount_paid': amount,
+            'amount_return': 0.0,
+        })
+        order.write({'state': 'paid'})
+        return order
+
+    def _get_recomputed_summary(self):
+        """POS summary computed from the orders, bypassing the counters"""
+        Counter = self.env['owner.dashboard.pos.counter']
+        totals = defaultdict(float)
+        for values in Counter._compute_counters(Counter._get_periods()).values():
+            for field, value in values.items():
+                totals[field] += value
+        return {
+            period: {'transactions': totals[tickets_field], 'revenue': round(totals[revenue_field], 2)}
+            for period, (_period_field, tickets_field, revenue_field) in zip(
+                ('today', 'this_week', 'this_month'), COUNTER_PERIODS)
+        }
+
+    def _get_counter_summary(self):
+        return {
+            period: {'transactions': values['transactions'], 'revenue': round(values['revenue'], 2)}
+            for period, values in self.env['owner.dashboard.pos.counter']._get_summary().items()
+        }
+
+    def test_pos_counters_match_recompute(self):
+        if 'pos.order' not in self.env:
+            self.skipTest("Point of Sale is not installed")
+        Counter = self.env['owner.dashboard.pos.counter']
+        shop, bar = self._create_pos_session('Shop'), self._create_pos_session('Bar')
+        yesterday = fields.Datetime.now() - timedelta(days=1)
+        self._create_pos_order(shop, 20.0)
+        self._create_pos_order(shop, 35.5)
+        self._create_pos_order(bar, 12.25, yesterday)
+        refunded = self._create_pos_order(bar, 8.0)
+        refunded.write({'state': 'cancel'})
+        self.assertEqual(self._get_counter_summary()['today']['transactions'], 2)
+        self.assertEqual(self._get_counter_summary(), self._get_recomputed_summary())
+
+        # Configurations without counter row are counted from the orders
+        self.env.cr.execute("DELETE FROM owner_dashboard_pos_counter WHERE config_id = %s",
+                            [bar.config_id.id])
+        Counter.invalidate_model()
+        self.assertEqual(self._get_counter_summary(), self._get_recomputed_summary())
+
+        # The reconciliation corrects drifted counters
+        self.env.cr.execute("UPDATE owner_dashboard_pos_counter SET day_tickets = day_tickets + 5")
+        Counter.invalidate_model()
+        self.assertNotEqual(self._get_counter_summary(), self._get_recomputed_summary())
+        Counter._cron_reconcile_counters()
+        self.assertEqual(self._get_counter_summary(), self._get_recomputed_summary())
+        self.assertEqual(Counter.search_count([('config_id', '=', bar.config_id.id)]), 1)
@@ -0,0 +1,144 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import json
+
+from freezegun import freeze_time
+
+from odoo import Command
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.addons.bus.models.bus import channel_with_db, json_dump
+from odoo.tests import HttpCase, tagged
+
+from ..tools.live_events import LIVE_EVENT_TYPE, get_live_channel, get_pos_summary_delta
+
+
+@tagged('post_install', '-at_install')
+class TestLiveEvents(AccountTestInvoicingCommon, HttpCase):
+    """The live events of the documents of a company are published on the
+    bus channel the live endpoint returns for its live tokens"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.company = cls.company_data['company']
+        cls.owner = cls.env['res.users'].create({
+            'name': 'Dashboard Owner',
+            'login': 'dashboard_owner',
+            'company_id': cls.company.id,
+            'company_ids': [Command.set(cls.company.ids)],
+        })
+        cls.api_key = cls.env['res.users'].generate_api('dashboard_owner')
+        cls.live_token = cls.env['owner.dashboard.live.token']._issue(cls.owner, cls.company, 'dashboard')
+
+    def _get_live(self, live_token=None):
+        response = self.url_open('/api/owner_dashboard/live', headers={
+            'Authorization': 'Bearer %s' % (live_token or self.live_token),
+        })
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def _get_live_channel(self, live_token=None):
+        return self._get_live(live_token)['channel']
+
+    def _get_events(self, channel):
+        notifications = self.env['bus.bus'].search([
+            ('channel', '=', json_dump(channel_with_db(self.env.cr.dbname, channel))),
+        ])
+        messages = [json.loads(notification.message) for notification in notifications]
+        return [message['payload'] for message in messages if message['type'] == LIVE_EVENT_TYPE]
+
+    def test_live_channel_of_live_token_company(self):
+        self.assertEqual(self._get_live_channel(), get_live_channel(self.env, self.company.id))
+
+    def test_live_subscription_starts_after_last_notification(self):
+        last = self._get_live()['last']
+        invoice = self.init_invoice('out_invoice', amounts=[100.0], post=True)
+        notifications = self.env['bus.bus'].search([('id', '>', last)])
+        payloads = [json.loads(notification.message)['payload'] for notification in notifications]
+        self.assertIn(invoice.id, [payload.get('transaction', {}).get('id') for payload in payloads])
+
+    def test_live_channel_requires_live_token(self):
+        response = self.url_open('/api/owner_dashboard/live')
+        self.assertEqual(response.status_code, 403)
+        response = self.url_open('/api/owner_dashboard/live', headers={'api-key': self.api_key})
+        self.assertEqual(response.status_code, 403)
+        response = self.url_open('/api/owner_dashboard/live', headers={'Authorization': 'Bearer %s' % self.api_key})
+        self.assertEqual(response.status_code, 403)
+
+    def test_live_token_issued_for_allowed_company(self):
+        response = self.url_open('/api/owner_dashboard/live_token', data={'client': 'kiosk'})
+        self.assertEqual(response.status_code, 403)
+        response = self.url_open(
+            '/api/owner_dashboard/live_token',
+            data={'company_id': self.company_data_2['company'].id},
+            headers={'api-key': self.api_key})
+        self.assertEqual(response.status_code, 403)
+        response = self.url_open('/api/owner_dashboard/live_token', data={'client': 'kiosk'}, headers={'api-key': self.api_key})
+        self.assertEqual(response.status_code, 200)
+        live_token = response.json()['data']['token']
+        self.assertEqual(self._get_live_channel(live_token), get_live_channel(self.env, self.company.id))
+
+    def test_live_token_refused_by_rest_api(self):
+        for headers in ({'api-key': self.live_token}, {'Authorization': 'Bearer %s' % self.live_token}):
+            response = self.url_open('/send_request?model=res.partner', headers=headers)
+            self.assertIn('API Key', response.text)
+
+    def test_posted_invoice_event(self):
+        channel = self._get_live_channel()
+        invoice = self.init_invoice('out_invoice', amounts=[100.0], post=True)
+        events = self._get_events(channel)
+        self.assertEqual([event['transaction']['id'] for event in events], invoice.ids)
+
+    def test_paid_pos_order_event(self):
+        if 'pos.order' not in self.env:
+            self.skipTest("Point of Sale is not installed")
+        channel = self._get_live_channel()
+        journal = self.env['account.journal'].create({'name': 'Dashboard Cash', 'type': 'cash', 'code': 'DBC'})
+        payment_method = self.env['pos.payment.method'].create({'name': 'Cash', 'journal_id': journal.id})
+        config = self.env['pos.config'].create({
+            'name': 'Dashboard Shop',
+            'payment_method_ids': [Command.set(payment_method.ids)],
+        })
+        config.open_ui()
+        order = self.env['pos.order'].create({
+            'session_id': config.current_session_id.id,
+            'amount_tax': 0.0,
+            'amount_total': 25.0,
+            'amount_paid': 25.0,
+            'amount_return': 0.0,
+        })
+        self.assertFalse(self._get_events(channel))
+
+        order.write({'state': 'paid'})
+        events = self._get_events(channel)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['transaction']['id'], order.id)
+        self.assertEqual(events[0]['pos_summary']['today'], {'transactions': 1, 'revenue': 25.0})
+
+    @freeze_time('2026-03-31 20:00:00')
+    def test_pos_summary_delta_in_dashboard_timezone(self):
+        if 'pos.order' not in self.env:
+            self.skipTest("Point of Sale is not installed")
+        # 1 April 03:00 in Jakarta, the order being of 31 March 23:00 there
+        self.env['ir.config_parameter'].sudo().set_param('rest_api_odoo.dashboard_tz', 'Asia/Jakarta')
+        order = self.env['pos.order'].new({'date_order': '2026-03-31 16:00:00', 'amount_total': 25.0})
+        self.assertEqual(get_pos_summary_delta(order), {'this_week': {'transactions': 1, 'revenue': 25.0}})
@@ -0,0 +1,128 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import gzip
+import json
+import logging
+import random
+import timeit
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from odoo.tests import BaseCase, tagged
+
+from ..tools import response_encoding
+from ..tools.response_encoding import CONTENT_ENCODINGS, compress, compress_stream, dumps
+
+_logger = logging.getLogger(__name__)
+
+
+def make_dashboard_payload(transactions=500):
+    """Payload shaped like an owner dashboard summary and a page of records"""
+    rng = random.Random(0)
+    today = date.today()
+    return {
+        'status': 'success',
+        'data': {
+            'kpi': {key: Decimal(rng.randint(0, 10 ** 8)) / 100 for key in (
+                'revenue', 'expenses', 'receivable', 'payable', 'cash')},
+            'sales_trend': [{
+                'name': 'M%s' % month,
+                'start': today,
+                'revenue': Decimal(rng.randint(0, 10 ** 8)) / 100,
+            } for month in range(60)],
+            'recent_transactions': [{
+                'id': record_id,
+                'name': 'INV/2024/%05d' % record_id,
+                'partner': 'Customer %s' % rng.randint(1, 500),
+                'amount': Decimal(rng.randint(0, 10 ** 7)) / 100,
+                'date': today,
+                'write_date': datetime.now(),
+            } for record_id in range(transactions)],
+        },
+    }
+
+
+@tagged('post_install', '-at_install')
+class TestResponseEncoding(BaseCase):
+    """The API payloads are encoded as compact JSON, the non native values
+    converted, whichever encoder is used"""
+
+    def test_dumps_converts_values(self):
+        value = {
+            'amount': Decimal('12.50'),
+            'day': date(2024, 2, 29),
+            'at': datetime(2024, 2, 29, 13, 5, 7, 250),
+            'tags': frozenset(['a']),
+            'raw': b'abc',
+            7: None,
+        }
+        expected = ('{"amount":12.5,"day":"2024-02-29","at":"2024-02-29T13:05:07.000250",'
+                    '"tags":["a"],"raw":"abc","7":null}')
+        self.assertEqual(dumps(value), expected)
+        self.assertEqual(response_encoding._encoder.encode(value), expected)
+
+    def test_dumps_matches_json_encoder(self):
+        # Amounts with cents: both encoders write these floats the same way
+        payload = make_dashboard_payload(50)
+        self.assertEqual(dumps(payload), response_encoding._encoder.encode(payload))
+
+    def test_dumps_non_finite_numbers_as_null(self):
+        value = {'ratio': float('nan'), 'amounts': [float('inf'), Decimal('NaN'), 1.5]}
+        self.assertEqual(json.loads(dumps(value)), {'ratio': None, 'amounts': [None, None, 1.5]})
+        with patch.object(response_encoding, 'orjson', None):
+            self.assertEqual(dumps(value), '{"ratio":null,"amounts":[null,null,1.5]}')
+
+    def test_compress_round_trip(self):
+        body = dumps(make_dashboard_payload(50)).encode()
+        self.assertEqual(gzip.decompress(compress(body, 'gzip')), body)
+        self.assertEqual(zlib.decompress(compress(body, 'deflate')), body)
+        chunks = [body[:100], body[100:].decode()]
+        self.assertEqual(gzip.decompress(b''.join(compress_stream(chunks, 'gzip'))), body)
+
+
+@tagged('-standard', '-at_install', 'post_install', 'rest_api_odoo_benchmark')
+class TestResponseEncodingBenchmark(BaseCase):
+    """Time of the previous ``json.dumps(default=str)`` serialisation, of
+    the json encoder and of :func:`dumps`, and bytes sent with each content
+    coding, on a dashboard shaped payload. Not part of the standard tests,
+    run it with ``--test-tags rest_api_odoo_benchmark``."""
+
+    rounds = 200
+
+    def _time(self, function):
+        return timeit.timeit(function, number=self.rounds) / self.rounds * 1000
+
+    def test_response_encoding_benchmark(self):
+        payload = make_dashboard_payload()
+        body = dumps(payload).encode()
+        _logger.info(
+            "Serialisation: json.dumps(default=str) %.3f ms, json encoder %.3f ms, dumps (%s) %.3f ms",
+            self._time(lambda: json.dumps(payload, default=str)),
+            self._time(lambda: response_encoding._encoder.encode(payload)),
+            'orjson' if response_encoding.orjson else 'json',
+            self._time(lambda: dumps(payload)))
+        _logger.info("identity: %d bytes (previously %d)", len(body), len(json.dumps(payload, default=str)))
+        for encoding in CONTENT_ENCODINGS:
+            _logger.info("%s: %d bytes in %.3f ms", encoding, len(compress(body, encoding)),
+                         self._time(lambda: compress(body, encoding)))
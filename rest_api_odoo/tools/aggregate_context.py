@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import copy
+import threading
+from collections import defaultdict
+
+
+def make_aggregate_key(model_name, domain, measure):
+    """Key of an aggregate: the queried model, its domain and the measure"""
+    return model_name, repr(domain), measure
+
+
+class AggregateContext:
+    """Request-scoped memo of the primitive aggregates shared by the owner
+    dashboard sections, so that each distinct query runs once per request.
+
+    The context can be shared by the section workers of a parallel
+    request: a value being computed by one worker is awaited by the others
+    instead of being computed again. Each caller gets its own copy of the
+    value, which it may change without affecting the other sections.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self._key_locks = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """Return a copy of the value memoised under ``key``, computing it
+        with ``compute()`` on first use"""
+        with self._lock:
+            if key in self._values:
+                return copy.deepcopy(self._values[key])
+            key_lock = self._key_locks[key]
+        with key_lock:
+            if key not in self._values:
+                self._values[key] = compute()
+            return copy.deepcopy(self._values[key])
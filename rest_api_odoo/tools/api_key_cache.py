@@ -0,0 +1,75 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+def hash_api_key(api_key):
+    """Digest under which an API key is stored and looked up"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+class ApiKeyCache:
+    """Bounded in-process LRU of verified API keys.
+
+    Maps (database, key digest) to the id of the key owner for a limited
+    time, so that authenticated requests do not hit ``res.users``.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, dbname, key_hash):
+        """Return the cached user id, or None when missing or expired"""
+        cache_key = (dbname, key_hash)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, user_id = entry
+            if expires_at < time.monotonic():
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return user_id
+
+    def set(self, dbname, key_hash, user_id, ttl):
+        """Remember that ``key_hash`` belongs to ``user_id`` for ``ttl`` seconds"""
+        cache_key = (dbname, key_hash)
+        with self._lock:
+            self._entries[cache_key] = (time.monotonic() + ttl, user_id)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, dbname, key_hashes):
+        """Forget the given key digests"""
+        with self._lock:
+            for key_hash in key_hashes:
+                self._entries.pop((dbname, key_hash), None)
+
+
+api_key_cache = ApiKeyCache()
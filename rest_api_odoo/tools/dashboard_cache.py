@@ -0,0 +1,138 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import threading
+import time
+from collections import OrderedDict
+
+# Dashboard sections and the models whose writes change their numbers.
+# Only the listed fields trigger an invalidation on write; creation and
+# deletion of a record always do.
+DASHBOARD_SECTIONS = (
+    'kpi',
+    'finance',
+    'logistics',
+    'recent_transactions',
+    'sales_trend',
+    'sales_detail',
+    'finance_detail',
+    'logistics_detail',
+    'pos_summary',
+)
+
+WATCHED_MODELS = {
+    'account.move': {
+        'fields': {'state'},
+        'sections': {'kpi', 'finance', 'recent_transactions', 'finance_detail'},
+    },
+    'pos.order': {
+        'fields': {'state'},
+        'sections': {'kpi', 'recent_transactions', 'sales_trend',
+                     'sales_detail', 'pos_summary'},
+    },
+    'sale.order': {
+        'fields': {'state'},
+        'sections': {'kpi', 'sales_trend', 'sales_detail'},
+    },
+    'stock.quant': {
+        'fields': {'quantity', 'location_id', 'product_id'},
+        'sections': {'logistics', 'logistics_detail'},
+    },
+    'stock.picking': {
+        'fields': {'state'},
+        'sections': {'logistics_detail'},
+    },
+    'stock.warehouse.orderpoint': {
+        'fields': {'product_id', 'location_id', 'product_min_qty', 'active'},
+        'sections': {'logistics', 'logistics_detail'},
+    },
+    'purchase.order': {
+        'fields': {'state'},
+        'sections': {'logistics', 'logistics_detail'},
+    },
+    # Refreshed by replacing the rows of the days, never written
+    'owner.dashboard.daily.fact': {
+        'fields': set(),
+        'sections': {'kpi', 'finance', 'sales_trend', 'sales_detail',
+                     'finance_detail', 'pos_summary'},
+    },
+}
+
+
+def get_section_models(sections):
+    """Models whose changes affect any of the given dashboard sections"""
+    models = {
+        model_name for model_name, watched in WATCHED_MODELS.items()
+        if watched['sections'].intersection(sections)
+    }
+    if 'account.move' in models:
+        models.add('account.move.line')
+    return models
+
+
+class DashboardCache:
+    """In-process TTL cache for owner dashboard payloads.
+
+    Entries are keyed by database and cache key, and remember
+    which dashboard sections they were built from so that a write on one
+    model only drops the entries depending on it.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, dbname, key):
+        """Return the cached value, or None when missing or expired"""
+        cache_key = (dbname, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, sections, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return value
+
+    def set(self, dbname, key, value, ttl, sections):
+        """Store ``value`` for ``ttl`` seconds, tagged with ``sections``"""
+        cache_key = (dbname, key)
+        with self._lock:
+            self._entries[cache_key] = (time.monotonic() + ttl, frozenset(sections), value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, dbname, sections=None):
+        """Drop the entries of ``dbname`` built from any of ``sections``
+        (all of them when ``sections`` is None)"""
+        with self._lock:
+            for cache_key in list(self._entries):
+                if cache_key[0] != dbname:
+                    continue
+                if sections is None or self._entries[cache_key][1] & set(sections):
+                    del self._entries[cache_key]
+
+
+dashboard_cache = DashboardCache()
@@ -0,0 +1,87 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+from datetime import datetime, time, timedelta
+
+import pytz
+
+
+class DashboardRange:
+    """Dates, companies and timezone an owner dashboard is computed for.
+
+    The range covers the local days [date_from, date_to] in ``tz``, and
+    ``today`` is the current local day. ``company_ids`` restricts the
+    figures to some companies, None meaning all of them. The range renders
+    as a canonical key, used in the cache keys and validators of the
+    dashboard.
+    """
+
+    def __init__(self, date_from, date_to, today, tz, company_ids=None):
+        self.date_from = date_from
+        self.date_to = date_to
+        self.today = today
+        self.tz = tz
+        self.company_ids = tuple(sorted(set(company_ids))) if company_ids else None
+
+    @property
+    def key(self):
+        return 'from=%s&to=%s&tz=%s&company_ids=%s' % (
+            self.date_from, self.date_to, self.tz,
+            ','.join(map(str, self.company_ids)) if self.company_ids else '')
+
+    def __repr__(self):
+        return self.key
+
+    __str__ = __repr__
+
+    def __eq__(self, other):
+        return isinstance(other, DashboardRange) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def is_current(self):
+        """Whether the range ends today"""
+        return self.date_to == self.today
+
+    @property
+    def week_start(self):
+        """First day of the ISO week of the end of the range"""
+        return self.date_to - timedelta(days=self.date_to.weekday())
+
+    @property
+    def month_start(self):
+        """First day of the month of the end of the range"""
+        return self.date_to.replace(day=1)
+
+    def get_utc_bounds(self, date_from=None, date_to=None):
+        """Naive UTC datetimes bounding the local days [date_from, date_to],
+        the days of the range by default"""
+        local_tz = pytz.timezone(self.tz)
+        start = local_tz.localize(datetime.combine(date_from or self.date_from, time.min))
+        stop = local_tz.localize(datetime.combine((date_to or self.date_to) + timedelta(days=1), time.min))
+        return (start.astimezone(pytz.utc).replace(tzinfo=None),
+                stop.astimezone(pytz.utc).replace(tzinfo=None))
+
+    def get_company_domain(self, field_name='company_id'):
+        """Domain restricting a model to the companies of the range"""
+        return [(field_name, 'in', list(self.company_ids))] if self.company_ids else []
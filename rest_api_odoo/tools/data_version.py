@@ -0,0 +1,80 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import hashlib
+import time
+
+# Sequence bumped after each transaction deleting records, since deletions
+# leave no trace in the write dates
+UNLINK_COUNTER_TABLE = 'owner_dashboard_unlink_counter'
+
+VALIDATOR_MAX_AGE = 300
+
+
+def get_model_versions(env, model_names):
+    """Latest write date, highest id and deletion count of the table of
+    each of ``model_names``, in a single query
+
+    :return: dict mapping each model name to its (write date, id, deletion
+        count) marker
+    """
+    queries, params = [], []
+    for model_name in sorted(set(model_names)):
+        if model_name not in env:
+            continue
+        model = env[model_name]
+        if model._abstract or not model._auto:
+            continue
+        write_date = 'MAX(write_date)' if model._log_access else 'NULL::timestamp'
+        queries.append(f"""
+            SELECT %s, {write_date}, MAX(id),
+                   (SELECT counter FROM {UNLINK_COUNTER_TABLE} WHERE model = %s)
+              FROM "{model._table}"
+        """)
+        params += [model_name, model_name]
+    if not queries:
+        return {}
+    env.cr.execute(' UNION ALL '.join(queries), params)
+    return {name: (write_date, max_id, unlinked) for name, write_date, max_id, unlinked in env.cr.fetchall()}
+
+
+def get_data_version(env, model_names):
+    """Cheap version marker of the tables of ``model_names``: their latest
+    write date, highest id and deletion count
+
+    :return: tuple (version, last_modified) where ``version`` is a hashable
+        value changing with the data and ``last_modified`` the latest write
+        date, or None
+    """
+    versions = get_model_versions(env, model_names)
+    write_dates = [write_date for write_date, max_id, unlinked in versions.values() if write_date]
+    return tuple(sorted(versions.items())), max(write_dates) if write_dates else None
+
+
+def make_version(*parts):
+    """Build a version marker changing only with its parts"""
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def make_etag(*parts):
+    """Build an entity tag from the version marker and request parts,
+    renewed every ``VALIDATOR_MAX_AGE`` seconds"""
+    return make_version(*parts, int(time.time() // VALIDATOR_MAX_AGE))
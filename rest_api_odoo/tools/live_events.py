@@ -0,0 +1,106 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import hashlib
+import uuid
+
+# Invoice types listed in the recent transactions
+INVOICE_MOVE_TYPES = ('out_invoice', 'in_invoice', 'out_refund', 'in_refund')
+# States of the POS orders counted as sales
+POS_PAID_STATES = ('paid', 'done', 'invoiced')
+
+# Documents publishing a live event when entering one of the states
+LIVE_EVENT_STATES = {
+    'account.move': ('posted',),
+    'pos.order': POS_PAID_STATES,
+}
+
+# Periods of the POS summary, with the counter field of their first day
+SUMMARY_PERIODS = [
+    ('today', 'day'),
+    ('this_week', 'week_start'),
+    ('this_month', 'month_start'),
+]
+
+# Notification type of the owner dashboard live events on the bus
+LIVE_EVENT_TYPE = 'owner_dashboard/event'
+
+
+def format_invoice_transaction(invoice):
+    """Row of the recent transactions of a posted invoice"""
+    trx_type = ""
+    amount = invoice.amount_total_signed
+
+    if invoice.move_type == 'out_invoice':
+        trx_type = f"Penjualan - {invoice.partner_id.name or 'Customer'}"
+    elif invoice.move_type == 'in_invoice':
+        trx_type = f"Pembelian - {invoice.partner_id.name or 'Vendor'}"
+        amount = -abs(amount)
+    elif invoice.move_type == 'out_refund':
+        trx_type = "Retur Penjualan"
+        amount = -abs(amount)
+    elif invoice.move_type == 'in_refund':
+        trx_type = "Retur Pembelian"
+
+    return {
+        'id': invoice.id,
+        'type': trx_type[:50],
+        'amount': amount,
+        'date': invoice.invoice_date.strftime('%Y-%m-%d') if invoice.invoice_date else '',
+        'status': 'Completed' if invoice.payment_state == 'paid' else 'Pending'
+    }
+
+
+def format_pos_transaction(order):
+    """Row of the recent transactions of a paid POS order"""
+    return {
+        'id': order.id,
+        'type': f"POS - {order.session_id.config_id.name or 'Point of Sale'}",
+        'amount': order.amount_total,
+        'date': order.date_order.strftime('%Y-%m-%d') if order.date_order else '',
+        'status': 'Completed'
+    }
+
+
+def get_pos_summary_delta(order):
+    """Change brought by a newly paid POS order to each period of the POS
+    summary (today, this week, this month) containing its date, the days
+    being the ones of the dashboard timezone as in the POS counters"""
+    Counter = order.env['owner.dashboard.pos.counter']
+    periods = Counter._get_periods()
+    order_date = Counter._get_local_date(order.date_order) if order.date_order else periods['day']
+    return {
+        period: {'transactions': 1, 'revenue': order.amount_total}
+        for period, period_field in SUMMARY_PERIODS
+        if periods[period_field] <= order_date <= periods['day']
+    }
+
+
+def get_live_channel(env, company_id):
+    """Bus channel of the live events of a company. The name derives from
+    a secret of the database so that it cannot be guessed."""
+    ICP = env['ir.config_parameter'].sudo()
+    secret = ICP.get_param('rest_api_odoo.live_channel_secret')
+    if not secret:
+        secret = uuid.uuid4().hex
+        ICP.set_param('rest_api_odoo.live_channel_secret', secret)
+    digest = hashlib.sha256(('%s:%s' % (secret, company_id)).encode()).hexdigest()
+    return 'owner_dashboard/%s' % digest[:32]
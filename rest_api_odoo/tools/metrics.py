@@ -0,0 +1,147 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Upper bounds of the histogram buckets of each measure
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+COUNT_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class QueryStats:
+    """Wall time, SQL queries, SQL time and rows of a measured block"""
+
+    def __init__(self):
+        self.duration = 0.0
+        self.queries = 0
+        self.sql_time = 0.0
+        self.rows = 0
+
+    def _record_query(self, cr, query, params, start, delay):
+        """Query hook called by the cursors of the measuring thread"""
+        self.queries += 1
+        self.sql_time += delay
+        self.rows += max(cr.rowcount, 0)
+
+
+@contextmanager
+def measure_queries():
+    """Measure the wall time of a block and the SQL queries it runs in the
+    current thread, through the query hooks of the Odoo cursors"""
+    stats = QueryStats()
+    thread = threading.current_thread()
+    query_hooks = getattr(thread, 'query_hooks', None)
+    if query_hooks is None:
+        query_hooks = thread.query_hooks = []
+    query_hooks.append(stats._record_query)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.duration = time.perf_counter() - start
+        query_hooks.remove(stats._record_query)
+
+
+def format_server_timing(name, stats=None, description=None):
+    """Format one metric of a ``Server-Timing`` header"""
+    metric = name
+    if stats is not None:
+        metric += ';dur=%.1f' % (stats.duration * 1000)
+        description = description or '%d queries, %.1fms SQL, %d rows' % (
+            stats.queries, stats.sql_time * 1000, stats.rows)
+    if description:
+        metric += ';desc="%s"' % description
+    return metric
+
+
+class Histogram:
+    """Cumulative histogram of a measure, per label values"""
+
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # label values -> [bucket counts..., sum, count]
+        self._series = defaultdict(lambda: [0] * len(buckets) + [0, 0])
+
+    def observe(self, label_values, value):
+        series = self._series[label_values]
+        for index, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self):
+        """Render the histogram in the Prometheus text format"""
+        lines = ['# HELP %s %s' % (self.name, self.help_text), '# TYPE %s histogram' % self.name]
+        for label_values, series in sorted(self._series.items()):
+            labels = ','.join(
+                '%s="%s"' % (label, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                for label, value in zip(self.label_names, label_values))
+            for upper_bound, count in zip(self.buckets, series):
+                lines.append('%s_bucket{%s,le="%s"} %d' % (self.name, labels, upper_bound, count))
+            lines.append('%s_bucket{%s,le="+Inf"} %d' % (self.name, labels, series[-1]))
+            lines.append('%s_sum{%s} %s' % (self.name, labels, series[-2]))
+            lines.append('%s_count{%s} %d' % (self.name, labels, series[-1]))
+        return '\n'.join(lines)
+
+
+class ApiMetrics:
+    """In-process histograms of the timings of the dashboard sections and
+    of the generic API requests, since the start of the worker"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        for prefix, label_names in (
+            ('owner_dashboard_section', ('section',)),
+            ('rest_api_request', ('model', 'method')),
+        ):
+            self._histograms[prefix] = (
+                Histogram(prefix + '_duration_seconds', 'Wall time in seconds', label_names, DURATION_BUCKETS),
+                Histogram(prefix + '_sql_queries', 'SQL queries executed', label_names, COUNT_BUCKETS),
+                Histogram(prefix + '_sql_rows', 'Rows returned or affected by SQL queries', label_names, COUNT_BUCKETS),
+            )
+
+    def observe(self, prefix, label_values, stats):
+        """Record the stats of a dashboard section or of a generic request"""
+        duration, queries, rows = self._histograms[prefix]
+        with self._lock:
+            duration.observe(label_values, stats.duration)
+            queries.observe(label_values, stats.queries)
+            rows.observe(label_values, stats.rows)
+
+    def render(self):
+        """Render all histograms in the Prometheus text format"""
+        with self._lock:
+            return '\n'.join(
+                histogram.render()
+                for histograms in self._histograms.values()
+                for histogram in histograms
+            ) + '\n'
+
+
+api_metrics = ApiMetrics()
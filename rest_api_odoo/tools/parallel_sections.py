@@ -0,0 +1,135 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from odoo import api, http
+
+# Upper bound of the dashboard sections computed at the same time by the
+# process, each of them holding a database connection
+SECTION_POOL_SIZE = 4
+
+# Upper bound of the sections of a request queued or running in the pool,
+# so that a request does not delay the sections of the other requests
+SECTION_REQUEST_LIMIT = 2
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_section_executor():
+    """Thread pool shared by the parallel dashboard requests of the process"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=SECTION_POOL_SIZE, thread_name_prefix='owner_dashboard')
+        return _executor
+
+
+class SectionRequest:
+    """Stand-in for the HTTP request in a section worker thread: exposes the
+    environment of the worker cursor and delegates everything else to the
+    original request, so the section builders keep using ``request.env``"""
+
+    def __init__(self, parent, env, section_run=None):
+        self._parent = parent
+        self.env = env
+        self.section_run = section_run
+
+    def __getattr__(self, name):
+        return getattr(self._parent, name)
+
+
+def export_snapshot(cr):
+    """Export the snapshot of the transaction of ``cr`` so that other
+    transactions can read the very same data while it stays open"""
+    cr.execute("SELECT pg_export_snapshot()")
+    return cr.fetchone()[0]
+
+
+class SectionSkipped(Exception):
+    """Raised in a section worker started after its request gave up"""
+
+
+class SectionRun:
+    """Section workers of a request, reading the snapshot of the request
+    transaction. Once the request stops waiting for them (:meth:`close`),
+    the workers not started yet are skipped, as the snapshot disappears
+    with the request transaction, and the queries of the running ones are
+    cancelled, releasing their thread and cursor."""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self._closed = False
+        self._connections = set()
+        self._lock = threading.Lock()
+
+    def _start(self, cr):
+        """Import the snapshot in the transaction of ``cr``
+
+        :raise SectionSkipped: when the run is closed
+        """
+        with self._lock:
+            if self._closed:
+                raise SectionSkipped()
+            cr.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+            cr.execute("SET TRANSACTION SNAPSHOT %s", [self.snapshot])
+            self._connections.add(cr._cnx)
+
+    def _stop(self, cr):
+        with self._lock:
+            self._connections.discard(cr._cnx)
+
+    @property
+    def closed(self):
+        """Whether the request stopped waiting: the data the workers build
+        from then on may be cut short by the cancelled queries"""
+        return self._closed
+
+    def close(self):
+        """Skip the workers not started and cancel the running ones"""
+        with self._lock:
+            self._closed = True
+            for connection in self._connections:
+                connection.cancel()
+
+
+@contextmanager
+def snapshot_request(parent, section_run):
+    """Run a block in a read-only transaction importing the snapshot of
+    ``section_run``, with ``request.env`` bound to a copy of the
+    environment of ``parent`` on it
+
+    :raise SectionSkipped: when the run is closed before the block starts
+    """
+    env = parent.env
+    with env.registry.cursor() as cr:
+        section_run._start(cr)
+        http._request_stack.push(SectionRequest(
+            parent, api.Environment(cr, env.uid, env.context, su=env.su), section_run))
+        try:
+            yield
+        finally:
+            http._request_stack.pop()
+            section_run._stop(cr)
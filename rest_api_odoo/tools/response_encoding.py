@@ -0,0 +1,122 @@
+# -*- coding:utf-8 -*-
+#############################################################################
+#
+#    Cybrosys Technologies Pvt. Ltd.
+#
+#    Copyright (C) 2024-TODAY Cybrosys Technologies(<https://www.cybrosys.com>)
+#    Author: Sruthi Pavithran (odoo@cybrosys.com)
+#
+#    You can modify it under the terms of the GNU LESSER
+#    GENERAL PUBLIC LICENSE (LGPL v3), Version 3.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU LESSER GENERAL PUBLIC LICENSE (LGPL v3) for more details.
+#
+#    You should have received a copy of the GNU LESSER GENERAL PUBLIC LICENSE
+#    (LGPL v3) along with this program.
+#    If not, see <http://www.gnu.org/licenses/>.
+#
+#############################################################################
+import gzip
+import json
+import math
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bodies smaller than this (bytes) are sent uncompressed: the saving does
+# not pay for the compression time and the gzip framing
+COMPRESSION_MIN_SIZE = 1024
+COMPRESSION_LEVEL = 6
+# Content codings offered to clients, by order of preference
+CONTENT_ENCODINGS = ('gzip', 'deflate')
+
+# JSON representation of the non native values found in API payloads
+JSON_CONVERTERS = {
+    Decimal: float,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    bytes: bytes.decode,
+    set: list,
+    frozenset: list,
+}
+
+
+def _convert_value(value):
+    """Convert a value json does not support natively, looked up by exact
+    type first so that the common types skip the ``isinstance`` scan"""
+    converter = JSON_CONVERTERS.get(type(value))
+    if converter is None:
+        for value_type, type_converter in JSON_CONVERTERS.items():
+            if isinstance(value, value_type):
+                return type_converter(value)
+        # Lazy translations and other string-like values
+        return str(value)
+    return converter(value)
+
+
+def _replace_non_finite(value):
+    """Copy of a payload with its NaN and infinite numbers replaced by
+    None, as orjson encodes them"""
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, Decimal) and not value.is_finite():
+        return None
+    return value
+
+
+_encoder = json.JSONEncoder(separators=(',', ':'), default=_convert_value, allow_nan=False)
+
+
+def dumps(value):
+    """Serialise an API payload to a compact JSON string, with orjson when
+    it is installed: it encodes the dates natively and the dashboard
+    payloads several times faster than the json module.
+
+    The output of the two encoders is equivalent JSON but not always the
+    same text: floats may be written differently (``1e-07`` by json,
+    ``1e-7`` by orjson). NaN and infinite numbers are encoded as ``null``
+    by both, never as the invalid JSON tokens of the json module."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_convert_value, option=orjson.OPT_NON_STR_KEYS).decode()
+    try:
+        return _encoder.encode(value)
+    except ValueError:
+        return _encoder.encode(_replace_non_finite(value))
+
+
+def negotiate_encoding(accept_encodings):
+    """Pick the content coding to use from the parsed ``Accept-Encoding``
+    header of a request, None for the identity coding"""
+    return accept_encodings.best_match(CONTENT_ENCODINGS)
+
+
+def compress(data, encoding):
+    """Compress a complete body with the given content coding"""
+    if encoding == 'gzip':
+        return gzip.compress(data, COMPRESSION_LEVEL, mtime=0)
+    return zlib.compress(data, COMPRESSION_LEVEL)
+
+
+def compress_stream(chunks, encoding):
+    """Compress a streamed body chunk by chunk with the given content coding"""
+    wbits = 16 + zlib.MAX_WBITS if encoding == 'gzip' else zlib.MAX_WBITS
+    compressor = zlib.compressobj(COMPRESSION_LEVEL, zlib.DEFLATED, wbits)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()